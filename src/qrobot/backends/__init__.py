@@ -1,6 +1,32 @@
-"""Quantum execution backends used by quantum-robot models."""
+"""Quantum execution backends used by quantum-robot models.
+
+:class:`QiskitBackend` is imported lazily, on first access, so that using
+the other backends never pays Qiskit's import time.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from .base import QuantumBackend
-from .qiskit import QiskitBackend
+from .default import get_default_backend, set_default_backend
+from .numpy import NumpyBackend
+from .product import ProductStateBackend
+
+if TYPE_CHECKING:
+    from .qiskit import QiskitBackend
+
+__all__ = [
+    "NumpyBackend",
+    "ProductStateBackend",
+    "QiskitBackend",
+    "QuantumBackend",
+    "get_default_backend",
+    "set_default_backend",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "QiskitBackend":
+        from .qiskit import QiskitBackend
 
-__all__ = ["QiskitBackend", "QuantumBackend"]
+        return QiskitBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,119 @@
 """Stable interface between quantum-robot models and quantum SDKs."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, NamedTuple
 
 import numpy as np
 
+from .bits import bits_to_bitmasks
+
+
+class Gate(NamedTuple):
+    """A gate of a backend-independent gate list.
+
+    Attributes
+    ----------
+    name : str
+        Gate name, e.g. ``"ry"``.
+    params : tuple[float, ...]
+        Gate parameters, e.g. the rotation angle.
+    qubits : tuple[int, ...]
+        Indices of the qubits the gate acts on.
+    """
+
+    name: str
+    params: tuple[float, ...]
+    qubits: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class CircuitTemplate:
+    """Shape of a reusable circuit of parameterized ``ry`` layers.
+
+    Parameters
+    ----------
+    qubits : int
+        Number of quantum bits.
+    layers : int
+        Number of layers, each rotating every qubit by its own angle.
+    """
+
+    qubits: int
+    layers: int
+
+
+class StateDistribution(ABC):
+    """Probability distribution of a circuit's computational-basis outcomes.
+
+    A distribution is computed once from a circuit and can then be sampled
+    any number of times without simulating the circuit again.
+
+    Attributes
+    ----------
+    qubits : int
+        Number of quantum bits.
+    """
+
+    qubits: int
+
+    @abstractmethod
+    def sample(self, shots: int, rng: np.random.Generator) -> np.ndarray:
+        """Return a boolean ``(shots, qubits)`` array of sampled outcomes,
+        whose entry ``[s, q]`` is the measured value of qubit ``q`` in shot
+        ``s``."""
+
+
+class DenseDistribution(StateDistribution):
+    """Distribution over all the ``2 ** qubits`` basis states.
+
+    Parameters
+    ----------
+    probabilities : numpy.ndarray
+        Probability of each basis state, indexed with qubit ``q`` as bit
+        ``q`` of the index (e.g. ``np.abs(statevector) ** 2``).
+    """
+
+    def __init__(self, probabilities: np.ndarray) -> None:
+        self.qubits = int(np.log2(len(probabilities)))
+        # Sampling by bisection of the cumulative distribution costs
+        # O(log(2 ** qubits)) per shot once this is computed.
+        self._cumulative = np.cumsum(probabilities)
+
+    def sample(self, shots: int, rng: np.random.Generator) -> np.ndarray:
+        draws = rng.random(shots) * self._cumulative[-1]
+        indices = np.searchsorted(self._cumulative, draws, side="right")
+        bits: np.ndarray = indices[:, np.newaxis] >> np.arange(self.qubits) & 1
+        return bits.astype(bool)
+
 
 class QuantumBackend(ABC):
-    """Create and simulate the circuits used by quantum-robot models."""
+    """Create and simulate the circuits used by quantum-robot models.
+
+    Parameters
+    ----------
+    seed : int | numpy.random.Generator | None
+        Seed (or generator) of the random generator used for sampling.
+        Defaults to ``None``, i.e. fresh entropy from the operating system.
+
+    Attributes
+    ----------
+    rng : numpy.random.Generator
+        Random generator used for sampling.
+    """
+
+    def __init__(self, seed: int | np.random.Generator | None = None) -> None:
+        self.rng = np.random.default_rng(seed)
+
+    def seed(self, seed: int | np.random.Generator | None) -> None:
+        """Replace the random generator used for sampling.
+
+        Parameters
+        ----------
+        seed : int | numpy.random.Generator | None
+            Seed (or generator) of the new random generator.
+        """
+        self.rng = np.random.default_rng(seed)
 
     @abstractmethod
     def create_circuit(self, qubits: int) -> Any:
@@ -20,3 +126,53 @@ class QuantumBackend(ABC):
     @abstractmethod
     def statevector(self, circuit: Any) -> np.ndarray:
         """Return the circuit's final statevector."""
+
+    def distribution(self, circuit: Any) -> StateDistribution:
+        """Return the distribution of ``circuit``'s measurement outcomes.
+
+        The default implementation simulates the circuit's statevector once.
+        """
+        return DenseDistribution(np.abs(self.statevector(circuit)) ** 2)
+
+    def sample_bitmasks(self, circuit: Any, shots: int) -> np.ndarray:
+        """Sample computational-basis outcomes as integer bitmasks, whose
+        bit ``q`` is the value of qubit ``q``, without mutating ``circuit``.
+
+        See :func:`qrobot.backends.bits.bits_to_bitmasks` for the dtype of
+        the returned array.
+        """
+        return bits_to_bitmasks(self.distribution(circuit).sample(shots, self.rng))
+
+    def create_template(self, qubits: int, layers: int) -> Any:
+        """Return a reusable circuit of ``layers`` parameterized ``ry`` layers.
+
+        Backends may override this to build and cache a simulation-ready
+        form of the template, shared by every template of the same shape.
+        """
+        return CircuitTemplate(qubits, layers)
+
+    def bind_template(self, template: Any, angles: np.ndarray) -> Any:
+        """Return a new circuit from ``template`` with its angles bound.
+
+        Parameters
+        ----------
+        template : object
+            A template returned by :meth:`create_template`.
+        angles : numpy.ndarray
+            ``(layers, qubits)`` rotation angles, where ``angles[l, q]``
+            rotates qubit ``q`` in layer ``l``.
+        """
+        circuit = self.create_circuit(template.qubits)
+        for layer in angles:
+            for qubit, angle in enumerate(layer):
+                circuit.ry(float(angle), qubit)
+        return circuit
+
+    def fuse_rotations(self, circuit: Any) -> Any:
+        """Return a circuit equivalent to ``circuit`` where consecutive
+        rotations around the same axis on a qubit are fused in one gate.
+
+        ``circuit`` is not mutated. Backends which cannot (or need not)
+        optimize their circuits return it unchanged, which is the default.
+        """
+        return circuit
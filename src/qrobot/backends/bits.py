@@ -0,0 +1,100 @@
+"""Conversions between representations of measured computational states.
+
+Sampled outcomes are boolean ``(..., n)`` arrays whose entry ``[..., q]`` is
+the measured value of qubit ``q``. They can be converted to bitstring labels,
+following Qiskit's convention where qubit ``0`` is the rightmost character,
+or to integer bitmasks, where qubit ``q`` is bit ``q``.
+"""
+
+import numpy as np
+
+MAX_PACKED_QUBITS = 64
+""" int: Maximum number of qubits of bitmasks stored as ``numpy.uint64``.
+"""
+
+
+def bits_to_labels(bits: np.ndarray) -> np.ndarray:
+    """Convert sampled outcomes to bitstrings using Qiskit's convention.
+
+    Parameters
+    ----------
+    bits : numpy.ndarray
+        Boolean array of shape ``(..., n)``, e.g. as returned by
+        :func:`sample_bits`.
+
+    Returns
+    -------
+    numpy.ndarray
+        String array of shape ``(...)``, where the rightmost character of each
+        label is qubit ``0``.
+    """
+    bits = np.asarray(bits)
+    qubits = bits.shape[-1]
+    chars = np.ascontiguousarray(bits[..., ::-1], dtype=np.uint8) + ord("0")
+    return chars.view(f"S{qubits}")[..., 0].astype(str)
+
+
+def bits_to_counts(bits: np.ndarray) -> dict[str, int]:
+    """Count sampled outcomes using Qiskit's bitstring convention.
+
+    Parameters
+    ----------
+    bits : numpy.ndarray
+        Boolean array of shape ``(shots, n)`` as returned by
+        :func:`sample_bits`.
+
+    Returns
+    -------
+    dict[str, int]
+        State occurrences counts in the form ``{"state": count}``, where the
+        rightmost character of ``"state"`` is qubit ``0``.
+    """
+    labels, counts = np.unique(bits_to_labels(bits), return_counts=True)
+    return {str(label): int(count) for label, count in zip(labels, counts)}
+
+
+def bits_to_bitmasks(bits: np.ndarray) -> np.ndarray:
+    """Convert sampled outcomes to integer bitmasks.
+
+    Parameters
+    ----------
+    bits : numpy.ndarray
+        Boolean array of shape ``(..., n)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(...)`` whose bit ``q`` is the value of qubit ``q``.
+        Its dtype is ``numpy.uint64``, or ``object`` (Python integers) for
+        more than :data:`MAX_PACKED_QUBITS` qubits.
+    """
+    bits = np.asarray(bits, dtype=bool)
+    qubits = bits.shape[-1]
+    if qubits > MAX_PACKED_QUBITS:
+        to_int = np.vectorize(lambda label: int(label, 2), otypes=[object])
+        large_bitmasks: np.ndarray = to_int(bits_to_labels(bits))
+        return large_bitmasks
+    weights = np.left_shift(np.uint64(1), np.arange(qubits, dtype=np.uint64))
+    bitmasks: np.ndarray = np.bitwise_or.reduce(
+        np.where(bits, weights, np.uint64(0)), axis=-1
+    )
+    return bitmasks
+
+
+def bitmask_to_label(state: int, n: int) -> str:
+    """Convert an integer bitmask to its bitstring label.
+
+    Parameters
+    ----------
+    state : int
+        Bitmask whose bit ``q`` is the value of qubit ``q``.
+    n : int
+        Number of qubits.
+
+    Returns
+    -------
+    str
+        The ``n``-character label, where the rightmost character is qubit
+        ``0``.
+    """
+    return format(int(state), f"0{n}b")
@@ -0,0 +1,75 @@
+"""Selection of the backend used by models created without one."""
+
+import os
+from collections.abc import Callable
+
+from .base import QuantumBackend
+from .numpy import NumpyBackend
+from .product import ProductStateBackend
+
+
+def _qiskit_backend() -> QuantumBackend:
+    # Importing Qiskit takes seconds and hundreds of MB, so it is only
+    # imported when a Qiskit backend is actually requested.
+    from .qiskit import QiskitBackend
+
+    return QiskitBackend()
+
+
+BACKENDS: dict[str, Callable[[], QuantumBackend]] = {
+    "numpy": NumpyBackend,
+    "product": ProductStateBackend,
+    "qiskit": _qiskit_backend,
+}
+""" dict: Backend factories selectable by name.
+"""
+
+BACKEND_ENV_VAR = "QROBOT_BACKEND"
+""" str: Environment variable naming the default backend.
+"""
+
+_default_backend: Callable[[], QuantumBackend] | None = None
+
+
+def set_default_backend(backend: str | Callable[[], QuantumBackend]) -> None:
+    """Select the backend used by models created without one.
+
+    The selection only applies to the current process. To select it in
+    worker processes too (e.g. on platforms using the ``spawn`` start
+    method), set the ``QROBOT_BACKEND`` environment variable instead.
+
+    Parameters
+    ----------
+    backend : str | Callable[[], QuantumBackend]
+        A name from :data:`BACKENDS` or a factory returning a new backend.
+
+    Raises
+    ------
+    ValueError
+        ``backend`` is not the name of a known backend.
+    """
+    global _default_backend
+    _default_backend = (
+        _backend_factory(backend) if isinstance(backend, str) else backend
+    )
+
+
+def get_default_backend() -> QuantumBackend:
+    """Return a new instance of the default backend.
+
+    The default is, by priority, the backend selected with
+    :func:`set_default_backend`, the one named by the ``QROBOT_BACKEND``
+    environment variable, or ``"qiskit"``.
+    """
+    if _default_backend is not None:
+        return _default_backend()
+    return _backend_factory(os.environ.get(BACKEND_ENV_VAR, "qiskit"))()
+
+
+def _backend_factory(name: str) -> Callable[[], QuantumBackend]:
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {name!r}, choose one of {sorted(BACKENDS)}"
+        ) from None
@@ -0,0 +1,141 @@
+"""Pure NumPy implementation of :class:`QuantumBackend`."""
+
+from typing import Any
+
+import numpy as np
+
+from .base import Gate, QuantumBackend
+from .passes import fuse_rotations
+from .product import product_statevector
+
+
+class NumpyCircuit:
+    """Lightweight circuit storing its gates as a list.
+
+    Only the single-qubit rotations ``rx``, ``ry`` and ``rz`` are supported,
+    which covers every gate applied by quantum-robot models.
+
+    Parameters
+    ----------
+    qubits : int
+        Number of quantum bits.
+
+    Attributes
+    ----------
+    qubits : int
+        Number of quantum bits.
+    bound_angles : numpy.ndarray | None
+        Summed ``ry`` angle of every qubit of a circuit bound from a
+        template, applied before the other gates, or ``None``.
+    """
+
+    def __init__(self, qubits: int) -> None:
+        self.qubits = qubits
+        self.bound_angles: np.ndarray | None = None
+        self._gates: list[Gate] = []
+
+    @property
+    def gates(self) -> list[Gate]:
+        """Gates in application order, including the bound rotations."""
+        if self.bound_angles is None:
+            return list(self._gates)
+        bound = [
+            Gate("ry", (angle,), (qubit,))
+            for qubit, angle in enumerate(self.bound_angles.tolist())
+        ]
+        return bound + self._gates
+
+    @gates.setter
+    def gates(self, gates: list[Gate]) -> None:
+        self.bound_angles = None
+        self._gates = list(gates)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{gate.name}({', '.join(f'{p:.6g}' for p in gate.params)}) "
+            + ", ".join(f"q_{qubit}" for qubit in gate.qubits)
+            for gate in self.gates
+        )
+
+    def rx(self, angle: float, qubit: int) -> None:
+        """Rotate ``qubit`` by ``angle`` around the X axis."""
+        self._gates.append(Gate("rx", (float(angle),), (self._qubit(qubit),)))
+
+    def ry(self, angle: float, qubit: int) -> None:
+        """Rotate ``qubit`` by ``angle`` around the Y axis."""
+        self._gates.append(Gate("ry", (float(angle),), (self._qubit(qubit),)))
+
+    def rz(self, angle: float, qubit: int) -> None:
+        """Rotate ``qubit`` by ``angle`` around the Z axis."""
+        self._gates.append(Gate("rz", (float(angle),), (self._qubit(qubit),)))
+
+    def _qubit(self, qubit: int) -> int:
+        if not 0 <= qubit < self.qubits:
+            raise IndexError(f"qubit {qubit} is out of range for {self.qubits}")
+        return qubit
+
+
+def _rx(angle: float) -> np.ndarray:
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[cos, -1j * sin], [-1j * sin, cos]])
+
+
+def _ry(angle: float) -> np.ndarray:
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[cos, -sin], [sin, cos]], dtype=complex)
+
+
+def _rz(angle: float) -> np.ndarray:
+    return np.diag([np.exp(-0.5j * angle), np.exp(0.5j * angle)])
+
+
+_MATRICES = {"rx": _rx, "ry": _ry, "rz": _rz}
+
+
+class NumpyBackend(QuantumBackend):
+    """Simulate circuits with a dense NumPy statevector.
+
+    Importing and instantiating this backend does not require Qiskit, which
+    keeps start-up time and memory usage low in short-lived worker processes.
+    Bitstrings follow Qiskit's convention: qubit ``0`` is the rightmost
+    character.
+    """
+
+    def create_circuit(self, qubits: int) -> NumpyCircuit:
+        return NumpyCircuit(qubits)
+
+    def bind_template(self, template: Any, angles: np.ndarray) -> NumpyCircuit:
+        # The layers' rotations commute, so only their sum per qubit is kept
+        # and simulated as a product state, without building any gate.
+        circuit = NumpyCircuit(template.qubits)
+        circuit.bound_angles = np.sum(angles, axis=0, dtype=float)
+        return circuit
+
+    def fuse_rotations(self, circuit: Any) -> NumpyCircuit:
+        fused = NumpyCircuit(circuit.qubits)
+        fused.gates = fuse_rotations(circuit.gates)
+        return fused
+
+    def sample_counts(self, circuit: Any, shots: int) -> dict[str, int]:
+        probabilities = np.abs(self.statevector(circuit)) ** 2
+        counts = self.rng.multinomial(shots, probabilities / probabilities.sum())
+        return {
+            format(int(index), f"0{circuit.qubits}b"): int(counts[index])
+            for index in np.flatnonzero(counts)
+        }
+
+    def statevector(self, circuit: Any) -> np.ndarray:
+        qubits = circuit.qubits
+        # Axis ``k`` of the reshaped state is qubit ``qubits - 1 - k``, so that
+        # flattening it back gives Qiskit's little-endian basis ordering.
+        if circuit.bound_angles is None:
+            state = np.zeros((2,) * qubits, dtype=complex)
+            state[(0,) * qubits] = 1
+        else:
+            state = product_statevector(circuit.bound_angles).reshape((2,) * qubits)
+        for gate in circuit._gates:
+            (qubit,) = gate.qubits
+            axis = qubits - 1 - qubit
+            matrix = _MATRICES[gate.name](*gate.params)
+            state = np.moveaxis(np.tensordot(matrix, state, axes=(1, axis)), 0, axis)
+        return state.reshape(-1)
@@ -0,0 +1,45 @@
+"""Backend-independent optimization passes over gate lists."""
+
+from collections.abc import Iterable
+
+from .base import Gate
+
+ROTATIONS = frozenset({"rx", "ry", "rz"})
+""" frozenset: Names of the single-qubit rotations fused by
+:func:`fuse_rotations`.
+"""
+
+
+def fuse_rotations(gates: Iterable[Gate]) -> list[Gate]:
+    """Fuse consecutive rotations around the same axis on the same qubit.
+
+    Rotations around the same axis sum up, so every run of same-axis
+    rotations on a qubit is replaced by a single rotation. Gates acting on
+    other qubits do not interrupt a run, since they commute with it; any
+    other gate on the qubit does.
+
+    Parameters
+    ----------
+    gates : Iterable[Gate]
+        Gates in application order.
+
+    Returns
+    -------
+    list[Gate]
+        The fused gates, in application order.
+    """
+    fused: list[Gate] = []
+    # Index in ``fused`` of the last gate applied to each qubit
+    last_gate: dict[int, int] = {}
+    for gate in gates:
+        if gate.name in ROTATIONS and len(gate.qubits) == 1:
+            (qubit,) = gate.qubits
+            index = last_gate.get(qubit)
+            if index is not None and fused[index].name == gate.name:
+                (angle,) = fused[index].params
+                fused[index] = gate._replace(params=(angle + gate.params[0],))
+                continue
+        for qubit in gate.qubits:
+            last_gate[qubit] = len(fused)
+        fused.append(gate)
+    return fused
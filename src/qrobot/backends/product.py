@@ -0,0 +1,156 @@
+"""Closed-form simulation of independent ``ry``-rotated qubits.
+
+Every model in quantum-robot only applies ``ry`` rotations to independent
+qubits, so its state is always a product state. Rotations on the same qubit
+commute and sum, which lets this backend track a single accumulated angle per
+qubit and sample each qubit on its own in ``O(n * shots)`` instead of building
+a ``2 ** n`` statevector.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from .base import QuantumBackend, StateDistribution
+from .bits import bits_to_counts
+
+
+class ProductStateCircuit:
+    """Accumulated ``ry`` rotation angle of each qubit.
+
+    Parameters
+    ----------
+    qubits : int
+        Number of quantum bits.
+
+    Attributes
+    ----------
+    qubits : int
+        Number of quantum bits.
+    angles : numpy.ndarray
+        Total rotation angle applied so far to each qubit.
+    """
+
+    def __init__(self, qubits: int) -> None:
+        self.qubits = qubits
+        self.angles = np.zeros(qubits)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"q_{qubit}: ry({angle:.6g})" for qubit, angle in enumerate(self.angles)
+        )
+
+    def ry(self, angle: float, qubit: int) -> None:
+        """Rotate ``qubit`` by ``angle`` around the Y axis."""
+        self.angles[qubit] += angle
+
+
+class ProductDistribution(StateDistribution):
+    """Distribution of independent qubits, sampled in ``O(qubits)`` per shot.
+
+    Parameters
+    ----------
+    probabilities : numpy.ndarray
+        Probability of measuring ``1`` on each qubit.
+    """
+
+    def __init__(self, probabilities: np.ndarray) -> None:
+        self.qubits = len(probabilities)
+        self.probabilities = np.asarray(probabilities, dtype=float)
+
+    def sample(self, shots: int, rng: np.random.Generator) -> np.ndarray:
+        return sample_bits(self.probabilities, shots, rng)
+
+
+class ProductStateBackend(QuantumBackend):
+    """Simulate product-state circuits in closed form.
+
+    Circuits created by this backend only support the ``ry`` gate, which is
+    the only gate applied by :class:`qrobot.models.AngularModel` and
+    :class:`qrobot.models.LinearModel`.
+    """
+
+    def __init__(self, seed: int | np.random.Generator | None = None) -> None:
+        super().__init__(seed)
+
+    def create_circuit(self, qubits: int) -> ProductStateCircuit:
+        return ProductStateCircuit(qubits)
+
+    def bind_template(self, template: Any, angles: np.ndarray) -> ProductStateCircuit:
+        circuit = ProductStateCircuit(template.qubits)
+        circuit.angles = np.sum(angles, axis=0, dtype=float)
+        return circuit
+
+    def distribution(self, circuit: Any) -> ProductDistribution:
+        return ProductDistribution(excitation_probabilities(circuit.angles))
+
+    def sample_counts(self, circuit: Any, shots: int) -> dict[str, int]:
+        probabilities = excitation_probabilities(circuit.angles)
+        return bits_to_counts(sample_bits(probabilities, shots, self.rng))
+
+    def statevector(self, circuit: Any) -> np.ndarray:
+        # The full statevector is exponential by nature; it is only built on
+        # explicit request (e.g. for plotting), never for sampling.
+        return product_statevector(circuit.angles)
+
+
+def product_statevector(angles: np.ndarray) -> np.ndarray:
+    """Return the statevector of independent ``ry``-rotated qubits.
+
+    Parameters
+    ----------
+    angles : numpy.ndarray
+        Accumulated rotation angle of each qubit.
+
+    Returns
+    -------
+    numpy.ndarray
+        The ``2 ** n`` statevector, in Qiskit's little-endian ordering.
+    """
+    statevector = np.ones(1)
+    for angle in angles:
+        qubit_state = np.array([np.cos(angle / 2), np.sin(angle / 2)])
+        statevector = np.kron(qubit_state, statevector)
+    return statevector.astype(complex)
+
+
+def excitation_probabilities(angles: np.ndarray) -> np.ndarray:
+    """Return the probability of measuring ``1`` on each ``ry``-rotated qubit.
+
+    Parameters
+    ----------
+    angles : numpy.ndarray
+        Accumulated rotation angles, one per qubit along the last axis.
+
+    Returns
+    -------
+    numpy.ndarray
+        :math:`\\sin^2(\\theta / 2)` for each angle :math:`\\theta`.
+    """
+    return np.sin(np.asarray(angles, dtype=float) / 2) ** 2
+
+
+def sample_bits(
+    probabilities: np.ndarray, shots: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Sample independent qubits in the computational basis.
+
+    Parameters
+    ----------
+    probabilities : numpy.ndarray
+        Probability of measuring ``1`` on each qubit, with qubits along the
+        last axis. Leading axes are treated as a batch.
+    shots : int
+        Number of samples to draw for each batch entry.
+    rng : numpy.random.Generator
+        Random generator used for sampling.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array of shape ``(..., shots, n)`` whose entry ``[..., s, q]``
+        is the measured value of qubit ``q`` in shot ``s``.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    draws = rng.random(probabilities.shape[:-1] + (shots, probabilities.shape[-1]))
+    return draws < probabilities[..., np.newaxis, :]
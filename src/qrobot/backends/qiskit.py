@@ -4,19 +4,58 @@ from typing import Any
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
 from qiskit.quantum_info import Statevector
 
-from .base import QuantumBackend
+from .base import Gate, QuantumBackend
+from .passes import ROTATIONS, fuse_rotations
 
 
 class QiskitBackend(QuantumBackend):
     """Simulate circuits using Qiskit's quantum-information API."""
 
+    def __init__(self, seed: int | np.random.Generator | None = None) -> None:
+        super().__init__(seed)
+        self._templates: dict[int, QuantumCircuit] = {}
+
     def create_circuit(self, qubits: int) -> QuantumCircuit:
         return QuantumCircuit(qubits)
 
+    def create_template(self, qubits: int, layers: int) -> QuantumCircuit:
+        # The layers' rotations commute, so a single parameterized layer is
+        # cached per number of qubits and bound to their summed angles
+        if qubits not in self._templates:
+            theta = ParameterVector("theta", qubits)
+            template = QuantumCircuit(qubits)
+            for qubit in range(qubits):
+                template.ry(theta[qubit], qubit)
+            self._templates[qubits] = template
+        return self._templates[qubits]
+
+    def bind_template(self, template: Any, angles: np.ndarray) -> QuantumCircuit:
+        # Binding copies the template, which later windows bind again
+        summed = np.sum(angles, axis=0, dtype=float)
+        return template.assign_parameters(summed, inplace=False)
+
+    def fuse_rotations(self, circuit: Any) -> QuantumCircuit:
+        # Only circuits made of bound rotations (i.e. the models' ones) are
+        # optimized, any other circuit is returned unchanged.
+        gates = []
+        for instruction in circuit.data:
+            operation = instruction.operation
+            if operation.name not in ROTATIONS or operation.is_parameterized():
+                return circuit
+            qubits = tuple(circuit.find_bit(q).index for q in instruction.qubits)
+            gates.append(Gate(operation.name, (float(operation.params[0]),), qubits))
+        fused = QuantumCircuit(circuit.num_qubits)
+        for gate in fuse_rotations(gates):
+            getattr(fused, gate.name)(*gate.params, *gate.qubits)
+        return fused
+
     def sample_counts(self, circuit: Any, shots: int) -> dict[str, int]:
-        counts = Statevector.from_instruction(circuit).sample_counts(shots)
+        statevector = Statevector.from_instruction(circuit)
+        statevector.seed(self.rng)
+        counts = statevector.sample_counts(shots)
         return {str(state): int(count) for state, count in counts.items()}
 
     def statevector(self, circuit: Any) -> np.ndarray:
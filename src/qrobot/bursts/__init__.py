@@ -1,5 +1,5 @@
-from .burst import Burst
+from .burst import Burst, States
 from .oneburst import OneBurst
 from .zeroburst import ZeroBurst
 
-__all__ = ["Burst", "ZeroBurst", "OneBurst"]
+__all__ = ["Burst", "States", "ZeroBurst", "OneBurst"]
@@ -1,11 +1,168 @@
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar, TypeAlias
+
+import numpy as np
+
+from qrobot.backends.bits import bitmask_to_label
+
+States: TypeAlias = (
+    Mapping[str, int] | Mapping[int, int] | Sequence[str] | Sequence[int] | np.ndarray
+)
 
 
 class Burst(ABC):
     """Parent abstract class of all bursts. Every burst sould work
-    by being called and returning a ``float`` (the burst value)."""
+    by being called and returning a ``float`` (the burst value).
+
+    A measured state is either its string label (e.g. ``"0010"``) or its
+    integer bitmask, whose bit ``q`` is the value of qubit ``q``. A bitmask
+    does not carry the state dimension, which must then be given as ``n``.
+    Bursts are only called as ``burst(bitmask, n)`` if they set
+    :attr:`supports_bitmasks`; other bursts are called with labels.
+
+    Many states can be processed at once with :meth:`batch` and
+    :meth:`expectation`, either as an array (or sequence) of states or as a
+    counts mapping in the form ``{state: count}``.
+
+    Attributes
+    ----------
+    supports_bitmasks : bool
+        Whether the burst can be called with a bitmask and its dimension.
+        Bursts which only accept labels keep the default ``False``
+    """
+
+    supports_bitmasks: ClassVar[bool] = False
 
     @abstractmethod
     def __call__(self, state: str) -> float:
         """Return the burst value for ``state``."""
         raise NotImplementedError
+
+    def batch(self, states: States, n: int | None = None) -> np.ndarray:
+        """Return the burst value of each state.
+
+        The default calls the burst on each state, converting bitmasks to
+        labels unless the burst sets :attr:`supports_bitmasks`.
+
+        Parameters
+        ----------
+        states : Mapping | Sequence | numpy.ndarray
+            The states, or a counts mapping whose keys are the states.
+        n : int, optional
+            The states dimension, required for bitmasks.
+
+        Returns
+        -------
+        numpy.ndarray
+            The burst values, with the shape of ``states`` (or one value per
+            key of a counts mapping).
+        """
+        array, _ = self._states_and_weights(states)
+        values = [self._value(state, n) for state in array.ravel().tolist()]
+        return np.array(values, dtype=float).reshape(array.shape)
+
+    def expectation(self, states: States, n: int | None = None) -> float:
+        """Return the mean burst value, weighted by counts if given.
+
+        Parameters
+        ----------
+        states : Mapping | Sequence | numpy.ndarray
+            The states, or a counts mapping in the form ``{state: count}``.
+        n : int, optional
+            The states dimension, required for bitmasks.
+
+        Returns
+        -------
+        float
+            The (count-weighted) mean burst value, ``nan`` without states.
+        """
+        array, weights = self._states_and_weights(states)
+        if array.size == 0:
+            return math.nan
+        return float(np.average(self.batch(array, n), weights=weights))
+
+    def expected_value(self, probabilities: np.ndarray) -> float:
+        """Return the exact expected burst value of independent qubits.
+
+        Parameters
+        ----------
+        probabilities : numpy.ndarray
+            Probability of measuring ``1`` on each qubit.
+
+        Returns
+        -------
+        float
+            The expected burst value over the measured states.
+
+        Raises
+        ------
+        NotImplementedError
+            The burst has no closed-form expectation.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} has no closed-form expected value"
+        )
+
+    def _value(self, state: str | int, n: int | None) -> float:
+        """Return the burst value of a label or bitmask, converting bitmasks
+        to labels for bursts that do not support them.
+
+        Raises
+        ------
+        ValueError
+            ``state`` is a bitmask and ``n`` is not given.
+        """
+        if self.supports_bitmasks:
+            return self(state, n)  # type: ignore[arg-type, call-arg]
+        if isinstance(state, str):
+            return self(state)
+        if n is None:
+            raise ValueError("n is required to compute the burst of a bitmask")
+        return self(bitmask_to_label(state, n))
+
+    @staticmethod
+    def _states_and_weights(states: States) -> tuple[np.ndarray, np.ndarray | None]:
+        """Split a counts mapping into its states and their counts."""
+        if isinstance(states, Mapping):
+            return np.asarray(list(states)), np.asarray(list(states.values()))
+        return np.asarray(states), None
+
+    @staticmethod
+    def _ones_count(state: str | int, n: int | None) -> tuple[int, int]:
+        """Return the number of 1s of ``state`` and its dimension.
+
+        Raises
+        ------
+        ValueError
+            ``state`` is a bitmask and ``n`` is not given.
+        """
+        if isinstance(state, str):
+            return state.count("1"), len(state)
+        if n is None:
+            raise ValueError("n is required to compute the burst of a bitmask")
+        return int(state).bit_count(), n
+
+    @staticmethod
+    def _ones_counts(states: np.ndarray, n: int | None) -> tuple[np.ndarray, Any]:
+        """Vectorized counterpart of :meth:`_ones_count`, which counts the
+        1s of bitmasks with a popcount.
+
+        Raises
+        ------
+        ValueError
+            ``states`` are bitmasks and ``n`` is not given.
+        """
+        if states.size == 0:
+            # Empty sequences are float arrays, neither labels nor bitmasks
+            return np.zeros(states.shape, dtype=int), np.ones(states.shape, dtype=int)
+        if states.dtype.kind in "US":
+            return np.char.count(states, "1"), np.char.str_len(states)
+        if n is None:
+            raise ValueError("n is required to compute the burst of a bitmask")
+        if states.dtype.kind in "iu":
+            return np.bitwise_count(states.astype(np.uint64)), n
+        # Bitmasks too large for a fixed-size integer dtype
+        ones = [int(state).bit_count() for state in states.ravel().tolist()]
+        return np.array(ones).reshape(states.shape), n
@@ -1,4 +1,6 @@
-from .burst import Burst
+import numpy as np
+
+from .burst import Burst, States
 
 
 class OneBurst(Burst):
@@ -17,10 +19,28 @@ class OneBurst(Burst):
 
     >>> from qrobot.bursts import OneBurst
     >>> state = "00100100"
-    >>> OneBurst(state)
+    >>> OneBurst()(state)
+    0.25
+
+    The same state can be given as an integer bitmask, whose 1s are
+    counted with a popcount:
+
+    >>> OneBurst()(0b00100100, n=8)
     0.25
 
     """
 
-    def __call__(self, state: str) -> float:
-        return state.count("1") / len(state)
+    supports_bitmasks = True
+
+    def __call__(self, state: str | int, n: int | None = None) -> float:
+        ones, n = self._ones_count(state, n)
+        return ones / n
+
+    def batch(self, states: States, n: int | None = None) -> np.ndarray:
+        ones, n = self._ones_counts(self._states_and_weights(states)[0], n)
+        values: np.ndarray = ones / n
+        return values
+
+    def expected_value(self, probabilities: np.ndarray) -> float:
+        # The expected number of 1s is the sum of the excitation probabilities
+        return float(np.mean(probabilities))
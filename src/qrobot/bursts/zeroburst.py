@@ -1,4 +1,6 @@
-from .burst import Burst
+import numpy as np
+
+from .burst import Burst, States
 
 
 class ZeroBurst(Burst):
@@ -17,10 +19,28 @@ class ZeroBurst(Burst):
 
     >>> from qrobot.bursts import ZeroBurst
     >>> state = "00100100"
-    >>> ZeroBurst(state)
+    >>> ZeroBurst()(state)
+    0.75
+
+    The same state can be given as an integer bitmask, whose 1s are
+    counted with a popcount:
+
+    >>> ZeroBurst()(0b00100100, n=8)
     0.75
 
     """
 
-    def __call__(self, state: str) -> float:
-        return state.count("0") / len(state)
+    supports_bitmasks = True
+
+    def __call__(self, state: str | int, n: int | None = None) -> float:
+        ones, n = self._ones_count(state, n)
+        return (n - ones) / n
+
+    def batch(self, states: States, n: int | None = None) -> np.ndarray:
+        ones, n = self._ones_counts(self._states_and_weights(states)[0], n)
+        values: np.ndarray = (n - ones) / n
+        return values
+
+    def expected_value(self, probabilities: np.ndarray) -> float:
+        # The expected number of 1s is the sum of the excitation probabilities
+        return 1.0 - float(np.mean(probabilities))
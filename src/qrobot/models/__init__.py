@@ -1,5 +1,5 @@
 from .angularmodel import AngularModel
 from .linearmodel import LinearModel
-from .model import Model
+from .model import BatchEvaluation, Model
 
-__all__ = ["Model", "AngularModel", "LinearModel"]
+__all__ = ["Model", "AngularModel", "LinearModel", "BatchEvaluation"]
@@ -30,10 +30,16 @@ class AngularModel(Model):
         scalar_input = self._scalar_input_check(scalar_input)
 
         # Apply rotation to the qubit
-        angle = np.pi * scalar_input / self.tau
-        self.circ.ry(angle, dim)
+        angle = float(self._encoding_angles(np.asarray(scalar_input)))
+        self._rotate(angle, dim)
         return angle
 
+    def _encoding_angles(self, scalar_inputs: np.ndarray) -> np.ndarray:
+        return np.pi * scalar_inputs / self.tau
+
+    def _query_angles(self, target_vector: np.ndarray) -> np.ndarray:
+        return -np.pi * target_vector
+
     def query(self, target_vector: TargetVector) -> None:
         r"""Changes the basis of the quantum system choosing target_vector as
         the basis state \|00...0>
@@ -50,9 +56,9 @@ class AngularModel(Model):
         # Apply negative (inverse) rotations to the qubit in order to
         # have the target_vector state as the new |00...0> state.
         # Loop through all the dimensions:
+        angles = self._query_angles(np.asarray(target_vector))
         for i in range(0, self.n):
-            angle = -np.pi * target_vector[i]
-            self.circ.ry(angle, i)
+            self._rotate(float(angles[i]), i)
 
     def decode(self) -> str:
         """The decoding for the ``AngularModel`` is a single measurement.
@@ -63,6 +69,16 @@ class AngularModel(Model):
             The string label corresponding to the decoded state
 
         """
-        measure_dict = self.measure()
-        # Return the most measured state (only one measurement though)
-        return max(measure_dict, key=lambda state: measure_dict[state])
+        return self.decode_many(1)[0]
+
+    def decode_bitmask(self) -> int:
+        """Integer counterpart of :meth:`decode`, which skips the conversion
+        to a string label.
+
+        Returns
+        --------
+        int
+            The bitmask of the decoded state, whose bit ``q`` is the value
+            of qubit ``q``.
+        """
+        return int(self.decode_bitmasks(1)[0])
@@ -1,7 +1,6 @@
 import numpy as np
 
 from .angularmodel import AngularModel
-from .model import Scalar
 
 
 class LinearModel(AngularModel):
@@ -18,27 +17,6 @@ class LinearModel(AngularModel):
     one of ``AngularModel``
     """
 
-    def encode(self, scalar_input: Scalar, dim: int) -> float:
-        """Encodes the scalar input in the correspondent qubit
-
-        Parameters
-        ----------
-        scalar_input : float
-            The scalar input for a certain dimension, must be a number between
-            0 and 1 inclusive.
-        dim : int
-            The model's dimension which the scalar input belongs.
-
-        Returns
-        ----------
-        float
-            The rotation angle applied to the qubit.
-        """
-        # Check the arguments
-        dim = self._dim_index_check(dim)
-        scalar_input = self._scalar_input_check(scalar_input)
-
-        # Apply rotation to the qubit
-        angle = (np.arcsin(2 * scalar_input - 1) + np.pi / 2) / self.tau
-        self.circ.ry(angle, dim)
-        return float(angle)
+    def _encoding_angles(self, scalar_inputs: np.ndarray) -> np.ndarray:
+        angles: np.ndarray = (np.arcsin(2 * scalar_inputs - 1) + np.pi / 2) / self.tau
+        return angles
@@ -1,15 +1,44 @@
 from abc import ABC, abstractmethod
 from collections.abc import Generator, Sequence
+from dataclasses import dataclass
 from typing import TypeAlias
 
 import numpy as np
+from numpy.typing import ArrayLike
 
-from qrobot.backends import QiskitBackend, QuantumBackend
+from qrobot.backends import QuantumBackend, get_default_backend
+from qrobot.backends.base import StateDistribution
+from qrobot.backends.bits import bits_to_bitmasks, bits_to_labels
+from qrobot.backends.product import excitation_probabilities, sample_bits
+from qrobot.bursts import Burst
 
 Scalar: TypeAlias = float | int
 TargetVector: TypeAlias = Sequence[Scalar] | Scalar
 
 
+@dataclass(frozen=True)
+class BatchEvaluation:
+    """Per-sequence results of :meth:`Model.evaluate_batch`.
+
+    Attributes
+    ----------
+    states : numpy.ndarray
+        The decoded (i.e. most measured) state label of each sequence.
+    counts : list[dict[str, int]]
+        State occurrences counts of each sequence in the form
+        {"state": count}.
+    probabilities : numpy.ndarray
+        ``(batch, n)`` probabilities of measuring ``1`` on each qubit.
+    bursts : numpy.ndarray | None
+        Burst value of each decoded state, when a burst was given.
+    """
+
+    states: np.ndarray
+    counts: list[dict[str, int]]
+    probabilities: np.ndarray
+    bursts: np.ndarray | None = None
+
+
 class Model(ABC):
     """``Model`` is an abstract class which embeds the general features
     needed in a model for QL perception.
@@ -21,6 +50,17 @@ class Model(ABC):
         Model's dimension (must be greater than 0, 1 is a scalar)
     tau : int
         Number of samples of the temporal window (must be greater than 0)
+    backend : qrobot.backends.QuantumBackend, optional
+        Backend simulating the model's circuit. Defaults to
+        :func:`qrobot.backends.get_default_backend`.
+    fuse_rotations : bool, optional
+        Whether to fuse consecutive rotations on the same qubit before
+        simulating the circuit (see
+        :meth:`qrobot.backends.QuantumBackend.fuse_rotations`). Defaults to
+        ``False``.
+    seed : int | numpy.random.Generator, optional
+        Seed (or generator) used for sampling. When given, it reseeds
+        ``backend``. Defaults to ``None``, i.e. keep the backend's generator.
 
     Attributes
     ----------
@@ -28,11 +68,22 @@ class Model(ABC):
         Model's dimension.
     tau : int
         Number of samples of the temporal window.
+    backend : qrobot.backends.QuantumBackend
+        Backend simulating the model's circuit.
+    fuse_rotations : bool
+        Whether rotations are fused before simulating the circuit.
     circ : object
         Backend-specific circuit which implements the model.
     """
 
-    def __init__(self, n: int, tau: int, backend: QuantumBackend | None = None) -> None:
+    def __init__(
+        self,
+        n: int,
+        tau: int,
+        backend: QuantumBackend | None = None,
+        fuse_rotations: bool = False,
+        seed: int | np.random.Generator | None = None,
+    ) -> None:
         """Initialize the class"""
 
         # Check the argument n
@@ -53,8 +104,17 @@ class Model(ABC):
         else:
             raise TypeError("tau must be an integer!")
 
-        self.backend = backend or QiskitBackend()
+        self.backend = backend or get_default_backend()
+        self.fuse_rotations = fuse_rotations
         self.circ = self.backend.create_circuit(n)
+        self._template: object | None = None
+        # Measurement distribution of the current circuit, computed on demand
+        self._distribution: StateDistribution | None = None
+        # Rotations on the same qubit sum up, so the model's product state is
+        # fully described by the accumulated rotation angle of each qubit
+        self._angles = np.zeros(n)
+        if seed is not None:
+            self.seed(seed)
 
     def __iter__(self) -> Generator[tuple[str, object], None, None]:
         yield "model", self.__class__.__name__
@@ -119,6 +179,41 @@ class Model(ABC):
             raise ValueError("scalar_input must be between 0 and 1 inclusive!")
         return float(scalar_input)
 
+    def _scalar_inputs_check(
+        self, scalar_inputs: ArrayLike, shape: tuple[int, ...]
+    ) -> np.ndarray:
+        """This method is the vectorized counterpart of `_scalar_input_check`,
+        ensuring that an array of `scalar_inputs` has the expected `shape` and
+        only holds numbers between 0 and 1 (inclusive).
+
+        Raises
+        ---------
+        TypeError
+            `scalar_inputs` elements are not all integers or floats
+        ValueError
+            `scalar_inputs` shape is not `shape`
+        ValueError
+            `scalar_inputs` elements are not all between 0 and 1 inclusive
+
+        Returns
+        --------
+        numpy.ndarray
+            The `scalar_inputs` as a float array
+        """
+        array = np.asarray(scalar_inputs)
+        if array.dtype.kind not in "biuf":
+            raise TypeError(
+                f"scalar_inputs must only contain scalar numbers, not {array.dtype}!"
+            )
+        if array.shape != shape:
+            raise ValueError(
+                f"scalar_inputs must have shape {shape}, not {array.shape}!"
+            )
+        array = array.astype(float)
+        if np.any((array > 1) | (array < 0)):
+            raise ValueError("scalar_inputs must be between 0 and 1 inclusive!")
+        return array
+
     def _target_vector_check(self, target_vector: TargetVector) -> list[float]:
         """This method ensures that a `target_vector` for the model
         is an `n`-dimensional vector (where `n` is the model's dimension).
@@ -157,9 +252,26 @@ class Model(ABC):
                     0 and 1 inclusive!")
         return [float(element) for element in target_vector]
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random generator used for sampling, shared with the backend."""
+        return self.backend.rng
+
+    def seed(self, seed: int | np.random.Generator | None) -> None:
+        """Reseed the random generator used for sampling.
+
+        Parameters
+        ----------
+        seed : int | numpy.random.Generator | None
+            Seed (or generator) of the new random generator.
+        """
+        self.backend.seed(seed)
+
     def clear(self) -> None:
         """Re-initialize the model with an empty circuit."""
         self.circ = self.backend.create_circuit(self.n)
+        self._distribution = None
+        self._angles = np.zeros(self.n)
 
     @abstractmethod
     def encode(self, scalar_input: Scalar, dim: int) -> float:
@@ -175,6 +287,195 @@ class Model(ABC):
 
         """
 
+    def _rotate(self, angle: float, dim: int) -> None:
+        """Apply an ``ry`` rotation to the qubit of dimension `dim`.
+
+        Every rotation applied by the model goes through this method, which
+        also invalidates the cached measurement distribution and accumulates
+        the rotation angle of the qubit.
+        """
+        self.circ.ry(angle, dim)
+        self._distribution = None
+        self._angles[dim] += angle
+
+    def _encoding_angles(self, scalar_inputs: np.ndarray) -> np.ndarray:
+        """Return the rotation angles which encode already validated
+        `scalar_inputs`, element by element.
+
+        Models only implementing :meth:`encode` keep working, but cannot use
+        the vectorized encodings, batches or compiled networks.
+
+        Raises
+        ------
+        NotImplementedError
+            The model does not support vectorized encoding.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support vectorized encoding, "
+            "implement _encoding_angles to use it"
+        )
+
+    def encode_vector(self, vector: ArrayLike) -> np.ndarray:
+        """Encodes an input vector, one scalar input per dimension.
+
+        This is equivalent to calling :meth:`encode` for every dimension, but
+        validates the whole vector at once.
+
+        Parameters
+        ----------
+        vector : numpy.typing.ArrayLike
+            The ``n``-dimensional input vector, whose elements must be numbers
+            between 0 and 1 inclusive.
+
+        Returns
+        ----------
+        numpy.ndarray
+            The rotation angles applied to the qubits.
+        """
+        vector = self._scalar_inputs_check(vector, (self.n,))
+        angles = self._encoding_angles(vector)
+        for dim, angle in enumerate(angles):
+            self._rotate(float(angle), dim)
+        return angles
+
+    def encode_window(self, window: ArrayLike) -> np.ndarray:
+        """Encodes a whole temporal window of input vectors.
+
+        Rotations applied to the same qubit over the window sum up, so a
+        single fused rotation per qubit is applied instead of ``tau``.
+
+        Example
+        -------
+        These two snippets encode the same ``sequence`` (a ``(tau, n)``
+        array)::
+
+            for t in range(model.tau): # loop through time
+                for dim in range(model.n): # loop through dimensions
+                    model.encode(sequence[t][dim], dim)
+
+            model.encode_window(sequence)
+
+        Parameters
+        ----------
+        window : numpy.typing.ArrayLike
+            The ``(tau, n)`` sequence of input vectors, whose elements must be
+            numbers between 0 and 1 inclusive.
+
+        Returns
+        ----------
+        numpy.ndarray
+            The fused rotation angles applied to the qubits.
+        """
+        window = self._scalar_inputs_check(window, (self.tau, self.n))
+        angles: np.ndarray = self._encoding_angles(window).sum(axis=0)
+        for dim, angle in enumerate(angles):
+            self._rotate(float(angle), dim)
+        return angles
+
+    def bind_window(
+        self, window: ArrayLike, target_vector: TargetVector | None = None
+    ) -> None:
+        """Re-initialize the model with an encoded window and query.
+
+        This is equivalent to :meth:`clear` followed by
+        :meth:`encode_window` and :meth:`query`, but the circuit is obtained
+        by binding the window's angles to a template built only once per
+        model, so that backends can reuse whatever they derived from it.
+
+        Parameters
+        ----------
+        window : numpy.typing.ArrayLike
+            The ``(tau, n)`` sequence of input vectors, whose elements must be
+            numbers between 0 and 1 inclusive.
+        target_vector : list, optional
+            The query target state. When omitted, no query is applied.
+        """
+        window = self._scalar_inputs_check(window, (self.tau, self.n))
+        angles = np.zeros((self.tau + 1, self.n))
+        angles[: self.tau] = self._encoding_angles(window)
+        if target_vector is not None:
+            target_vector = self._target_vector_check(target_vector)
+            angles[self.tau] = self._query_angles(np.asarray(target_vector))
+        if self._template is None:
+            # The last layer of the template holds the query rotations
+            self._template = self.backend.create_template(self.n, self.tau + 1)
+        self.circ = self.backend.bind_template(self._template, angles)
+        self._distribution = None
+        self._angles = angles.sum(axis=0)
+
+    def _query_angles(self, target_vector: np.ndarray) -> np.ndarray:
+        """Return the rotation angles which apply an already validated
+        query `target_vector`, element by element.
+
+        Raises
+        ------
+        NotImplementedError
+            The model does not support vectorized queries.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support vectorized queries, "
+            "implement _query_angles to use them"
+        )
+
+    def evaluate_batch(
+        self,
+        sequences: ArrayLike,
+        query: TargetVector,
+        shots: int = 1,
+        burst: Burst | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> BatchEvaluation:
+        """Encodes, queries and decodes many sequences at once.
+
+        Every sequence is processed as if it was encoded in a fresh model,
+        queried with ``query`` and measured ``shots`` times, but no circuit
+        is built: since the model only applies rotations to independent
+        qubits, the measurement probabilities are computed in closed form
+        for the whole batch. The model's own circuit is left untouched.
+
+        Parameters
+        ----------
+        sequences : numpy.typing.ArrayLike
+            ``(batch, tau, n)`` array of input sequences, whose elements must
+            be numbers between 0 and 1 inclusive.
+        query : list
+            The target state shared by all the queries.
+        shots : int
+            Number of times to measure each sequence. Defaults to ``1``,
+            which matches :meth:`decode`.
+        burst : qrobot.bursts.Burst, optional
+            Burst applied to each decoded state.
+        rng : numpy.random.Generator, optional
+            Random generator used for sampling. Defaults to :attr:`rng`.
+
+        Returns
+        ----------
+        BatchEvaluation
+            The per-sequence decoded states, counts, probabilities and bursts.
+        """
+        shape = np.shape(sequences)[:1] + (self.tau, self.n)
+        sequences = self._scalar_inputs_check(sequences, shape)
+        target_vector = np.asarray(self._target_vector_check(query))
+        if shots < 1:
+            raise ValueError("shots must be a positive integer!")
+
+        angles = self._encoding_angles(sequences).sum(axis=1)
+        angles += self._query_angles(target_vector)
+        probabilities = excitation_probabilities(angles)
+        bits = sample_bits(probabilities, shots, rng or self.rng)
+
+        counts = []
+        for labels in bits_to_labels(bits):
+            states, occurrences = np.unique(labels, return_counts=True)
+            counts.append(
+                {str(state): int(count) for state, count in zip(states, occurrences)}
+            )
+        decoded = np.array(
+            [max(count, key=count.__getitem__) for count in counts], dtype=str
+        )
+        bursts = None if burst is None else burst.batch(decoded)
+        return BatchEvaluation(decoded, counts, probabilities, bursts)
+
     def measure(self, shots: int = 1) -> dict[str, int]:
         """Measure the qubits using the configured backend.
 
@@ -187,17 +488,117 @@ class Model(ABC):
         dict
             State occurrences counts in the form {"state": count}
         """
-        return self.backend.sample_counts(self.circ, shots)
+        return self.backend.sample_counts(self._simulated_circuit(), shots)
 
     @abstractmethod
     def decode(self) -> str:
         """Exploits the information encoded in the qubit."""
 
+    def decode_many(self, shots: int) -> list[str]:
+        """Samples ``shots`` measured states of the current circuit.
+
+        The measurement distribution is computed once per circuit (i.e.
+        until the model is encoded, queried or cleared again) and then
+        sampled with :attr:`rng`, so repeated calls on the same temporal
+        window only pay for sampling.
+
+        Parameters
+        ----------
+        shots : int
+            Number of states to sample.
+
+        Returns
+        ----------
+        list[str]
+            The string labels of the sampled states.
+        """
+        return [str(label) for label in bits_to_labels(self._sample_bits(shots))]
+
+    def decode_bitmasks(self, shots: int) -> np.ndarray:
+        """Samples ``shots`` measured states of the current circuit as
+        integer bitmasks, whose bit ``q`` is the value of qubit ``q``.
+
+        This is the integer counterpart of :meth:`decode_many`, sharing its
+        cached measurement distribution.
+
+        Parameters
+        ----------
+        shots : int
+            Number of states to sample.
+
+        Returns
+        ----------
+        numpy.ndarray
+            The sampled bitmasks (see
+            :func:`qrobot.backends.bits.bits_to_bitmasks`).
+        """
+        return bits_to_bitmasks(self._sample_bits(shots))
+
+    def decode_bitmask(self) -> int:
+        """Integer counterpart of :meth:`decode`.
+
+        Returns
+        --------
+        int
+            The bitmask of the decoded state, whose bit ``q`` is the value
+            of qubit ``q``.
+        """
+        return int(self.decode(), 2)
+
+    def _sample_bits(self, shots: int) -> np.ndarray:
+        """Sample the cached measurement distribution of the circuit."""
+        if self._distribution is None:
+            self._distribution = self.backend.distribution(self._simulated_circuit())
+        return self._distribution.sample(shots, self.rng)
+
     @abstractmethod
     def query(self, target_vector: TargetVector) -> None:
         r"""Changes the basis of the quantum system choosing `target_vector`
         as the basis state \|00...0>."""
 
+    def _simulated_circuit(self) -> object:
+        """Return the circuit to simulate, fused if requested."""
+        if self.fuse_rotations:
+            return self.backend.fuse_rotations(self.circ)
+        return self.circ
+
+    def get_excitation_probabilities(self) -> np.ndarray:
+        """Returns the probability of measuring ``1`` on each qubit.
+
+        Since the model only applies rotations to independent qubits, the
+        probabilities are computed in closed form from the accumulated
+        rotation angles, without simulating the circuit. Rotations applied
+        to :attr:`circ` directly (i.e. not by the model) are not accounted
+        for.
+
+        Returns
+        ---------
+        numpy.ndarray
+            The excitation probability of each qubit.
+        """
+        return excitation_probabilities(self._angles)
+
+    def expected_burst(self, burst: Burst) -> float:
+        """Returns the exact expected value of ``burst`` over the
+        measurements of the current circuit.
+
+        This is computed from :meth:`get_excitation_probabilities` in
+        ``O(n)``, as a noise-free alternative to the burst of a single
+        decoded state.
+
+        Parameters
+        ----------
+        burst : qrobot.bursts.Burst
+            The burst, which must implement
+            :meth:`qrobot.bursts.Burst.expected_value`.
+
+        Returns
+        ---------
+        float
+            The expected burst value.
+        """
+        return burst.expected_value(self.get_excitation_probabilities())
+
     def get_statevector(self) -> np.ndarray:
         """Returns the simulated state vector of the model.
 
@@ -206,7 +607,7 @@ class Model(ABC):
         numpy.ndarray
             Model's state vector.
         """
-        return self.backend.statevector(self.circ)
+        return self.backend.statevector(self._simulated_circuit())
 
     def get_density_matrix(self) -> np.ndarray:
         """Returns the simulated density matrix of the model.
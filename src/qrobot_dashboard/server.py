@@ -8,11 +8,13 @@ import dash
 import plotly.graph_objects as go
 from dash.dependencies import Input, Output, State
 
-from qrobot_qunits.redis_utils import redis_status
+from qrobot_qunits.redis_utils import units_status
 from qrobot_visualization import build_network, draw
 
 
-def build_network_figure(status: Mapping[str, str]) -> go.Figure:
+def build_network_figure(
+    status: Mapping[str, str] | Mapping[str, Mapping[str, str]],
+) -> go.Figure:
     """Build the dashboard figure from a Redis status mapping."""
     network = build_network(status)
     return draw(network)
@@ -20,7 +22,9 @@ def build_network_figure(status: Mapping[str, str]) -> go.Figure:
 
 def register_callbacks(
     dash_app: dash.Dash,
-    status_provider: Callable[[], Mapping[str, str]] = redis_status,
+    status_provider: Callable[
+        [], Mapping[str, str] | Mapping[str, Mapping[str, str]]
+    ] = units_status,
 ) -> dash.Dash:
     """Register server callback functions to the Dash app."""
 
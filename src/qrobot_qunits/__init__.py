@@ -1,14 +1,29 @@
 from . import redis_utils
+from .aio import AsyncUnitRuntime
+from .compiler import CompiledNetwork, compile_network, run_network
 from .qunit import QUnit
 from .actuator import ActuatorUnit
 from .redis_utils import RedisConfig, RedisWriteError
+from .runtime import UnitRuntime
+from .scheduler import PeriodicScheduler, SchedulerStats
 from .sensorial import SensorialUnit
+from .transport import LocalTransport, RedisTransport, Transport
 
 __all__ = [
     "ActuatorUnit",
+    "AsyncUnitRuntime",
+    "CompiledNetwork",
+    "compile_network",
+    "LocalTransport",
     "QUnit",
     "RedisConfig",
     "RedisWriteError",
+    "PeriodicScheduler",
     "redis_utils",
+    "run_network",
+    "RedisTransport",
+    "SchedulerStats",
     "SensorialUnit",
+    "Transport",
+    "UnitRuntime",
 ]
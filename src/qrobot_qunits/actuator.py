@@ -1,15 +1,14 @@
 """Redis-connected actuator interfaces for qBrain networks."""
 
 import json
-from collections.abc import Generator
-
-import redis
+from collections.abc import Generator, Mapping
 
 from qrobot.logger import LoggingConfig
 
-from . import redis_utils
 from .base import BaseUnit
-from .redis_utils import RedisConfig, RedisWriteError
+from .redis_utils import RedisConfig, UnitFields
+from .scheduler import OverrunPolicy
+from .transport import Transport
 
 
 class ActuatorUnit(BaseUnit):
@@ -34,6 +33,12 @@ class ActuatorUnit(BaseUnit):
         value. Defaults to ``0.5``.
     default_input : float
         Value used for a qUnit that has not published yet. Defaults to ``0.0``.
+    overrun_policy : {"skip", "catch_up"}
+        What to do with the ticks missed when a task takes longer than the
+        sampling period. Defaults to ``"skip"``.
+    transport : Transport, optional
+        Where the unit writes its fields and reads its inputs. Defaults to
+        ``None``, i.e. Redis over ``redis_config``.
 
     Attributes
     ----------
@@ -50,6 +55,8 @@ class ActuatorUnit(BaseUnit):
 
     """
 
+    supports_step = True
+
     def __init__(
         self,
         name: str,
@@ -59,13 +66,25 @@ class ActuatorUnit(BaseUnit):
         default_input: float = 0.0,
         redis_config: RedisConfig | None = None,
         logging_config: LoggingConfig | None = None,
+        overrun_policy: OverrunPolicy = "skip",
+        transport: Transport | None = None,
     ) -> None:
-        super().__init__(name, sampling_period, redis_config, logging_config)
+        super().__init__(
+            name,
+            sampling_period,
+            redis_config,
+            logging_config,
+            overrun_policy,
+            transport,
+        )
         if not in_qunits or any(not isinstance(unit_id, str) for unit_id in in_qunits):
             raise ValueError("in_qunits must contain at least one qUnit id")
         self._in_qunits = tuple(in_qunits)
         self.threshold = self._normalized_value(threshold, "threshold")
         self.default_input = self._normalized_value(default_input, "default_input")
+        # Whether the fixed couplings were published on Redis since the unit
+        # was last registered (only used by the worker process)
+        self._published_metadata = False
 
     def __iter__(self) -> Generator[tuple[str, object], None, None]:
         yield "name", self.name
@@ -82,12 +101,17 @@ class ActuatorUnit(BaseUnit):
     @property
     def input_vector(self) -> list[float]:
         """Latest burst values, using the configured fallback when absent."""
-        client = redis_utils.get_redis(self.redis_config)
-        values = []
-        for unit_id in self._in_qunits:
-            value = client.get(unit_id + " output")
-            values.append(self.default_input if value is None else float(value))
-        return values
+        values = self.transport.read(self._in_qunits, "output")
+        return self._input_values(dict(zip(self._in_qunits, values)))
+
+    def _input_values(self, inputs: Mapping[str, str | None]) -> list[float]:
+        values = [inputs.get(unit_id) for unit_id in self._in_qunits]
+        return [
+            self.default_input if value is None else float(value) for value in values
+        ]
+
+    def _input_ids(self) -> list[str]:
+        return list(self._in_qunits)
 
     @property
     def normalized_sum(self) -> float:
@@ -95,37 +119,34 @@ class ActuatorUnit(BaseUnit):
         values = self.input_vector
         return sum(values) / len(values)
 
+    def _register(self) -> None:
+        super()._register()
+        # Couplings deleted by a previous stop or flush are written again
+        self._published_metadata = False
+
+    def _step(self, inputs: Mapping[str, str | None]) -> UnitFields:
+        values = self._input_values(inputs)
+        normalized_sum = sum(values) / len(values)
+        fields: UnitFields = {
+            "input": normalized_sum,
+            "output": self.activation_for(normalized_sum),
+        }
+        if not self._published_metadata:
+            fields["in_qunits"] = json.dumps(self.in_qunits)
+            self._published_metadata = True
+        return fields
+
     def activation_for(self, normalized_sum: float) -> float:
         """Return the thresholded activation for a normalized input sum."""
         return threshold_activation(normalized_sum, self.threshold)
 
     def get_activation(self) -> float | None:
         """Return the latest activation published by this actuator."""
-        value = redis_utils.get_redis(self.redis_config).get(self.id + " output")
+        (value,) = self.transport.read([self.id], "output")
         return None if value is None else float(value)
 
     def _clean_redis(self) -> None:
-        client = redis_utils.get_redis(self.redis_config)
-        client.delete(self.id + " input", self.id + " output", self.id + " in_qunits")
-
-    def _unit_task(self) -> None:
-        normalized_sum = self.normalized_sum
-        activation = self.activation_for(normalized_sum)
-        client = redis_utils.get_redis(self.redis_config)
-        try:
-            written = client.mset(
-                {
-                    self.id + " input": normalized_sum,
-                    self.id + " output": activation,
-                    self.id + " in_qunits": json.dumps(self.in_qunits),
-                }
-            )
-        except redis.RedisError as exc:
-            raise RedisWriteError(
-                f"Unable to write ActuatorUnit {self.id} state to Redis"
-            ) from exc
-        if not written:
-            raise RedisWriteError(f"Redis did not write ActuatorUnit {self.id} state")
+        self.transport.delete(self.id, ["input", "output", "in_qunits"])
 
     @staticmethod
     def _normalized_value(value: float, name: str) -> float:
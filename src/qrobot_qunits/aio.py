@@ -0,0 +1,247 @@
+"""Asyncio execution of units, with asynchronous Redis access."""
+
+import asyncio
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict
+from time import monotonic
+from typing import Any, cast
+
+import redis
+import redis.asyncio
+
+from qrobot.logger import get_logger
+from . import base, redis_utils
+from .base import BaseUnit
+from .memory import AsyncMemoryRedis
+from .redis_utils import RedisConfig, RedisWriteError
+from .scheduler import PeriodicScheduler
+from .transport import LocalTransport, RedisTransport
+
+
+def get_async_redis(config: RedisConfig | None = None) -> redis.asyncio.Redis:
+    """Return a new asyncio Redis client with decoded string responses.
+
+    Asyncio clients are bound to the event loop that uses them, so they are
+    not cached like :func:`qrobot_qunits.redis_utils.get_redis` clients.
+    With the ``"memory"`` backend, the client is an
+    :class:`~qrobot_qunits.memory.AsyncMemoryRedis`.
+
+    Parameters
+    ----------
+    config : RedisConfig | None
+        Connection settings. When omitted, use the local default Redis server.
+
+    Returns
+    -------
+    redis.asyncio.Redis
+        A lazily connected client configured with ``decode_responses=True``.
+    """
+    settings = config or RedisConfig()
+    if settings.backend == "memory":
+        # The store implements the subset of the client used here
+        return cast(redis.asyncio.Redis, AsyncMemoryRedis(settings.database))
+    return redis.asyncio.Redis(
+        host=settings.host,
+        port=settings.port,
+        db=settings.database,
+        max_connections=settings.max_connections,
+        socket_timeout=settings.socket_timeout,
+        socket_connect_timeout=settings.socket_connect_timeout,
+        decode_responses=True,
+    )
+
+
+async def read_units_field(
+    client: redis.asyncio.Redis,
+    config: RedisConfig,
+    unit_ids: Sequence[str],
+    field: str,
+) -> list[str | None]:
+    """Asynchronous version of
+    :func:`qrobot_qunits.redis_utils.read_units_field`.
+
+    Parameters
+    ----------
+    client : redis.asyncio.Redis
+        The client of the database, see :func:`get_async_redis`.
+    config : RedisConfig
+        Storage schema of the database.
+    unit_ids : Sequence[str]
+        The unit identifiers.
+    field : str
+        The field to read, e.g. ``"output"``.
+
+    Returns
+    -------
+    list[str | None]
+        The value of each unit's field, ``None`` when it is not set.
+    """
+    if not unit_ids:
+        return []
+    pipeline = client.pipeline(transaction=False)
+    redis_utils._queue_read(pipeline, config, unit_ids, field)
+    return redis_utils._read_results(config, await pipeline.execute())
+
+
+async def write_unit(
+    client: redis.asyncio.Redis,
+    config: RedisConfig,
+    unit_id: str,
+    fields: Mapping[str, str | float],
+) -> bool:
+    """Asynchronous version of :func:`qrobot_qunits.redis_utils.write_unit`.
+
+    Parameters
+    ----------
+    client : redis.asyncio.Redis
+        The client of the database, see :func:`get_async_redis`.
+    config : RedisConfig
+        Storage schema and events kind of the database.
+    unit_id : str
+        The unit identifier.
+    fields : Mapping[str, str | float]
+        Field values to write, e.g. ``{"output": 1.0}``.
+
+    Returns
+    -------
+    bool
+        Whether Redis acknowledged the write.
+    """
+    pipeline = client.pipeline(transaction=False)
+    redis_utils._queue_write(pipeline, config, unit_id, fields)
+    written, *_ = await pipeline.execute()
+    return config.schema == "hash" or bool(written)
+
+
+def _is_local(unit: BaseUnit) -> bool:
+    """Whether the unit's transport does no I/O, i.e. never blocks the loop."""
+    transport = unit.transport
+    return isinstance(transport, LocalTransport) and transport.mirror is None
+
+
+class AsyncUnitRuntime:
+    """Run many units concurrently in a single asyncio event loop.
+
+    Every unit runs as a task of the loop, ticking on the deadlines of its
+    own :class:`~qrobot_qunits.scheduler.PeriodicScheduler`. Redis reads and
+    writes are awaited with ``redis.asyncio``, so the I/O of all the units
+    overlaps instead of blocking each other. Only units which never block
+    run in the loop: those on Redis whose
+    :attr:`~qrobot_qunits.base.BaseUnit.supports_step` is set, with their
+    I/O awaited, and those with a
+    :class:`~qrobot_qunits.transport.LocalTransport` without mirror, which
+    do no I/O; every other unit has its ``_unit_task`` run in a thread.
+
+    Units hosted by a runtime run periodically, even when their
+    ``redis_config.events`` is set, and must not be started on their own.
+
+    Parameters
+    ----------
+    units : Sequence[BaseUnit]
+        The units to run.
+
+    Attributes
+    ----------
+    units : tuple[BaseUnit, ...]
+        The units run by the runtime.
+
+    Raises
+    ------
+    ValueError
+        ``units`` is empty or contains the same unit twice.
+
+    Examples
+    --------
+    Run a network for ten seconds, then clean its Redis entries:
+
+    >>> runtime = AsyncUnitRuntime([sensor, qunit])  # doctest: +SKIP
+    >>> asyncio.run(asyncio.wait_for(runtime.run(), 10))  # doctest: +SKIP
+    """
+
+    def __init__(self, units: Sequence[BaseUnit]) -> None:
+        if not units:
+            raise ValueError("units must contain at least one unit")
+        if len({unit.id for unit in units}) != len(units):
+            raise ValueError("units must not contain the same unit twice")
+        self.units = tuple(units)
+        self._logger = get_logger("runtime")
+
+    async def run(self) -> None:
+        """Run the units until cancelled, then clean their Redis entries."""
+        self._logger.info(f"Running {len(self.units)} units in the event loop")
+        clients = {
+            unit.transport.config: get_async_redis(unit.transport.config)
+            for unit in self.units
+            if isinstance(unit.transport, RedisTransport)
+        }
+        # Registration happens once, so it reuses the synchronous helpers
+        await asyncio.gather(
+            *(asyncio.to_thread(unit._register) for unit in self.units)
+        )
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for unit in self.units:
+                    client = None
+                    if isinstance(unit.transport, RedisTransport):
+                        client = clients[unit.transport.config]
+                    tasks.create_task(self._run_unit(unit, client))
+        finally:
+            self._logger.info("Stopping AsyncUnitRuntime")
+            await asyncio.gather(
+                *(asyncio.to_thread(unit._unregister) for unit in self.units)
+            )
+            for client in clients.values():
+                await client.aclose()
+
+    async def _run_unit(
+        self, unit: BaseUnit, client: redis.asyncio.Redis | None
+    ) -> None:
+        scheduler = PeriodicScheduler(unit.sampling_period, unit.overrun_policy)
+        next_report = monotonic() + base.TIMING_REPORT_PERIOD
+        while True:
+            await self._tick(unit, client)
+            if not await scheduler.wait_async():
+                unit._logger.warning(
+                    f"Task overrun, {scheduler.stats().overruns} so far"
+                )
+            if monotonic() >= next_report:
+                next_report += base.TIMING_REPORT_PERIOD
+                transport, stats = unit.transport, scheduler.stats()
+                if client is not None and isinstance(transport, RedisTransport):
+                    timing = {"timing": json.dumps(asdict(stats))}
+                    await write_unit(client, transport.config, unit.id, timing)
+                elif _is_local(unit):
+                    unit._publish_timing(stats)
+                else:
+                    await asyncio.to_thread(unit._publish_timing, stats)
+
+    @staticmethod
+    async def _tick(unit: BaseUnit, client: redis.asyncio.Redis | None) -> None:
+        """Asynchronous version of :meth:`BaseUnit._unit_task`."""
+        transport = unit.transport
+        if client is None or not isinstance(transport, RedisTransport):
+            if _is_local(unit):
+                unit._unit_task()
+            else:
+                await asyncio.to_thread(unit._unit_task)
+            return
+        if not unit.supports_step:
+            await asyncio.to_thread(unit._unit_task)
+            return
+        config = transport.config
+        input_ids = unit._input_ids()
+        values = await read_units_field(client, config, input_ids, "output")
+        fields: dict[str, Any] = unit._step(dict(zip(input_ids, values)))
+        if not fields:
+            return
+        try:
+            written = await write_unit(client, config, unit.id, fields)
+        except redis.RedisError as exc:
+            raise RedisWriteError(
+                f"Unable to write {unit.__class__.__name__} {unit.id} state to Redis"
+            ) from exc
+        if not written:
+            raise RedisWriteError(
+                f"Redis did not write {unit.__class__.__name__} {unit.id} state"
+            )
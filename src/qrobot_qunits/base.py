@@ -1,18 +1,28 @@
+import json
 import multiprocessing
 from abc import ABC, abstractmethod
-from collections.abc import Generator
-from time import sleep
-from typing import Any
+from collections.abc import Generator, Mapping
+from dataclasses import asdict
+from time import monotonic
+from typing import Any, ClassVar
 from uuid import uuid4
 
+import redis
+
 from qrobot.logger import LoggingConfig, configure_logging, get_logger
-from . import redis_utils
-from .redis_utils import RedisConfig
+from .redis_utils import RedisConfig, RedisWriteError, UnitFields
+from .scheduler import OverrunPolicy, PeriodicScheduler, SchedulerStats
+from .transport import RedisTransport, Transport
 
 MIN_TS = 0.01
 """ float: Minimum time period allowed (in seconds).
 """
 
+TIMING_REPORT_PERIOD = 10.0
+""" float: Time between two publications of a unit's timing statistics
+(in seconds).
+"""
+
 
 class BaseUnit(ABC):
     """Base abstract class defining the multithreading and redis
@@ -23,7 +33,17 @@ class BaseUnit(ABC):
     name : str
         The unit name
     sampling_period : float
-        The time period with wich the unit execute its task
+        The time period with wich the unit execute its task. When
+        ``redis_config.events`` is set, units with inputs run as soon as one
+        of them publishes a new output, and at the latest after this period
+    overrun_policy : {"skip", "catch_up"}
+        What to do with the ticks missed when a task takes longer than the
+        sampling period, see :class:`~qrobot_qunits.scheduler.PeriodicScheduler`.
+        Defaults to ``"skip"``
+    transport : Transport, optional
+        Where the unit writes its fields and reads its inputs, see
+        :mod:`qrobot_qunits.transport`. Defaults to ``None``, i.e. a
+        :class:`~qrobot_qunits.transport.RedisTransport` over ``redis_config``
 
     Attributes
     ----------
@@ -33,14 +53,26 @@ class BaseUnit(ABC):
         The unique instance identifier of the unit
     sampling_period : float
         The time period for which the unit execute its task
+    overrun_policy : {"skip", "catch_up"}
+        What to do with the ticks missed when a task overruns
+    transport : Transport
+        Where the unit writes its fields and reads its inputs
+    supports_step : bool
+        Whether the unit computes its fields with ``_step`` without any I/O,
+        so that runtimes can read and write them on its behalf. Units which
+        only override ``_unit_task`` keep the default ``False``
     """
 
+    supports_step: ClassVar[bool] = False
+
     def __init__(
         self,
         name: str,
         sampling_period: float | int,
         redis_config: RedisConfig | None = None,
         logging_config: LoggingConfig | None = None,
+        overrun_policy: OverrunPolicy = "skip",
+        transport: Transport | None = None,
     ) -> None:
         # Create a instance unique identifier
         self.id = name + "-" + str(uuid4())[:6]
@@ -53,22 +85,18 @@ class BaseUnit(ABC):
         self.sampling_period = self._period_check(sampling_period)
         self.redis_config = redis_config or RedisConfig()
         self.logging_config = logging_config
+        self.overrun_policy = overrun_policy
+        self.transport = transport or RedisTransport(self.redis_config)
+        self.transport.attach(self.id)
 
-        # Initialize multiprocessing manager
-        self._multiproc_manager = multiprocessing.Manager()
-        # To define managed variables:
-        # -> self.name = self._multiproc_manager.list(value)
-
-        # A process is deliberately created when ``start`` is called. On
-        # platforms using the ``spawn`` start method, creating it while the
-        # object is still being initialized captures the manager's own worker
-        # process and makes the unit impossible to pickle.
+        # A process is deliberately created when ``start`` is called, so that
+        # the unit can still be pickled into another worker process (e.g. by
+        # a ``UnitRuntime``) on platforms using the ``spawn`` start method.
         self._loop_thread: multiprocessing.Process | None = None
 
     def __getstate__(self) -> dict[str, Any]:
-        """Serialize manager proxies, but not their local manager process."""
+        """Serialize the shared state, but not the unit's own process."""
         state = self.__dict__.copy()
-        state["_multiproc_manager"] = None
         state["_loop_thread"] = None
         return state
 
@@ -84,16 +112,29 @@ class BaseUnit(ABC):
         return out_str
 
     def start(self) -> None:
-        """Starts the unit's background threads"""
+        """Starts the unit's background threads
+
+        Raises
+        ------
+        ValueError
+            The unit's transport only stores fields within this process, e.g.
+            with the ``"memory"`` backend, so the worker process would not
+            publish anything visible.
+        """
         if self._loop_thread is not None and self._loop_thread.is_alive():
             self._logger.warning(f"{self.__class__.__name__} is already started")
             return
+        if self.transport.in_process:
+            raise ValueError(
+                f"{self.__class__.__name__} {self.id} stores its fields within "
+                "this process only, run it with run_units, an AsyncUnitRuntime "
+                "or run_network instead of starting it"
+            )
         self._logger.info(f"Starting {self.__class__.__name__}")
+        # Registering first lets the worker process inherit the reset state
+        self._register()
         self._loop_thread = multiprocessing.Process(target=self._loop)
         self._loop_thread.start()
-        # Add the unit with its class to redis
-        _r = redis_utils.get_redis(self.redis_config)
-        _r.mset({self.id + " class": self.__class__.__name__})
 
     def stop(self) -> None:
         """Stops the unit's background threads"""
@@ -104,26 +145,112 @@ class BaseUnit(ABC):
         self._loop_thread.terminate()
         self._loop_thread.join()
         self._loop_thread = None
+        self._unregister()
+
+    def _register(self) -> None:
+        """Add the unit with its class to redis."""
+        self.transport.register(self.id, self.__class__.__name__)
+
+    def _unregister(self) -> None:
+        """Remove every redis entry of the stopped unit."""
         self._logger.info("Cleaning redis")
         self._clean_redis()
+        self.transport.delete(self.id, ["timing"])
         # Remove the unit with its class from redis
-        _r = redis_utils.get_redis(self.redis_config)
-        _r.delete(self.id + " class")
+        self.transport.unregister(self.id)
 
     @abstractmethod
     def _clean_redis(self) -> None:
         """Clean all the redis entries created by the unit when the loop stops."""
 
-    @abstractmethod
     def _unit_task(self) -> None:
-        """Task executed by the unit every sampling period."""
+        """Task executed by the unit every sampling period.
+
+        Read the outputs of the input units, compute the unit's new fields
+        with :meth:`_step` and write them with the unit's transport.
+        """
+        input_ids = self._input_ids()
+        values = self.transport.read(input_ids, "output")
+        fields = self._step(dict(zip(input_ids, values)))
+        if fields:
+            self._write_fields(fields)
+
+    def _input_ids(self) -> list[str]:
+        """Identifiers of the units whose outputs the unit reads."""
+        return []
+
+    def _step(self, inputs: Mapping[str, str | None]) -> UnitFields:
+        """Compute the unit's new fields, without any I/O.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, str | None]
+            Latest output of every input unit, ``None`` when not available.
+
+        Units overriding this must set :attr:`supports_step`; the default
+        computes no fields.
+
+        Returns
+        -------
+        UnitFields
+            The fields to write on Redis, possibly none.
+        """
+        return {}
+
+    def _write_fields(self, fields: UnitFields) -> None:
+        try:
+            written = self.transport.write(self.id, fields)
+        except redis.RedisError as exc:
+            raise RedisWriteError(
+                f"Unable to write {self.__class__.__name__} {self.id} state to Redis"
+            ) from exc
+        if not written:
+            raise RedisWriteError(
+                f"Redis did not write {self.__class__.__name__} {self.id} state"
+            )
+
+    def timing_stats(self) -> SchedulerStats | None:
+        """Latest timing statistics published by the running unit.
+
+        Returns
+        -------
+        SchedulerStats | None
+            The statistics of the unit's scheduler, published every
+            :data:`TIMING_REPORT_PERIOD` seconds, or ``None`` before the
+            first publication.
+        """
+        (timing,) = self.transport.read([self.id], "timing")
+        return None if timing is None else SchedulerStats(**json.loads(timing))
 
     def _loop(self) -> None:
         if self.logging_config is not None:
             configure_logging(self.logging_config)
-        while True:
-            self._unit_task()
-            sleep(self.sampling_period)
+        scheduler = PeriodicScheduler(self.sampling_period, self.overrun_policy)
+        # Event-driven units run as soon as an input publishes a new output,
+        # and at least once per sampling period
+        listener = self.transport.listener() if self._input_ids() else None
+        next_report = monotonic() + TIMING_REPORT_PERIOD
+        try:
+            while True:
+                self._unit_task()
+                remaining = scheduler.remaining()
+                if listener is not None and remaining > 0:
+                    # Without new inputs, the listener waited for the deadline
+                    if not listener.wait(self._input_ids(), remaining):
+                        scheduler.advance()
+                elif not scheduler.wait():
+                    self._logger.warning(
+                        f"Task overrun, {scheduler.stats().overruns} so far"
+                    )
+                if monotonic() >= next_report:
+                    next_report += TIMING_REPORT_PERIOD
+                    self._publish_timing(scheduler.stats())
+        finally:
+            if listener is not None:
+                listener.close()
+
+    def _publish_timing(self, stats: SchedulerStats) -> None:
+        self.transport.write(self.id, {"timing": json.dumps(asdict(stats))})
 
     @staticmethod
     def _period_check(sampling_period: float | int) -> float:
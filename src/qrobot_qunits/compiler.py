@@ -0,0 +1,419 @@
+"""Compilation of a network of units into vectorized NumPy steps."""
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from qrobot.backends.bits import bits_to_bitmasks
+from qrobot.backends.product import excitation_probabilities
+from qrobot.bursts import Burst
+from qrobot.logger import LoggingConfig, configure_logging, get_logger
+from qrobot.models import Model
+from .actuator import ActuatorUnit
+from .base import BaseUnit
+from .qunit import QUnit
+from .redis_utils import UnitFields
+from .scheduler import PeriodicScheduler
+from .sensorial import SensorialUnit
+from .transport import Transport
+
+
+@dataclass(frozen=True)
+class _Level:
+    """QUnits evaluated together, once all their inputs are computed.
+
+    Their qubits are contiguous in the network's arrays, ``qubits`` being
+    their slice; the other arrays are indexed by qubit or by qUnit of the
+    level.
+    """
+
+    qubits: slice
+    # Output position of each qUnit, and its number of qubits and window
+    units: np.ndarray
+    sizes: np.ndarray
+    taus: np.ndarray
+    # Output position of each qubit's input, -1 when it is not coupled
+    sources: np.ndarray
+    defaults: np.ndarray
+    query_angles: np.ndarray
+    # Model encoding the inputs of some qubits, which share its class and tau
+    encoders: list[tuple[Model, np.ndarray]]
+    # Burst, qubits count and ``(qunits, n)`` qubits of qUnits sharing them
+    sampled: list[tuple[Burst, int, np.ndarray, np.ndarray]]
+    expected: list[tuple[Burst, int, slice]]
+
+
+class CompiledNetwork:
+    """A network of units evaluated with a few NumPy passes per tick.
+
+    Built by :func:`compile_network`. At every :meth:`step`, the sensors
+    output their readings, then every qUnit encodes its inputs in its
+    temporal window, one vectorized pass per level of the network, and every
+    actuator outputs its activation. A qUnit outputs its burst when its
+    window is complete; outputs of qUnits of earlier levels are available
+    within the same tick.
+
+    Attributes
+    ----------
+    units : tuple[BaseUnit, ...]
+        The units, sensors first, then qUnits in topological order, then
+        actuators. Outputs are ordered the same way.
+    ids : tuple[str, ...]
+        The identifiers of :attr:`units`.
+    sensor_ids : tuple[str, ...]
+        The identifiers of the sensors, in the order of the readings.
+    """
+
+    def __init__(
+        self,
+        sensors: Sequence[SensorialUnit],
+        levels: Sequence[Sequence[QUnit]],
+        actuators: Sequence[ActuatorUnit],
+        seed: int | np.random.Generator | None,
+    ) -> None:
+        qunits = [qunit for level in levels for qunit in level]
+        self.units: tuple[BaseUnit, ...] = (*sensors, *qunits, *actuators)
+        self.ids = tuple(unit.id for unit in self.units)
+        self.sensor_ids = tuple(sensor.id for sensor in sensors)
+        positions = {unit_id: position for position, unit_id in enumerate(self.ids)}
+        self._sensors = tuple(sensors)
+        self._rng = np.random.default_rng(seed)
+
+        self._levels = []
+        start = 0
+        for level in levels:
+            self._levels.append(self._compile_level(level, start, positions))
+            start += sum(qunit.model.n for qunit in level)
+        self._angles = np.zeros(start)
+
+        # Actuators average the outputs of their inputs
+        self._actuators = np.arange(len(self.units) - len(actuators), len(self.units))
+        inputs = [
+            [positions[unit_id] for unit_id in act._in_qunits] for act in actuators
+        ]
+        counts = np.array([len(ids) for ids in inputs], dtype=int)
+        self._actuator_sources = np.array(
+            [source for sources in inputs for source in sources], dtype=int
+        )
+        self._actuator_starts = np.cumsum(counts) - counts
+        self._actuator_counts = counts
+        self._actuator_defaults = np.repeat(
+            [act.default_input for act in actuators], counts
+        )
+        self._thresholds = np.array([act.threshold for act in actuators])
+        self._actuator_inputs = np.full(len(actuators), np.nan)
+
+        self._outputs = np.full(len(self.units), np.nan)
+        self._updated = np.zeros(len(self.units), dtype=bool)
+        self._tick = 0
+        self._published_metadata = False
+        self._logger = get_logger("network")
+
+    @staticmethod
+    def _compile_level(
+        level: Sequence[QUnit], start: int, positions: dict[str, int]
+    ) -> _Level:
+        sizes = np.array([qunit.model.n for qunit in level])
+        starts = start + np.cumsum(sizes) - sizes
+        sources, defaults, query_angles = [], [], []
+        encoders: dict[tuple[type, int], tuple[Model, list[int]]] = {}
+        sampled: dict[tuple[int, int], tuple[Burst, list[int]]] = {}
+        expected = []
+        for index, qunit in enumerate(level):
+            model, first = qunit.model, int(starts[index] - start)
+            couplings = qunit.in_qunits
+            sources += [
+                -1 if couplings[dim] is None else positions[str(couplings[dim])]
+                for dim in range(model.n)
+            ]
+            defaults += qunit.default_input
+            query_angles += list(model._query_angles(np.asarray(qunit.query)))
+            key = (type(model), model.tau)
+            encoders.setdefault(key, (model, []))[1].extend(
+                range(first, first + model.n)
+            )
+            if qunit.expected_output:
+                expected.append((qunit.burst, index, slice(first, first + model.n)))
+            else:
+                # qUnits sharing a burst compute their bursts in one call
+                group = (id(qunit.burst), model.n)
+                sampled.setdefault(group, (qunit.burst, []))[1].append(index)
+        return _Level(
+            qubits=slice(start, start + int(sizes.sum())),
+            units=np.array([positions[qunit.id] for qunit in level]),
+            sizes=sizes,
+            taus=np.array([qunit.model.tau for qunit in level]),
+            sources=np.array(sources, dtype=int),
+            defaults=np.array(defaults, dtype=float),
+            query_angles=np.array(query_angles, dtype=float),
+            encoders=[(model, np.array(qubits)) for model, qubits in encoders.values()],
+            sampled=[
+                (
+                    burst,
+                    n,
+                    np.array(indexes),
+                    (starts[indexes] - start)[:, None] + np.arange(n),
+                )
+                for (_, n), (burst, indexes) in sampled.items()
+            ],
+            expected=expected,
+        )
+
+    @property
+    def outputs(self) -> np.ndarray:
+        """Latest output of every unit, ``nan`` before its first one."""
+        return self._outputs.copy()
+
+    def reset(self) -> None:
+        """Empty the temporal windows and forget every output."""
+        self._angles[:] = 0.0
+        self._outputs[:] = np.nan
+        self._actuator_inputs[:] = np.nan
+        self._updated[:] = False
+        self._tick = 0
+
+    def step(self, readings: ArrayLike | None = None) -> np.ndarray:
+        """Evaluate one tick of the whole network.
+
+        Parameters
+        ----------
+        readings : numpy.typing.ArrayLike, optional
+            Reading of every sensor, in the order of :attr:`sensor_ids`, as
+            numbers between 0 and 1 inclusive. Defaults to ``None``, i.e. the
+            current ``scalar_reading`` of every sensor.
+
+        Returns
+        -------
+        numpy.ndarray
+            The latest output of every unit, see :attr:`outputs`.
+
+        Raises
+        ------
+        ValueError
+            ``readings`` has not one number between 0 and 1 per sensor.
+        """
+        if readings is None:
+            values = np.array([sensor.scalar_reading for sensor in self._sensors])
+        else:
+            values = np.asarray(readings, dtype=float)
+        if values.shape != (len(self._sensors),):
+            raise ValueError(f"readings must contain {len(self._sensors)} values")
+        if not np.all((values >= 0) & (values <= 1)):
+            raise ValueError("readings must be numbers between 0 and 1 inclusive")
+        outputs = self._outputs
+        self._updated[:] = False
+        outputs[: len(values)] = values
+        self._updated[: len(values)] = True
+        for level in self._levels:
+            self._step_level(level)
+        if len(self._actuators):
+            inputs = outputs[self._actuator_sources]
+            inputs = np.where(np.isnan(inputs), self._actuator_defaults, inputs)
+            sums = np.add.reduceat(inputs, self._actuator_starts)
+            self._actuator_inputs = sums / self._actuator_counts
+            outputs[self._actuators] = self._actuator_inputs > self._thresholds
+            self._updated[self._actuators] = True
+        self._tick += 1
+        return self.outputs
+
+    def _step_level(self, level: _Level) -> None:
+        outputs, angles = self._outputs, self._angles[level.qubits]
+        inputs = outputs[np.maximum(level.sources, 0)]
+        available = (level.sources >= 0) & ~np.isnan(inputs)
+        inputs = np.where(available, inputs, level.defaults)
+        for model, qubits in level.encoders:
+            angles[qubits] += model._encoding_angles(inputs[qubits])
+        completed = (self._tick + 1) % level.taus == 0
+        if not completed.any():
+            return
+        probabilities = excitation_probabilities(angles + level.query_angles)
+        angles[np.repeat(completed, level.sizes)] = 0.0
+        self._updated[level.units[completed]] = True
+        for burst, n, indexes, qubits in level.sampled:
+            done = completed[indexes]
+            if done.any():
+                draws = self._rng.random(qubits[done].shape)
+                bitmasks = bits_to_bitmasks(draws < probabilities[qubits[done]])
+                outputs[level.units[indexes[done]]] = burst.batch(bitmasks, n)
+        for burst, index, qubit_slice in level.expected:
+            if completed[index]:
+                outputs[level.units[index]] = burst.expected_value(
+                    probabilities[qubit_slice]
+                )
+
+    def run(self, readings: ArrayLike) -> np.ndarray:
+        """Evaluate many ticks offline.
+
+        Parameters
+        ----------
+        readings : numpy.typing.ArrayLike
+            ``(ticks, sensors)`` readings of the sensors at every tick.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(ticks, units)`` outputs of the units after every tick.
+        """
+        return np.array([self.step(tick) for tick in np.asarray(readings)])
+
+    def publish(self) -> None:
+        """Write the outputs of the last :meth:`step` with the units'
+        transports, one batch per transport.
+
+        The queries and couplings of all the units are written by the first
+        call, so that dashboards can draw the network.
+        """
+        batches: dict[Transport, dict[str, UnitFields]] = {}
+        actuators_start = len(self.units) - len(self._actuators)
+        positions = np.flatnonzero(self._updated)
+        if not self._published_metadata:
+            positions = np.arange(len(self.units))
+        for position in positions:
+            unit = self.units[position]
+            fields: UnitFields = {}
+            if self._updated[position]:
+                fields["output"] = float(self._outputs[position])
+            if self._updated[position] and position >= actuators_start:
+                fields["input"] = float(
+                    self._actuator_inputs[position - actuators_start]
+                )
+            if not self._published_metadata and isinstance(unit, QUnit):
+                fields["query"] = json.dumps(unit.query)
+            if not self._published_metadata and isinstance(unit, (QUnit, ActuatorUnit)):
+                fields["in_qunits"] = json.dumps(unit.in_qunits)
+            if fields:
+                batches.setdefault(unit.transport, {})[unit.id] = fields
+        self._published_metadata = True
+        for transport, units in batches.items():
+            transport.write_many(units)
+
+
+def compile_network(
+    units: Sequence[BaseUnit], seed: int | np.random.Generator | None = None
+) -> CompiledNetwork:
+    """Compile a network of units into a :class:`CompiledNetwork`.
+
+    The qUnits are sorted in topological order of their couplings and grouped
+    in levels, whose qUnits only depend on sensors and qUnits of earlier
+    levels. The accumulated rotation angle of every qubit of the network is
+    kept in a single array: since the models only rotate independent qubits,
+    each level is evaluated in closed form, as with
+    :meth:`qrobot.models.Model.evaluate_batch`, instead of simulating a
+    circuit per qUnit.
+
+    The network snapshots the queries and couplings of the qUnits, and it
+    samples states with its own random generator: compile the units again
+    after changing them. Every unit ticks once per step, whatever its
+    ``sampling_period``.
+
+    Parameters
+    ----------
+    units : Sequence[BaseUnit]
+        The sensors, qUnits and actuators of the network. Every input of a
+        unit must be one of them.
+    seed : int | numpy.random.Generator, optional
+        Seed of the generator sampling the decoded states. Defaults to
+        ``None`` (not seeded).
+
+    Returns
+    -------
+    CompiledNetwork
+        The compiled network, with empty temporal windows.
+
+    Raises
+    ------
+    ValueError
+        ``units`` contains the same unit twice or an unknown kind of unit, an
+        input is not one of the sensors or qUnits of ``units``, or the qUnits'
+        couplings have a cycle.
+    NotImplementedError
+        A model does not support vectorized encoding or queries.
+
+    Examples
+    --------
+    Evaluate a sensor driving a qUnit over ten ticks:
+
+    >>> network = compile_network([sensor, qunit])  # doctest: +SKIP
+    >>> network.run(np.linspace(0, 1, 10)[:, None])  # doctest: +SKIP
+    """
+    if len({unit.id for unit in units}) != len(units):
+        raise ValueError("units must not contain the same unit twice")
+    sensors = [unit for unit in units if isinstance(unit, SensorialUnit)]
+    qunits = {unit.id: unit for unit in units if isinstance(unit, QUnit)}
+    actuators = [unit for unit in units if isinstance(unit, ActuatorUnit)]
+    if len(sensors) + len(qunits) + len(actuators) != len(units):
+        raise ValueError("units must be sensors, qUnits or actuators")
+    sources = {sensor.id for sensor in sensors} | set(qunits)
+    graph: TopologicalSorter[str] = TopologicalSorter()
+    for qunit in qunits.values():
+        inputs = [unit_id for unit_id in qunit.in_qunits.values() if unit_id]
+        missing = set(inputs) - sources
+        if missing:
+            raise ValueError(f"Inputs {sorted(missing)} of {qunit.id} are missing")
+        graph.add(qunit.id, *(unit_id for unit_id in inputs if unit_id in qunits))
+    for actuator in actuators:
+        missing = set(actuator._in_qunits) - sources
+        if missing:
+            raise ValueError(f"Inputs {sorted(missing)} of {actuator.id} are missing")
+    try:
+        graph.prepare()
+    except CycleError as exc:
+        raise ValueError(f"qUnits couplings have a cycle: {exc.args[1]}") from exc
+    levels = []
+    while graph.is_active():
+        ready = sorted(graph.get_ready())
+        levels.append([qunits[unit_id] for unit_id in ready])
+        graph.done(*ready)
+    return CompiledNetwork(sensors, levels, actuators, seed)
+
+
+def run_network(
+    network: CompiledNetwork,
+    sampling_period: float | None = None,
+    ticks: int | None = None,
+    logging_config: LoggingConfig | None = None,
+) -> None:
+    """Run a compiled network periodically from the calling thread.
+
+    The units are registered, then every tick evaluates the network with the
+    current sensor readings and publishes the new outputs with the units'
+    transports. The units are unregistered when the loop ends, including on
+    interruption.
+
+    Parameters
+    ----------
+    network : CompiledNetwork
+        The network to run.
+    sampling_period : float, optional
+        The time between two ticks, in seconds. Defaults to ``None``, i.e.
+        the shortest sampling period of the units.
+    ticks : int, optional
+        Number of ticks to run. Defaults to ``None`` (run forever).
+    logging_config : LoggingConfig, optional
+        Logging configuration to apply first. Defaults to ``None``.
+    """
+    if logging_config is not None:
+        configure_logging(logging_config)
+    period = sampling_period or min(unit.sampling_period for unit in network.units)
+    scheduler = PeriodicScheduler(period)
+    for unit in network.units:
+        unit._register()
+    # Metadata cleaned by a previous run is published again
+    network._published_metadata = False
+    try:
+        tick = 0
+        while ticks is None or tick < ticks:
+            network.step()
+            network.publish()
+            tick += 1
+            if (ticks is None or tick < ticks) and not scheduler.wait():
+                network._logger.warning(
+                    f"Step overrun, {scheduler.stats().overruns} so far"
+                )
+    finally:
+        for unit in network.units:
+            unit._unregister()
@@ -0,0 +1,378 @@
+"""In-process stand-in for the Redis server, used with
+``RedisConfig(backend="memory")``."""
+
+import builtins
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Any, TypeAlias
+
+StreamEntry: TypeAlias = tuple[str, dict[str, str]]
+""" TypeAlias: Identifier and fields of a stream entry.
+"""
+
+
+class _Database:
+    """Keys, subscriptions and stream counter of a logical database."""
+
+    def __init__(self) -> None:
+        # Every command runs with the condition held; blocking reads wait on
+        # it for new messages and stream entries
+        self.condition = threading.Condition(threading.RLock())
+        self.data: dict[str, Any] = {}
+        self.subscribers: dict[str, set["MemoryPubSub"]] = {}
+        self.last_stream_id = (0, 0)
+
+
+_databases: dict[int, _Database] = {}
+_databases_lock = threading.Lock()
+
+
+def _database(number: int) -> _Database:
+    with _databases_lock:
+        return _databases.setdefault(number, _Database())
+
+
+def _encode(value: Any) -> str:
+    """Encode a value like ``redis-py`` does before sending it."""
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+@lru_cache(maxsize=256)
+def _glob(pattern: str) -> re.Pattern[str]:
+    """Compile a Redis glob pattern, whose ``\\`` escapes the next character."""
+    regex, index = "", 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            index += 1
+            regex += re.escape(pattern[index])
+        elif char == "*":
+            regex += ".*"
+        elif char == "?":
+            regex += "."
+        elif char == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            members = pattern[index + 1 : end]
+            negate = members.startswith("^")
+            # Ranges keep their meaning
+            members = "".join(
+                "-" if char == "-" else re.escape(char)
+                for char in (members[1:] if negate else members)
+            )
+            regex += "[" + ("^" if negate else "") + members + "]"
+            index = end
+        else:
+            regex += re.escape(char)
+        index += 1
+    return re.compile(regex, re.DOTALL)
+
+
+def _stream_id(entry_id: str) -> tuple[int, int]:
+    milliseconds, _, sequence = entry_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+class MemoryRedis:
+    """Client of an in-process store implementing the Redis commands used by
+    :mod:`qrobot_qunits.redis_utils`, with ``decode_responses=True``.
+
+    Clients of the same database number share their keys, channels and
+    streams, but only within the current process: units must run in the
+    process that reads their fields, e.g. driven by
+    :func:`~qrobot_qunits.runtime.run_units` or an
+    :class:`~qrobot_qunits.aio.AsyncUnitRuntime`; starting them in worker
+    processes raises a ``ValueError``. Every command is atomic, and pipelines
+    run their commands atomically too.
+
+    Parameters
+    ----------
+    database : int, optional
+        Logical database number. Defaults to ``0``.
+    """
+
+    def __init__(self, database: int = 0) -> None:
+        self._database = _database(database)
+
+    def _value(self, kind: type, name: str) -> Any:
+        """Value of a key, or ``None`` when it is missing or of another kind."""
+        value = self._database.data.get(name)
+        return value if isinstance(value, kind) else None
+
+    def ping(self) -> bool:
+        return True
+
+    def flushdb(self) -> bool:
+        with self._database.condition:
+            self._database.data.clear()
+        return True
+
+    def keys(self, pattern: str = "*") -> list[str]:
+        return list(self.scan_iter(match=pattern))
+
+    def scan_iter(
+        self, match: str | None = None, count: int | None = None
+    ) -> Iterator[str]:
+        regex = _glob(match or "*")
+        with self._database.condition:
+            keys = list(self._database.data)
+        return (key for key in keys if regex.fullmatch(key))
+
+    def delete(self, *names: str) -> int:
+        with self._database.condition:
+            return sum(
+                self._database.data.pop(name, None) is not None for name in names
+            )
+
+    def set(self, name: str, value: Any) -> bool:
+        with self._database.condition:
+            self._database.data[name] = _encode(value)
+        return True
+
+    def get(self, name: str) -> str | None:
+        with self._database.condition:
+            value: str | None = self._value(str, name)
+            return value
+
+    def mset(self, mapping: Mapping[str, Any]) -> bool:
+        with self._database.condition:
+            for name, value in mapping.items():
+                self._database.data[name] = _encode(value)
+        return True
+
+    def mget(self, keys: Iterable[str], *args: str) -> list[str | None]:
+        with self._database.condition:
+            return [self._value(str, name) for name in [*keys, *args]]
+
+    def hset(
+        self,
+        name: str,
+        key: str | None = None,
+        value: Any = None,
+        mapping: Mapping[str, Any] | None = None,
+    ) -> int:
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        with self._database.condition:
+            fields = self._value(dict, name)
+            if fields is None:
+                fields = self._database.data[name] = {}
+            added = len(items.keys() - fields.keys())
+            fields.update((field, _encode(value)) for field, value in items.items())
+            return added
+
+    def hget(self, name: str, key: str) -> str | None:
+        with self._database.condition:
+            value: str | None = (self._value(dict, name) or {}).get(key)
+            return value
+
+    def hgetall(self, name: str) -> dict[str, str]:
+        with self._database.condition:
+            return dict(self._value(dict, name) or {})
+
+    def hdel(self, name: str, *keys: str) -> int:
+        with self._database.condition:
+            fields = self._value(dict, name)
+            if fields is None:
+                return 0
+            deleted = sum(fields.pop(key, None) is not None for key in keys)
+            if not fields:
+                del self._database.data[name]
+            return deleted
+
+    def sadd(self, name: str, *values: Any) -> int:
+        with self._database.condition:
+            members = self._value(set, name)
+            if members is None:
+                members = self._database.data[name] = set()
+            encoded = {_encode(value) for value in values}
+            added = len(encoded - members)
+            members |= encoded
+            return added
+
+    def srem(self, name: str, *values: Any) -> int:
+        with self._database.condition:
+            members = self._value(set, name)
+            if members is None:
+                return 0
+            encoded = {_encode(value) for value in values}
+            removed = len(encoded & members)
+            members -= encoded
+            if not members:
+                del self._database.data[name]
+            return removed
+
+    def smembers(self, name: str) -> builtins.set[str]:
+        with self._database.condition:
+            return set(self._value(set, name) or ())
+
+    def publish(self, channel: str, message: Any) -> int:
+        with self._database.condition:
+            subscribers = self._database.subscribers.get(channel, set())
+            for subscriber in subscribers:
+                subscriber._messages.append(
+                    {"type": "message", "channel": channel, "data": _encode(message)}
+                )
+            self._database.condition.notify_all()
+            return len(subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> "MemoryPubSub":
+        return MemoryPubSub(self._database)
+
+    def xadd(
+        self,
+        name: str,
+        fields: Mapping[str, Any],
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> str:
+        database = self._database
+        with database.condition:
+            entries = self._value(list, name)
+            if entries is None:
+                entries = database.data[name] = []
+            milliseconds = max(time.time_ns() // 1_000_000, database.last_stream_id[0])
+            sequence = 0
+            if milliseconds == database.last_stream_id[0]:
+                sequence = database.last_stream_id[1] + 1
+            database.last_stream_id = (milliseconds, sequence)
+            entry_id = f"{milliseconds}-{sequence}"
+            entries.append(
+                (entry_id, {key: _encode(value) for key, value in fields.items()})
+            )
+            if maxlen is not None:
+                del entries[:-maxlen]
+            database.condition.notify_all()
+            return entry_id
+
+    def xrevrange(
+        self, name: str, max: str = "+", min: str = "-", count: int | None = None
+    ) -> list[StreamEntry]:
+        with self._database.condition:
+            entries = list(reversed(self._value(list, name) or []))
+        return entries[:count]
+
+    def xread(
+        self,
+        streams: Mapping[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[list[Any]]:
+        deadline = None if block is None else time.monotonic() + block / 1000
+        with self._database.condition:
+            while True:
+                result = []
+                for name, last_id in streams.items():
+                    last = _stream_id(last_id)
+                    entries = [
+                        entry
+                        for entry in self._value(list, name) or []
+                        if _stream_id(entry[0]) > last
+                    ][:count]
+                    if entries:
+                        result.append([name, entries])
+                if result or deadline is None:
+                    return result
+                # A zero block waits forever
+                remaining = deadline - time.monotonic() if block else None
+                if remaining is not None and remaining <= 0:
+                    return result
+                self._database.condition.wait(remaining)
+
+    def pipeline(self, transaction: bool = True) -> "MemoryPipeline":
+        return MemoryPipeline(self)
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryPipeline:
+    """Queue of :class:`MemoryRedis` commands, run atomically by
+    :meth:`execute`."""
+
+    def __init__(self, client: MemoryRedis) -> None:
+        self._client = client
+        self._commands: list[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]]
+        self._commands = []
+
+    def __getattr__(self, name: str) -> Callable[..., "MemoryPipeline"]:
+        command = getattr(self._client, name)
+
+        def queue(*args: Any, **kwargs: Any) -> "MemoryPipeline":
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        """Run the queued commands and return their results."""
+        commands, self._commands = self._commands, []
+        with self._client._database.condition:
+            return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class MemoryPubSub:
+    """Subscription to :class:`MemoryRedis` channels.
+
+    Subscription confirmations are never returned, as with
+    ``ignore_subscribe_messages=True``.
+    """
+
+    def __init__(self, database: _Database) -> None:
+        self._database = database
+        self._messages: deque[dict[str, str]] = deque()
+
+    def subscribe(self, *channels: str) -> None:
+        with self._database.condition:
+            for channel in channels:
+                self._database.subscribers.setdefault(channel, set()).add(self)
+
+    def unsubscribe(self, *channels: str) -> None:
+        with self._database.condition:
+            for channel in channels or list(self._database.subscribers):
+                self._database.subscribers.get(channel, set()).discard(self)
+
+    def get_message(
+        self, ignore_subscribe_messages: bool = False, timeout: float | None = 0.0
+    ) -> dict[str, str] | None:
+        with self._database.condition:
+            if not self._messages and (timeout is None or timeout > 0):
+                self._database.condition.wait_for(lambda: self._messages, timeout)
+            return self._messages.popleft() if self._messages else None
+
+    def close(self) -> None:
+        self.unsubscribe()
+
+
+class AsyncMemoryRedis:
+    """Asyncio version of :class:`MemoryRedis`, providing the pipelines
+    used by :mod:`qrobot_qunits.aio`.
+
+    Parameters
+    ----------
+    database : int, optional
+        Logical database number. Defaults to ``0``.
+    """
+
+    def __init__(self, database: int = 0) -> None:
+        self._client = MemoryRedis(database)
+
+    def pipeline(self, transaction: bool = True) -> "AsyncMemoryPipeline":
+        return AsyncMemoryPipeline(self._client)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncMemoryPipeline(MemoryPipeline):
+    """Asyncio version of :class:`MemoryPipeline`."""
+
+    async def execute(self) -> list[Any]:  # type: ignore[override]
+        """Run the queued commands and return their results."""
+        return super().execute()
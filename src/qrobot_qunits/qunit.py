@@ -1,13 +1,19 @@
 import json
-from collections.abc import Generator
-import redis
+from collections.abc import Generator, Mapping
+from ctypes import addressof, c_char, c_double, memmove
+from multiprocessing.sharedctypes import RawArray
 
+import numpy as np
+
+from qrobot.backends.bits import bitmask_to_label
 from qrobot.bursts import Burst
 from qrobot.logger import LoggingConfig
 from qrobot.models import Model
-from . import redis_utils
 from .base import BaseUnit
-from .redis_utils import RedisConfig, RedisWriteError
+from .redis_utils import RedisConfig, UnitFields
+from .scheduler import OverrunPolicy
+from .seqlock import MAX_UNIT_ID_LENGTH, SeqLock
+from .transport import Transport
 
 
 class QUnit(BaseUnit):
@@ -37,6 +43,20 @@ class QUnit(BaseUnit):
         Default input vector of scalar values to use as default value
         when qunit does not have an available one.
         Defaults to ``model.n*[0.0]``
+    seed : int, optional
+        Seed of the model's random generator, which makes the qUnit's
+        decoded states reproducible. Defaults to ``None`` (not seeded)
+    expected_output : bool, optional
+        Whether to publish the exact expected burst of each temporal window
+        (see :meth:`qrobot.models.Model.expected_burst`) instead of the burst
+        of a single decoded state. No state is published in this case.
+        Defaults to ``False``
+    overrun_policy : {"skip", "catch_up"}, optional
+        What to do with the ticks missed when a task takes longer than the
+        sampling period. Defaults to ``"skip"``
+    transport : Transport, optional
+        Where the unit writes its fields and reads its inputs. Defaults to
+        ``None``, i.e. Redis over ``redis_config``
 
     Attributes
     ----------
@@ -53,8 +73,12 @@ class QUnit(BaseUnit):
     default_input: List[float]
         Default input vector of scalar values to use as default value
         when qunit does not have an available one
+    expected_output : bool
+        Whether the qUnit publishes expected bursts instead of sampled ones
     """
 
+    supports_step = True
+
     def __init__(
         self,
         name: str,
@@ -66,13 +90,27 @@ class QUnit(BaseUnit):
         default_input: list[float] | None = None,
         redis_config: RedisConfig | None = None,
         logging_config: LoggingConfig | None = None,
+        seed: int | None = None,
+        expected_output: bool = False,
+        overrun_policy: OverrunPolicy = "skip",
+        transport: Transport | None = None,
     ) -> None:
         # Call the BaseUnit constructor
-        super().__init__(name, sampling_period, redis_config, logging_config)
+        super().__init__(
+            name,
+            sampling_period,
+            redis_config,
+            logging_config,
+            overrun_policy,
+            transport,
+        )
 
         # Store the qUnits name and properties
         self.model = model
         self.burst = burst
+        if seed is not None:
+            self.model.seed(seed)
+        self.expected_output = expected_output
         self.default_input = self.model._target_vector_check(
             default_input if default_input is not None else [0.0] * model.n
         )
@@ -82,13 +120,26 @@ class QUnit(BaseUnit):
             query if query is not None else [0.0] * self.model.n
         )
 
-        # Initialize multiprocessing variables
+        # Initialize the variables shared with the worker process, guarded
+        # by a sequence lock whose version counts query and couplings changes
+        self._metadata_lock = SeqLock()
         # - Query array variable
-        self._query = self._multiproc_manager.list(query)
-        # - Output unit dictionary
-        self._in_qunits = self._multiproc_manager.dict(in_qunits or {})
+        self._query = RawArray(c_double, query)
+        # - Input qUnit id of every dimension, as fixed-size byte slots
+        self._in_qunits = RawArray(c_char, self.model.n * MAX_UNIT_ID_LENGTH)
+        for dim, qunit_id in (in_qunits or {}).items():
+            self._write_coupling(self.model._dim_index_check(dim), qunit_id)
+
+        # Worker process variables
+        self._inputs_cache: tuple[int, list[int], list[str]] | None = None
+        # - Metadata version last published on Redis since the unit was
+        #   registered
+        self._published_version = -1
         # - Time window index
-        self._t_idx = self._multiproc_manager.Value("i", 0)
+        self._t_idx = 0
+        # - Input vectors of the current temporal window, encoded all at once
+        #   at its end
+        self._window = np.zeros((model.tau, model.n))
 
         # Log properties
         self._logger.debug(f"Properties: {self}")
@@ -110,7 +161,7 @@ class QUnit(BaseUnit):
         list
             The query target state array in the computational basis
         """
-        return list(self._query)
+        return self._metadata_lock.read(lambda: list(self._query))
 
     @query.setter
     def query(self, query: list[float]) -> None:
@@ -124,10 +175,11 @@ class QUnit(BaseUnit):
         # Check arguments
         query = self.model._target_vector_check(query)
         # Update accumulator
-        self._logger.debug(f"Changing query from {self._query} to {query}")
-        for idx, value in enumerate(query):
-            self._query[idx] = value
-        self._logger.debug(f"_query={self._query}")
+        self._logger.debug(f"Changing query from {self.query} to {query}")
+        with self._metadata_lock.write():
+            for idx, value in enumerate(query):
+                self._query[idx] = value
+        self._logger.debug(f"_query={self.query}")
 
     @property
     def in_qunits(self) -> dict[int, str | None]:
@@ -138,14 +190,27 @@ class QUnit(BaseUnit):
         dict
             The current output ``{dim : qunit_id}`` couplings dictionary
         """
+        return self._metadata_lock.read(self._read_couplings)
+
+    def _read_couplings(self) -> dict[int, str | None]:
+        raw = self._in_qunits.raw
         in_qunits: dict[int, str | None] = {}
         for dim in range(self.model.n):
-            try:
-                in_qunits[dim] = self._in_qunits[dim]
-            except KeyError:
-                in_qunits[dim] = None
+            slot = raw[dim * MAX_UNIT_ID_LENGTH : (dim + 1) * MAX_UNIT_ID_LENGTH]
+            qunit_id = slot.rstrip(b"\0").decode()
+            in_qunits[dim] = qunit_id or None
         return in_qunits
 
+    def _write_coupling(self, dim: int, qunit_id: str) -> None:
+        encoded = qunit_id.encode()
+        if not 0 < len(encoded) <= MAX_UNIT_ID_LENGTH:
+            raise ValueError(
+                f"qunit_id must be between 1 and {MAX_UNIT_ID_LENGTH} bytes long"
+            )
+        slot = addressof(self._in_qunits) + dim * MAX_UNIT_ID_LENGTH
+        with self._metadata_lock.write():
+            memmove(slot, encoded.ljust(MAX_UNIT_ID_LENGTH, b"\0"), MAX_UNIT_ID_LENGTH)
+
     @property
     def input_vector(self) -> list[float]:
         """The current input vector of the unit
@@ -155,18 +220,43 @@ class QUnit(BaseUnit):
         list
             The current input vector
         """
+        qunit_ids = self._input_ids()
+        # All the coupled outputs are read in a single round trip
+        values = self.transport.read(qunit_ids, "output")
+        return self._input_vector(dict(zip(qunit_ids, values)))
+
+    def _input_vector(self, inputs: Mapping[str, str | None]) -> list[float]:
+        """Input vector from the latest outputs of the input qUnits."""
         # Inputs received from Redis must not alter the configured fallback
         # values used by later temporal windows.
         input_vector = self.default_input.copy()
-        for dim, qunit_id in self._in_qunits.items():
-            _r = redis_utils.get_redis(self.redis_config)
-            val = _r.get(qunit_id + " output")
+        for dim, qunit_id in zip(*self._inputs()):
+            val = inputs.get(qunit_id)
             if val is not None:
                 input_vector[dim] = float(val)
             else:
                 self._logger.info(f"Unable to read {qunit_id} input")
         return input_vector
 
+    def _inputs(self) -> tuple[list[int], list[str]]:
+        """Coupled dimensions and the ids of their input qUnits.
+
+        They are only fetched again when the couplings change.
+        """
+        version = self._metadata_lock.version
+        if self._inputs_cache is None or self._inputs_cache[0] != version:
+            couplings = {
+                dim: qunit_id
+                for dim, qunit_id in self.in_qunits.items()
+                if qunit_id is not None
+            }
+            dims = sorted(couplings)
+            self._inputs_cache = (version, dims, [couplings[dim] for dim in dims])
+        return self._inputs_cache[1], self._inputs_cache[2]
+
+    def _input_ids(self) -> list[str]:
+        return self._inputs()[1]
+
     def set_input(self, dim: int, qunit_id: str) -> None:
         """Set a new input qunit for the desired dimension
 
@@ -183,8 +273,8 @@ class QUnit(BaseUnit):
         self._logger.debug(
             f"Changing dim {dim} input from " + f"{self.in_qunits[dim]} to {qunit_id}"
         )
-        self._in_qunits[dim] = qunit_id
-        self._logger.debug(f"_in_qunits={self._in_qunits}")
+        self._write_coupling(dim, qunit_id)
+        self._logger.debug(f"_in_qunits={self.in_qunits}")
 
     def get_burst_output(self) -> float | None:
         """Get the latest burst output from the qUnit
@@ -194,60 +284,53 @@ class QUnit(BaseUnit):
         float
             The latest burst output written by the unit on the Redis database
         """
-        global_status = redis_utils.redis_status(self.redis_config)
-        out = global_status.get(f"{self.id} output", None)
+        (out,) = self.transport.read([self.id], "output")
         return float(out) if out is not None else None
 
+    def _register(self) -> None:
+        super()._register()
+        # Metadata deleted by a previous stop or flush is written again
+        self._published_version = -1
+
     def _clean_redis(self) -> None:
         """Clean all the redis entries created by the unit when the loop stops."""
-        _r = redis_utils.get_redis(self.redis_config)
-        _r.delete(self.id + " output")
-        _r.delete(self.id + " state")
-        _r.delete(self.id + " query")
-        _r.delete(self.id + " in_qunits")
-
-    def _unit_task(self) -> None:
-        """Single iteration of the processing loop."""
+        self.transport.delete(self.id, ["output", "state", "query", "in_qunits"])
+
+    def _step(self, inputs: Mapping[str, str | None]) -> UnitFields:
+        """Store the inputs in the temporal window, and process the window
+        once it is complete."""
         # "_t_idx" is the event index of the temporal window
-        self._logger.debug(
-            f"Temporal window event {self._t_idx.value + 1}/{self.model.tau}"
-        )
+        self._logger.debug(f"Temporal window event {self._t_idx + 1}/{self.model.tau}")
         # Get input
-        input_vector = self.input_vector
+        input_vector = self._input_vector(inputs)
         self._logger.debug(f"input_vector={input_vector}")
-        # Loop through the dimensions to encode data
-        for dim in range(self.model.n):
-            self.model.encode(input_vector[dim], dim)
+        # Store the input vector in the temporal window
+        self._window[self._t_idx] = input_vector
         # Wait for the next input in the time window
-        self._t_idx.value += 1
-        # If at the end of the time window
-        if self._t_idx.value == self.model.tau:
-            # Apply the query
-            self._logger.debug(f"Querying for state {self._query}")
-            self.model.query(self.query)
-            # Decode
-            out_state = self.model.decode()
-            self._logger.debug(f"Output state = {out_state}")
-            # Write output on Redis database
-            self._logger.debug("Opening a connection to redis...")
-            _r = redis_utils.get_redis(self.redis_config)
-            self._logger.debug(f"Redis connected: {_r}")
-            try:
-                written = _r.mset(
-                    {
-                        self.id + " output": self.burst(out_state),
-                        self.id + " state": str(out_state),
-                        self.id + " query": json.dumps(self.query),
-                        self.id + " in_qunits": json.dumps(self.in_qunits),
-                    }
-                )
-            except redis.RedisError as exc:
-                raise RedisWriteError(
-                    f"Unable to write qUnit {self.id} state to Redis"
-                ) from exc
-            if not written:
-                raise RedisWriteError(f"Redis did not write qUnit {self.id} state")
-            # Initialize new temporal window
-            self._logger.debug("Initializing a new temporal window")
-            self.model.clear()
-            self._t_idx.value = 0
+        self._t_idx += 1
+        if self._t_idx < self.model.tau:
+            return {}
+        # At the end of the time window, encode it and apply the query
+        self._logger.debug(f"Querying for state {self.query}")
+        self.model.bind_window(self._window, self.query)
+        output: UnitFields = {}
+        if self.expected_output:
+            # Publish the exact expected burst, without decoding a state
+            output["output"] = self.model.expected_burst(self.burst)
+        else:
+            # Decode as a bitmask, only converted to a label for Redis
+            out_state = self.model.decode_bitmask()
+            state_label = bitmask_to_label(out_state, self.model.n)
+            self._logger.debug(f"Output state = {state_label}")
+            output["output"] = self.burst._value(out_state, self.model.n)
+            output["state"] = state_label
+        # Query and couplings are only published when they change
+        version = self._metadata_lock.version
+        if version != self._published_version:
+            output["query"] = json.dumps(self.query)
+            output["in_qunits"] = json.dumps(self.in_qunits)
+            self._published_version = version
+        # Initialize new temporal window
+        self._logger.debug("Initializing a new temporal window")
+        self._t_idx = 0
+        return output
@@ -1,10 +1,18 @@
 """Redis configuration and operations used by the qUnits extension."""
 
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any, Literal, TypeAlias, cast
 
 import redis
 
 from qrobot.logger import get_logger
+from .memory import MemoryRedis
 
 
 @dataclass(frozen=True)
@@ -19,19 +27,115 @@ class RedisConfig:
         Redis server port. Defaults to ``6379``.
     database : int
         Redis logical database number. Defaults to ``0``.
+    max_connections : int | None
+        Maximum number of connections kept by the process-wide connection
+        pool of this configuration. Defaults to ``None`` (unbounded).
+    socket_timeout : float | None
+        Timeout in seconds of Redis commands. Defaults to ``None`` (no
+        timeout).
+    socket_connect_timeout : float | None
+        Timeout in seconds to open a connection. Defaults to ``None`` (use
+        ``socket_timeout``).
+    schema : {"keys", "hash"}
+        Storage layout of the units' data. With ``"keys"`` every field is a
+        string key named ``"<unit id> <field>"``; with ``"hash"`` every unit
+        owns the hash :func:`unit_key` and live unit ids are kept in the
+        :data:`UNITS_KEY` set. Defaults to ``"keys"``.
+    events : {None, "pubsub", "stream"}
+        How units announce new outputs. With ``"pubsub"`` outputs are
+        published on the :func:`output_channel` of their unit; with
+        ``"stream"`` they are appended to a stream with the same name, which
+        also keeps a replayable log of bursts. Units with inputs then run as
+        soon as one of their inputs publishes, instead of polling Redis every
+        sampling period. Defaults to ``None`` (outputs are not announced and
+        units are periodic).
+    stream_maxlen : int
+        Approximate number of outputs kept in each unit stream when
+        ``events`` is ``"stream"``. Defaults to ``1000``.
+    backend : {"redis", "memory"}
+        Where the data is stored. With ``"memory"`` it is kept by an
+        in-process :class:`~qrobot_qunits.memory.MemoryRedis` store instead
+        of a Redis server, and ``host``, ``port`` and the connection settings
+        are ignored, e.g. for tests and benchmarks without any service. Units
+        on this backend cannot be started in worker processes. Defaults to
+        ``"redis"``.
     """
 
     host: str = "localhost"
     port: int = 6379
     database: int = 0
+    max_connections: int | None = None
+    socket_timeout: float | None = None
+    socket_connect_timeout: float | None = None
+    schema: Literal["keys", "hash"] = "keys"
+    events: Literal["pubsub", "stream"] | None = None
+    stream_maxlen: int = 1000
+    backend: Literal["redis", "memory"] = "redis"
+
+    def __post_init__(self) -> None:
+        if self.schema not in ("keys", "hash"):
+            raise ValueError(
+                f"Unknown Redis schema {self.schema!r}, choose 'keys' or 'hash'"
+            )
+        if self.events not in (None, "pubsub", "stream"):
+            raise ValueError(
+                f"Unknown Redis events {self.events!r}, choose 'pubsub' or 'stream'"
+            )
+        if self.backend not in ("redis", "memory"):
+            raise ValueError(
+                f"Unknown Redis backend {self.backend!r}, choose 'redis' or 'memory'"
+            )
+
+
+UNITS_KEY = "qrobot:units"
+""" str: Set of the live unit ids, used by the ``"hash"`` schema.
+"""
+
+UNIT_KEY_PREFIX = "qrobot:unit:"
+""" str: Prefix of the unit hashes, used by the ``"hash"`` schema.
+"""
+
+OUTPUT_CHANNEL_PREFIX = "qrobot:output:"
+""" str: Prefix of the channels and streams announcing unit outputs.
+"""
+
+UNIT_FIELDS = ("class", "input", "in_qunits", "output", "query", "state", "timing")
+""" tuple[str, ...]: Fields that units store on Redis.
+"""
 
 
 class RedisWriteError(RuntimeError):
     """Raised when a qUnit cannot persist its state to Redis."""
 
 
+UnitFields: TypeAlias = dict[str, str | float]
+""" TypeAlias: Field values of a unit, e.g. ``{"output": 1.0}``.
+"""
+
+
+_clients: dict[RedisConfig, redis.Redis] = {}
+_clients_lock = threading.Lock()
+
+
+def _reset_clients() -> None:
+    # Connections inherited from the parent process must not be shared with
+    # it, so a forked child starts with an empty cache and its own pools.
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients)
+
+
 def get_redis(config: RedisConfig | None = None) -> redis.Redis:
-    """Return a Redis client with decoded string responses.
+    """Return the Redis client of this process for a configuration.
+
+    Clients are cached per process and per configuration, so every call with
+    equal settings shares the same connection pool instead of opening new
+    TCP connections. The cache is emptied in children created with ``fork``;
+    processes started with ``spawn`` build their own cache on first use.
 
     Parameters
     ----------
@@ -42,38 +146,396 @@ def get_redis(config: RedisConfig | None = None) -> redis.Redis:
     -------
     redis.Redis
         A lazily connected ``redis-py`` client configured with
-        ``decode_responses=True``.
+        ``decode_responses=True``, or a
+        :class:`~qrobot_qunits.memory.MemoryRedis` client with the
+        ``"memory"`` backend.
     """
     settings = config or RedisConfig()
-    return redis.Redis(
-        host=settings.host,
-        port=settings.port,
-        db=settings.database,
-        decode_responses=True,
-    )
+    client = _clients.get(settings)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(settings)
+            if client is None and settings.backend == "memory":
+                # The store implements the subset of the client used here
+                client = _clients[settings] = cast(
+                    redis.Redis, MemoryRedis(settings.database)
+                )
+            elif client is None:
+                client = _clients[settings] = redis.Redis(
+                    host=settings.host,
+                    port=settings.port,
+                    db=settings.database,
+                    max_connections=settings.max_connections,
+                    socket_timeout=settings.socket_timeout,
+                    socket_connect_timeout=settings.socket_connect_timeout,
+                    decode_responses=True,
+                )
+    return client
+
+
+def unit_key(unit_id: str) -> str:
+    """Return the name of the hash holding a unit's fields (``"hash"`` schema).
+
+    Parameters
+    ----------
+    unit_id : str
+        The unit identifier.
+
+    Returns
+    -------
+    str
+        The Redis key of the unit's hash.
+    """
+    return UNIT_KEY_PREFIX + unit_id
+
+
+def output_channel(unit_id: str) -> str:
+    """Return the channel (or stream) announcing the outputs of a unit.
+
+    Parameters
+    ----------
+    unit_id : str
+        The unit identifier.
+
+    Returns
+    -------
+    str
+        The name of the Redis channel, or stream, of the unit's outputs.
+    """
+    return OUTPUT_CHANNEL_PREFIX + unit_id
 
 
-def redis_status(config: RedisConfig | None = None) -> dict[str, str]:
+@lru_cache(maxsize=1024)
+def _field_keys(unit_ids: tuple[str, ...], field: str) -> list[str]:
+    """Flat keys of a field for many units, built once per unit set."""
+    return [f"{unit_id} {field}" for unit_id in unit_ids]
+
+
+def write_unit(
+    config: RedisConfig, unit_id: str, fields: Mapping[str, str | float]
+) -> bool:
+    """Write the fields of a unit in a single Redis command.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    unit_id : str
+        The unit identifier.
+    fields : Mapping[str, str | float]
+        Field values to write, e.g. ``{"output": 1.0}``.
+
+    Returns
+    -------
+    bool
+        Whether Redis acknowledged the write.
+
+    Raises
+    ------
+    redis.RedisError
+        The write failed.
+
+    Notes
+    -----
+    When ``config.events`` is set and ``fields`` contains an ``"output"``,
+    the output is also announced, in the same round trip as the write.
+    """
+    client = get_redis(config)
+    if config.events is None or "output" not in fields:
+        written = _queue_write(client, config, unit_id, fields)
+    else:
+        # The output is announced in the same round trip as the write
+        pipeline = client.pipeline(transaction=False)
+        _queue_write(pipeline, config, unit_id, fields)
+        written = pipeline.execute()[0]
+    # HSET returns the number of new fields, which is 0 on updates
+    return config.schema == "hash" or bool(written)
+
+
+def write_units(config: RedisConfig, units: Mapping[str, UnitFields]) -> None:
+    """Write the fields of many units in a single round trip.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    units : Mapping[str, UnitFields]
+        Field values to write for every unit id.
+
+    Raises
+    ------
+    redis.RedisError
+        The write failed.
+    """
+    if not units:
+        return
+    pipeline = get_redis(config).pipeline(transaction=False)
+    for unit_id, fields in units.items():
+        _queue_write(pipeline, config, unit_id, fields)
+    pipeline.execute()
+
+
+def _queue_write(
+    commands: Any, config: RedisConfig, unit_id: str, fields: Mapping[str, str | float]
+) -> Any:
+    """Send, or queue on a pipeline, the commands writing some fields of a unit
+    and announcing its output.
+
+    ``commands`` may be a synchronous or an asyncio client or pipeline. The
+    result of the write command is returned.
+    """
+    if config.schema == "hash":
+        written = commands.hset(unit_key(unit_id), mapping=dict(fields))
+    else:
+        written = commands.mset(
+            {f"{unit_id} {key}": value for key, value in fields.items()}
+        )
+    if config.events is not None and "output" in fields:
+        channel = output_channel(unit_id)
+        if config.events == "stream":
+            commands.xadd(
+                channel,
+                {"output": fields["output"]},
+                maxlen=config.stream_maxlen,
+                approximate=True,
+            )
+        else:
+            commands.publish(channel, fields["output"])
+    return written
+
+
+def read_units_field(
+    config: RedisConfig, unit_ids: Sequence[str], field: str
+) -> list[str | None]:
+    """Read the same field of many units in a single round trip.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    unit_ids : Sequence[str]
+        The unit identifiers.
+    field : str
+        The field to read, e.g. ``"output"``.
+
+    Returns
+    -------
+    list[str | None]
+        The value of each unit's field, ``None`` when it is not set.
+    """
+    if not unit_ids:
+        return []
+    client = get_redis(config)
+    if config.schema == "hash":
+        pipeline = client.pipeline(transaction=False)
+        _queue_read(pipeline, config, unit_ids, field)
+        return _read_results(config, pipeline.execute())
+    values = client.mget(_field_keys(tuple(unit_ids), field))
+    return [None if value is None else str(value) for value in values]
+
+
+def _queue_read(
+    pipeline: Any, config: RedisConfig, unit_ids: Sequence[str], field: str
+) -> None:
+    """Queue on a synchronous or asyncio pipeline the commands reading the
+    same field of many units."""
+    if config.schema == "hash":
+        for unit_id in unit_ids:
+            pipeline.hget(unit_key(unit_id), field)
+    else:
+        pipeline.mget(_field_keys(tuple(unit_ids), field))
+
+
+def _read_results(config: RedisConfig, results: list[Any]) -> list[str | None]:
+    """Values read by the commands of :func:`_queue_read`."""
+    values = results if config.schema == "hash" else results[0]
+    return [None if value is None else str(value) for value in values]
+
+
+def delete_unit_fields(
+    config: RedisConfig, unit_id: str, fields: Iterable[str]
+) -> None:
+    """Remove some fields of a unit.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    unit_id : str
+        The unit identifier.
+    fields : Iterable[str]
+        The fields to remove.
+    """
+    fields = list(fields)
+    client = get_redis(config)
+    if config.schema == "hash":
+        client.hdel(unit_key(unit_id), *fields)
+    else:
+        client.delete(*(f"{unit_id} {field}" for field in fields))
+
+
+def register_unit(config: RedisConfig, unit_id: str, class_name: str) -> None:
+    """Publish a started unit and its class.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    unit_id : str
+        The unit identifier.
+    class_name : str
+        The name of the unit's class.
+    """
+    client = get_redis(config)
+    if config.schema == "hash":
+        pipeline = client.pipeline(transaction=False)
+        pipeline.hset(unit_key(unit_id), "class", class_name)
+        pipeline.sadd(UNITS_KEY, unit_id)
+        pipeline.execute()
+    else:
+        client.set(f"{unit_id} class", class_name)
+
+
+def unregister_unit(config: RedisConfig, unit_id: str) -> None:
+    """Remove a stopped unit, together with every field left in the ``"hash"``
+    schema and its output stream.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and storage schema.
+    unit_id : str
+        The unit identifier.
+    """
+    client = get_redis(config)
+    pipeline = client.pipeline(transaction=False)
+    if config.schema == "hash":
+        pipeline.delete(unit_key(unit_id))
+        pipeline.srem(UNITS_KEY, unit_id)
+    else:
+        pipeline.delete(f"{unit_id} class")
+    if config.events == "stream":
+        pipeline.delete(output_channel(unit_id))
+    pipeline.execute()
+
+
+def units_status(config: RedisConfig | None = None) -> dict[str, dict[str, str]]:
+    """Return the fields of every unit stored in a Redis database.
+
+    Parameters
+    ----------
+    config : RedisConfig | None
+        Connection settings and storage schema of the database to inspect.
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        Mapping of every unit id to its ``{field: value}`` mapping. With the
+        ``"keys"`` schema, keys that are not unit fields are ignored.
+    """
+    settings = config or RedisConfig()
+    if settings.schema == "hash":
+        return _hash_units(settings, None)
+    units: dict[str, dict[str, str]] = {}
+    for key, value in redis_status(settings).items():
+        unit_id, _, field = key.rpartition(" ")
+        if unit_id and field in UNIT_FIELDS:
+            units.setdefault(unit_id, {})[field] = value
+    return units
+
+
+def _hash_units(
+    config: RedisConfig, unit_ids: Sequence[str] | None
+) -> dict[str, dict[str, str]]:
+    """Read the hashes of some units, or of all the live ones, at once."""
+    client = get_redis(config)
+    if unit_ids is None:
+        unit_ids = sorted(str(unit_id) for unit_id in client.smembers(UNITS_KEY))
+    pipeline = client.pipeline(transaction=False)
+    for unit_id in unit_ids:
+        pipeline.hgetall(unit_key(unit_id))
+    return {
+        unit_id: fields
+        for unit_id, fields in zip(unit_ids, pipeline.execute())
+        if fields
+    }
+
+
+SCAN_COUNT = 1000
+""" int: Number of keys Redis is asked to inspect per ``SCAN`` call.
+"""
+
+MGET_BATCH_SIZE = 500
+""" int: Maximum number of keys read by each pipelined ``MGET``.
+"""
+
+
+def redis_status(
+    config: RedisConfig | None = None,
+    unit_id: str | None = None,
+    suffix: str | None = None,
+    match: str | None = None,
+) -> dict[str, str]:
     """Return the current key/value status of a Redis database.
 
+    Keys are scanned with a large ``COUNT`` and their values are read with
+    ``MGET`` batches sent in a single pipeline, so a snapshot costs a few
+    round trips instead of one per key.
+
     Parameters
     ----------
     config : RedisConfig | None
         Connection settings for the database to inspect.
+    unit_id : str | None
+        Only return the keys of the unit with this identifier.
+    suffix : str | None
+        Only return the keys with this suffix, e.g. ``"output"``.
+    match : str | None
+        Glob-style pattern of the keys to return, overriding ``unit_id`` and
+        ``suffix``.
 
     Returns
     -------
     dict[str, str]
-        Mapping of every existing key to its decoded string value. Keys deleted
-        while scanning are omitted.
+        Mapping of every selected key to its decoded string value. Keys deleted
+        while scanning are omitted. With the ``"hash"`` schema, unit fields
+        are returned under the same ``"<unit id> <field>"`` keys as with the
+        ``"keys"`` schema.
     """
-    client = get_redis(config)
-    status: dict[str, str] = {}
-    for key in client.scan_iter():
-        value = client.get(key)
-        if value is not None:
-            status[str(key)] = str(value)
-    return status
+    settings = config or RedisConfig()
+    if settings.schema == "hash":
+        units = _hash_units(settings, None if unit_id is None else [unit_id])
+        status = {
+            f"{unit} {field}": value
+            for unit, fields in units.items()
+            for field, value in fields.items()
+            if suffix is None or field == suffix
+        }
+        if match is not None:
+            status = {
+                key: val for key, val in status.items() if fnmatchcase(key, match)
+            }
+        return status
+    if match is None and (unit_id is not None or suffix is not None):
+        # Keys are named "<unit id> <suffix>"
+        match = " ".join(
+            "*" if part is None else _escape_pattern(part) for part in (unit_id, suffix)
+        )
+    client = get_redis(settings)
+    # SCAN may return a key more than once
+    keys = list(dict.fromkeys(client.scan_iter(match=match or "*", count=SCAN_COUNT)))
+    pipeline = client.pipeline(transaction=False)
+    for start in range(0, len(keys), MGET_BATCH_SIZE):
+        pipeline.mget(keys[start : start + MGET_BATCH_SIZE])
+    values = [value for batch in pipeline.execute() for value in batch]
+    return {
+        str(key): str(value) for key, value in zip(keys, values) if value is not None
+    }
+
+
+def _escape_pattern(text: str) -> str:
+    """Escape the glob special characters of a Redis ``MATCH`` pattern."""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in text)
 
 
 def flush_redis(config: RedisConfig | None = None) -> None:
@@ -93,3 +555,108 @@ def flush_redis(config: RedisConfig | None = None) -> None:
     logger.info("Flushing Redis database")
     client = get_redis(config)
     client.flushdb()
+
+
+class OutputListener:
+    """Wait for new outputs of some units, as announced with
+    :attr:`RedisConfig.events`.
+
+    Each listener owns its own Redis subscription, so it must only be used by
+    the process that created it.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings and events kind, which must not be ``None``.
+    """
+
+    def __init__(self, config: RedisConfig) -> None:
+        if config.events is None:
+            raise ValueError("Redis events are disabled in this configuration")
+        self.config = config
+        self._channels: tuple[str, ...] = ()
+        self._pubsub: redis.client.PubSub | None = None
+        # Last stream entry seen for every channel
+        self._last_ids: dict[str, str] = {}
+
+    def wait(self, unit_ids: Sequence[str], timeout: float) -> bool:
+        """Block until one of the units publishes an output.
+
+        Outputs published while not waiting are not lost: with pub/sub they
+        are queued by the subscription, with streams they are read from the
+        last entry seen. Outputs that arrived together wake the caller once.
+
+        Parameters
+        ----------
+        unit_ids : Sequence[str]
+            The units to listen to. The subscription follows its changes.
+        timeout : float
+            Maximum waiting time in seconds.
+
+        Returns
+        -------
+        bool
+            Whether an output arrived before the timeout.
+        """
+        self._listen(tuple(output_channel(unit_id) for unit_id in unit_ids))
+        if not self._channels:
+            time.sleep(timeout)
+            return False
+        if self.config.events == "stream":
+            return self._wait_stream(timeout)
+        return self._wait_pubsub(timeout)
+
+    def close(self) -> None:
+        """Release the subscription."""
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+        self._channels = ()
+
+    def _listen(self, channels: tuple[str, ...]) -> None:
+        if channels == self._channels:
+            return
+        client = get_redis(self.config)
+        if self.config.events == "stream":
+            # New streams are read from their current end
+            new = [channel for channel in channels if channel not in self._last_ids]
+            pipeline = client.pipeline(transaction=False)
+            for channel in new:
+                pipeline.xrevrange(channel, count=1)
+            for channel, entries in zip(new, pipeline.execute()):
+                self._last_ids[channel] = entries[0][0] if entries else "0-0"
+            self._last_ids = {channel: self._last_ids[channel] for channel in channels}
+        else:
+            if self._pubsub is None:
+                self._pubsub = client.pubsub(  # type: ignore[no-untyped-call]
+                    ignore_subscribe_messages=True
+                )
+            removed = set(self._channels) - set(channels)
+            if removed:
+                self._pubsub.unsubscribe(*removed)
+            if channels:
+                self._pubsub.subscribe(*channels)
+        self._channels = channels
+
+    def _wait_pubsub(self, timeout: float) -> bool:
+        assert self._pubsub is not None
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            # Subscription confirmations are returned as None too
+            if self._pubsub.get_message(timeout=remaining) is not None:
+                while self._pubsub.get_message(timeout=0) is not None:
+                    pass
+                return True
+        return False
+
+    def _wait_stream(self, timeout: float) -> bool:
+        client = get_redis(self.config)
+        # A zero block would wait forever
+        block = max(1, round(timeout * 1000))
+        streams: list[tuple[str, list[tuple[str, dict[str, str]]]]] = cast(
+            list[tuple[str, list[tuple[str, dict[str, str]]]]],
+            client.xread(dict(self._last_ids), block=block),  # type: ignore[arg-type]
+        )
+        for channel, entries in streams or []:
+            self._last_ids[str(channel)] = entries[-1][0]
+        return bool(streams)
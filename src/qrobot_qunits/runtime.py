@@ -0,0 +1,176 @@
+"""Execution of many units in a few worker processes."""
+
+import heapq
+import multiprocessing
+from collections.abc import Sequence
+from time import monotonic
+
+from qrobot.logger import LoggingConfig, configure_logging, get_logger
+from . import base
+from .base import BaseUnit
+from .scheduler import PeriodicScheduler
+
+
+class UnitRuntime:
+    """Run many units in a fixed pool of worker processes.
+
+    Starting units one by one creates an OS process per unit. A runtime
+    instead splits its units among ``workers`` processes, each running the
+    ticks of its units from a single loop ordered by their next deadline.
+    Every unit keeps its own sampling period and overrun policy.
+
+    Units hosted by a runtime run periodically, even when their
+    ``redis_config.events`` is set, and must not be started on their own.
+
+    Parameters
+    ----------
+    units : Sequence[BaseUnit]
+        The units to run.
+    workers : int, optional
+        Number of worker processes. Defaults to ``1``.
+    logging_config : LoggingConfig, optional
+        Logging configuration applied in the worker processes. Defaults to
+        ``None`` (default logging).
+
+    Attributes
+    ----------
+    units : tuple[BaseUnit, ...]
+        The units run by the runtime.
+    workers : int
+        Number of worker processes.
+
+    Raises
+    ------
+    ValueError
+        ``units`` is empty or contains the same unit twice, or ``workers`` is
+        lower than 1.
+    """
+
+    def __init__(
+        self,
+        units: Sequence[BaseUnit],
+        workers: int = 1,
+        logging_config: LoggingConfig | None = None,
+    ) -> None:
+        if not units:
+            raise ValueError("units must contain at least one unit")
+        if len({unit.id for unit in units}) != len(units):
+            raise ValueError("units must not contain the same unit twice")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.units = tuple(units)
+        self.workers = min(workers, len(self.units))
+        self.logging_config = logging_config
+        self._logger = get_logger("runtime")
+        self._processes: list[multiprocessing.Process] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker processes are running."""
+        return any(process.is_alive() for process in self._processes)
+
+    def start(self) -> None:
+        """Start the worker processes.
+
+        Raises
+        ------
+        RuntimeError
+            Some units are already started on their own.
+        ValueError
+            Some units store their fields within this process only, e.g. with
+            the ``"memory"`` backend.
+        """
+        if self.running:
+            self._logger.warning("UnitRuntime is already started")
+            return
+        in_process = [unit.id for unit in self.units if unit.transport.in_process]
+        if in_process:
+            raise ValueError(
+                f"Units {in_process} store their fields within this process only, "
+                "run them with run_units or an AsyncUnitRuntime instead"
+            )
+        running = [
+            unit.id
+            for unit in self.units
+            if unit._loop_thread is not None and unit._loop_thread.is_alive()
+        ]
+        if running:
+            raise RuntimeError(f"Units {running} are already started on their own")
+        self._logger.info(
+            f"Starting {len(self.units)} units in {self.workers} worker processes"
+        )
+        self._processes = [
+            multiprocessing.Process(
+                target=run_units,
+                args=(self.units[worker :: self.workers], self.logging_config),
+            )
+            for worker in range(self.workers)
+        ]
+        # Registering first lets the worker processes inherit the reset state
+        for unit in self.units:
+            unit._register()
+        for process in self._processes:
+            process.start()
+
+    def stop(self) -> None:
+        """Stop the worker processes and clean the units' Redis entries."""
+        if not self.running:
+            self._logger.warning("UnitRuntime is not running")
+            return
+        self._logger.info("Stopping UnitRuntime")
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        for unit in self.units:
+            unit._unregister()
+
+
+def _run_task(unit: BaseUnit) -> None:
+    """Run one tick of ``unit``, logging its exceptions instead of raising."""
+    try:
+        unit._unit_task()
+    except Exception:
+        unit._logger.exception("Task failed")
+
+
+def run_units(
+    units: Sequence[BaseUnit], logging_config: LoggingConfig | None = None
+) -> None:
+    """Run the ticks of many units forever from the calling thread.
+
+    Each unit runs once at once and then on the deadlines of its own
+    :class:`~qrobot_qunits.scheduler.PeriodicScheduler`; the loop always
+    waits for the earliest deadline among all the units. A unit raising an
+    exception is logged and rescheduled, without stopping the others.
+
+    Parameters
+    ----------
+    units : Sequence[BaseUnit]
+        The units to run.
+    logging_config : LoggingConfig, optional
+        Logging configuration to apply first. Defaults to ``None``.
+    """
+    if logging_config is not None:
+        configure_logging(logging_config)
+    schedulers = [
+        PeriodicScheduler(unit.sampling_period, unit.overrun_policy) for unit in units
+    ]
+    for unit in units:
+        _run_task(unit)
+    # Units ordered by their next deadline; the index breaks ties
+    queue = [(scheduler.deadline, index) for index, scheduler in enumerate(schedulers)]
+    heapq.heapify(queue)
+    next_report = monotonic() + base.TIMING_REPORT_PERIOD
+    while True:
+        _, index = heapq.heappop(queue)
+        unit, scheduler = units[index], schedulers[index]
+        if not scheduler.wait():
+            unit._logger.warning(f"Task overrun, {scheduler.stats().overruns} so far")
+        _run_task(unit)
+        heapq.heappush(queue, (scheduler.deadline, index))
+        if monotonic() >= next_report:
+            next_report += base.TIMING_REPORT_PERIOD
+            for unit, scheduler in zip(units, schedulers):
+                unit._publish_timing(scheduler.stats())
@@ -0,0 +1,177 @@
+"""Drift-free scheduling of the units' periodic tasks."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+OverrunPolicy = Literal["skip", "catch_up"]
+""" TypeAlias: How a :class:`PeriodicScheduler` handles missed ticks.
+"""
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Timing statistics of a :class:`PeriodicScheduler`.
+
+    Parameters
+    ----------
+    ticks : int
+        Number of ticks waited for.
+    overruns : int
+        Number of ticks whose deadline had already passed when waited for,
+        i.e. whose previous task took longer than the remaining period.
+    skipped : int
+        Number of missed ticks dropped by the ``"skip"`` policy.
+    mean_jitter : float
+        Mean delay in seconds between the deadlines and the actual ticks.
+    max_jitter : float
+        Largest delay in seconds between a deadline and its tick.
+    std_jitter : float
+        Standard deviation in seconds of the delays.
+    """
+
+    ticks: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    mean_jitter: float = 0.0
+    max_jitter: float = 0.0
+    std_jitter: float = 0.0
+
+
+class PeriodicScheduler:
+    """Wait for the ticks of a fixed period, targeting absolute deadlines.
+
+    Deadlines are multiples of the period from the start time, measured on a
+    monotonic clock, so the time spent by the task between two ticks does not
+    accumulate as drift. When a deadline has already passed, the tick is an
+    overrun and happens immediately; the policy then decides what happens to
+    the other missed ticks:
+
+    - ``"skip"``: they are dropped, and the following ticks keep their
+      original deadlines.
+    - ``"catch_up"``: they all happen immediately, one per call to
+      :meth:`wait`, until the schedule is met again.
+
+    Parameters
+    ----------
+    period : float
+        The time between two ticks, in seconds.
+    policy : {"skip", "catch_up"}
+        How missed ticks are handled. Defaults to ``"skip"``.
+    clock : Callable[[], float]
+        Monotonic clock returning seconds. Defaults to
+        :func:`time.monotonic`.
+    sleep : Callable[[float], None]
+        Function sleeping for some seconds. Defaults to :func:`time.sleep`.
+
+    Attributes
+    ----------
+    period : float
+        The time between two ticks, in seconds.
+    policy : {"skip", "catch_up"}
+        How missed ticks are handled.
+
+    Raises
+    ------
+    ValueError
+        ``period`` is not positive or ``policy`` is unknown.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        policy: OverrunPolicy = "skip",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if policy not in ("skip", "catch_up"):
+            raise ValueError(
+                f"Unknown overrun policy {policy!r}, choose 'skip' or 'catch_up'"
+            )
+        self.period = period
+        self.policy = policy
+        self._clock = clock
+        self._sleep = sleep
+        self._deadline = clock() + period
+        self._ticks = 0
+        self._overruns = 0
+        self._skipped = 0
+        # Running mean and sum of squared deviations of the jitter (Welford)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max = 0.0
+
+    @property
+    def deadline(self) -> float:
+        """Clock time of the next tick."""
+        return self._deadline
+
+    def remaining(self) -> float:
+        """Seconds left before the next tick, negative when it is late."""
+        return self._deadline - self._clock()
+
+    def wait(self) -> bool:
+        """Sleep until the next tick, or return at once if it is late.
+
+        Returns
+        -------
+        bool
+            Whether the tick was on time, i.e. not an overrun.
+        """
+        remaining = self.remaining()
+        if remaining > 0:
+            self._sleep(remaining)
+        return self._advance(on_time=remaining > 0)
+
+    async def wait_async(self) -> bool:
+        """Asynchronous version of :meth:`wait`, sleeping with
+        :func:`asyncio.sleep` instead of the scheduler's sleep function."""
+        remaining = self.remaining()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return self._advance(on_time=remaining > 0)
+
+    def advance(self) -> None:
+        """Move to the next tick at once, recording an on-time tick.
+
+        This is for callers which waited for the deadline otherwise, e.g.
+        with a timeout of :meth:`remaining` seconds on some other event.
+        """
+        self._advance(on_time=True)
+
+    def _advance(self, on_time: bool) -> bool:
+        """Record the tick and move the deadline to the next one."""
+        deadline = self._deadline
+        now = self._clock()
+        if not on_time:
+            self._overruns += 1
+            if self.policy == "skip":
+                missed = math.floor((now - deadline) / self.period)
+                self._skipped += missed
+                deadline += missed * self.period
+        self._record(max(0.0, now - deadline))
+        self._deadline = deadline + self.period
+        return on_time
+
+    def stats(self) -> SchedulerStats:
+        """Return the timing statistics of the ticks waited for so far."""
+        return SchedulerStats(
+            ticks=self._ticks,
+            overruns=self._overruns,
+            skipped=self._skipped,
+            mean_jitter=self._mean,
+            max_jitter=self._max,
+            std_jitter=math.sqrt(self._m2 / self._ticks) if self._ticks else 0.0,
+        )
+
+    def _record(self, jitter: float) -> None:
+        self._ticks += 1
+        delta = jitter - self._mean
+        self._mean += delta / self._ticks
+        self._m2 += delta * (jitter - self._mean)
+        self._max = max(self._max, jitter)
@@ -1,9 +1,11 @@
-from . import redis_utils
 from .base import BaseUnit
-from .redis_utils import RedisConfig, RedisWriteError
+from .redis_utils import RedisConfig, UnitFields
+from .scheduler import OverrunPolicy
+from .transport import Transport
 from qrobot.logger import LoggingConfig
-import redis
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from ctypes import c_double
+from multiprocessing.sharedctypes import RawValue
 
 
 class SensorialUnit(BaseUnit):
@@ -18,6 +20,12 @@ class SensorialUnit(BaseUnit):
     default_input: float
         Default input for the scalar readings when the SensorialUnit
         does not have an available one. Defaults to 0
+    overrun_policy : {"skip", "catch_up"}, optional
+        What to do with the ticks missed when a task takes longer than the
+        sampling period. Defaults to ``"skip"``
+    transport : Transport, optional
+        Where the unit writes its fields and reads its inputs. Defaults to
+        ``None``, i.e. Redis over ``redis_config``
 
     Attributes
     ----------
@@ -32,6 +40,8 @@ class SensorialUnit(BaseUnit):
         does not have an available one
     """
 
+    supports_step = True
+
     def __init__(
         self,
         name: str,
@@ -39,16 +49,24 @@ class SensorialUnit(BaseUnit):
         default_input: float | None = None,
         redis_config: RedisConfig | None = None,
         logging_config: LoggingConfig | None = None,
+        overrun_policy: OverrunPolicy = "skip",
+        transport: Transport | None = None,
     ) -> None:
         # Call the BaseUnit constructor
-        super().__init__(name, sampling_period, redis_config, logging_config)
+        super().__init__(
+            name,
+            sampling_period,
+            redis_config,
+            logging_config,
+            overrun_policy,
+            transport,
+        )
 
         # Store the SensorialUnit name and properties
         self.default_input = 0.0 if default_input is None else default_input
 
-        # Initialize multiprocessing variables
-        # - _scalar_reading array variable
-        self._scalar_reading = self._multiproc_manager.Value("d", self.default_input)
+        # Initialize the reading shared with the worker process
+        self._scalar_reading = RawValue(c_double, self.default_input)
 
         # Log properties
         self._logger.debug(f"Properties: {self}")
@@ -61,7 +79,7 @@ class SensorialUnit(BaseUnit):
     @property
     def scalar_reading(self) -> float:
         """Current scalar reading."""
-        return self._scalar_reading.value
+        return float(self._scalar_reading.value)
 
     @scalar_reading.setter
     def scalar_reading(self, value: float) -> None:
@@ -75,22 +93,10 @@ class SensorialUnit(BaseUnit):
 
     def _clean_redis(self) -> None:
         """Clean all the redis entries created by the unit when the loop stops."""
-        _r = redis_utils.get_redis(self.redis_config)
-        _r.delete(self.id + " output")
+        self.transport.delete(self.id, ["output"])
 
-    def _unit_task(self) -> None:
-        """Single iteration of the processing loop."""
-        # Get reading
+    def _step(self, inputs: Mapping[str, str | None]) -> UnitFields:
+        """Publish the current reading."""
         scalar_reading = self.scalar_reading
         self._logger.debug(f"scalar_reading={scalar_reading}")
-        self._logger.debug("Writing input on redis")
-        # Write it on redis
-        _r = redis_utils.get_redis(self.redis_config)
-        try:
-            written = _r.mset({self.id + " output": self.scalar_reading})
-        except redis.RedisError as exc:
-            raise RedisWriteError(
-                f"Unable to write SensorialUnit {self.id} output to Redis"
-            ) from exc
-        if not written:
-            raise RedisWriteError(f"Redis did not write SensorialUnit {self.id} output")
+        return {"output": scalar_reading}
@@ -0,0 +1,77 @@
+"""Lock-free reads of state shared between a unit and its worker process."""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from ctypes import c_uint64
+from multiprocessing.sharedctypes import RawValue
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+MAX_UNIT_ID_LENGTH = 128
+""" int: Maximum length in bytes of the unit ids stored in shared memory.
+"""
+
+
+class SeqLock:
+    """Sequence lock guarding fixed-size shared-memory state.
+
+    Writers increment a shared sequence number before and after changing the
+    state, so it is odd while a write is in progress. Readers never block a
+    writer: they read the state and retry if the sequence number was odd or
+    changed meanwhile. Reads are therefore cheap and consistent, which suits
+    state read every tick and seldom written, like a unit's query.
+
+    The lock must be shared with worker processes by inheritance, e.g. as an
+    attribute of the unit a process runs, and every write must come from the
+    process that created it.
+    """
+
+    def __init__(self) -> None:
+        self._sequence = RawValue(c_uint64, 0)
+        # Serializes the writer threads, readers never take it
+        self._write_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"_sequence": self._sequence}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._sequence = state["_sequence"]
+        self._write_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Number of writes completed so far."""
+        return int(self._sequence.value) // 2
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Context manager within which the guarded state may be changed."""
+        with self._write_lock:
+            self._sequence.value += 1
+            try:
+                yield
+            finally:
+                self._sequence.value += 1
+
+    def read(self, reader: Callable[[], T]) -> T:
+        """Return a consistent snapshot of the guarded state.
+
+        Parameters
+        ----------
+        reader : Callable[[], T]
+            Function copying the state out of shared memory. It may be called
+            more than once if a write happens meanwhile.
+
+        Returns
+        -------
+        T
+            The value returned by ``reader`` outside of any write.
+        """
+        while True:
+            start = self._sequence.value
+            if start % 2 == 0:
+                value = reader()
+                if self._sequence.value == start:
+                    return value
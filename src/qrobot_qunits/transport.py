@@ -0,0 +1,281 @@
+"""Transports carrying the units' fields between each other."""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from ctypes import addressof, c_char, c_double, c_int, memmove
+from multiprocessing.sharedctypes import RawArray, RawValue
+
+from . import redis_utils
+from .redis_utils import OutputListener, RedisConfig, UnitFields
+from .seqlock import MAX_UNIT_ID_LENGTH, SeqLock
+
+
+class Transport(ABC):
+    """Storage of the fields the units publish, e.g. their ``"output"``.
+
+    Units write their fields and read the outputs of their inputs through a
+    transport only, so the same network can run over Redis or over a faster
+    local store.
+    """
+
+    @property
+    def in_process(self) -> bool:
+        """Whether fields written by a worker process are lost to the others,
+        e.g. with the ``"memory"`` backend."""
+        return False
+
+    def attach(self, unit_id: str) -> None:
+        """Prepare the storage of a new unit, when it is created.
+
+        Parameters
+        ----------
+        unit_id : str
+            The unit identifier.
+        """
+
+    @abstractmethod
+    def register(self, unit_id: str, class_name: str) -> None:
+        """Publish a started unit with its class."""
+
+    @abstractmethod
+    def unregister(self, unit_id: str) -> None:
+        """Remove a stopped unit from the published ones."""
+
+    @abstractmethod
+    def write(self, unit_id: str, fields: UnitFields) -> bool:
+        """Write some fields of a unit.
+
+        Parameters
+        ----------
+        unit_id : str
+            The unit identifier.
+        fields : UnitFields
+            Field values to write, e.g. ``{"output": 1.0}``.
+
+        Returns
+        -------
+        bool
+            Whether the fields were written.
+        """
+
+    def write_many(self, units: Mapping[str, UnitFields]) -> None:
+        """Write the fields of many units.
+
+        Parameters
+        ----------
+        units : Mapping[str, UnitFields]
+            Field values to write for every unit id.
+        """
+        for unit_id, fields in units.items():
+            self.write(unit_id, fields)
+
+    @abstractmethod
+    def read(self, unit_ids: Sequence[str], field: str) -> list[str | None]:
+        """Read the same field of many units.
+
+        Parameters
+        ----------
+        unit_ids : Sequence[str]
+            The unit identifiers.
+        field : str
+            The field to read, e.g. ``"output"``.
+
+        Returns
+        -------
+        list[str | None]
+            The value of each unit's field, ``None`` when it is not set.
+        """
+
+    @abstractmethod
+    def delete(self, unit_id: str, fields: Sequence[str]) -> None:
+        """Delete some fields of a unit."""
+
+    def listener(self) -> OutputListener | None:
+        """Return a listener of new outputs, or ``None`` without events."""
+        return None
+
+
+class RedisTransport(Transport):
+    """Transport storing the units' fields on Redis.
+
+    Parameters
+    ----------
+    config : RedisConfig
+        Connection settings, schema and events kind of the database.
+    """
+
+    def __init__(self, config: RedisConfig) -> None:
+        self.config = config
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RedisTransport) and other.config == self.config
+
+    def __hash__(self) -> int:
+        return hash(self.config)
+
+    @property
+    def in_process(self) -> bool:
+        return self.config.backend == "memory"
+
+    def register(self, unit_id: str, class_name: str) -> None:
+        redis_utils.register_unit(self.config, unit_id, class_name)
+
+    def unregister(self, unit_id: str) -> None:
+        redis_utils.unregister_unit(self.config, unit_id)
+
+    def write(self, unit_id: str, fields: UnitFields) -> bool:
+        return redis_utils.write_unit(self.config, unit_id, fields)
+
+    def write_many(self, units: Mapping[str, UnitFields]) -> None:
+        redis_utils.write_units(self.config, units)
+
+    def read(self, unit_ids: Sequence[str], field: str) -> list[str | None]:
+        return redis_utils.read_units_field(self.config, unit_ids, field)
+
+    def delete(self, unit_id: str, fields: Sequence[str]) -> None:
+        redis_utils.delete_unit_fields(self.config, unit_id, fields)
+
+    def listener(self) -> OutputListener | None:
+        if self.config.events is None:
+            return None
+        return OutputListener(self.config)
+
+
+class LocalTransport(Transport):
+    """Transport sharing the units' outputs through shared memory.
+
+    Outputs are stored in a fixed table of shared memory, with one slot per
+    unit, so units running in the same process or in worker processes of the
+    same host exchange them without any network round trip. The other fields,
+    e.g. the states and queries the dashboard shows, are only kept when
+    mirrored on Redis.
+
+    The units must all be created, with this transport, by the process that
+    created the transport and before starting any of them, because their
+    slots are assigned when they are created. Units run periodically, even
+    when the mirror has ``events`` set.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of units. Defaults to ``256``.
+    mirror : RedisConfig | None, optional
+        Redis database on which every field is also written, e.g. for
+        dashboards. Defaults to ``None`` (no mirroring).
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of units.
+    mirror : RedisConfig | None
+        Redis database on which every field is also written.
+
+    Raises
+    ------
+    ValueError
+        ``capacity`` is lower than 1.
+    """
+
+    def __init__(self, capacity: int = 256, mirror: RedisConfig | None = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.mirror = mirror
+        # Shared unit ids table, guarded by a sequence lock, and outputs
+        self._lock = SeqLock()
+        self._count = RawValue(c_int, 0)
+        self._ids = RawArray(c_char, capacity * MAX_UNIT_ID_LENGTH)
+        self._outputs = RawArray(c_double, [math.nan] * capacity)
+        # Slot of every known unit in the current process, read from the
+        # table when it had ``_known`` units
+        self._slots: dict[str, int] = {}
+        self._known = 0
+
+    @property
+    def in_process(self) -> bool:
+        # Outputs are shared, but mirrored fields would be lost
+        return self.mirror is not None and self.mirror.backend == "memory"
+
+    def attach(self, unit_id: str) -> None:
+        """Assign a slot of the shared table to a new unit.
+
+        Raises
+        ------
+        ValueError
+            The table is full, or ``unit_id`` is too long.
+        """
+        encoded = unit_id.encode()
+        if not 0 < len(encoded) <= MAX_UNIT_ID_LENGTH:
+            raise ValueError(
+                f"unit_id must be between 1 and {MAX_UNIT_ID_LENGTH} bytes long"
+            )
+        with self._lock.write():
+            # The slot is claimed under the lock, so that concurrent attaches
+            # never share it
+            slot = self._count.value
+            if slot >= self.capacity:
+                raise ValueError(f"LocalTransport is full ({self.capacity} units)")
+            memmove(
+                addressof(self._ids) + slot * MAX_UNIT_ID_LENGTH,
+                encoded.ljust(MAX_UNIT_ID_LENGTH, b"\0"),
+                MAX_UNIT_ID_LENGTH,
+            )
+            self._count.value = slot + 1
+        self._slots[unit_id] = slot
+
+    def _slot(self, unit_id: str) -> int | None:
+        slot = self._slots.get(unit_id)
+        if slot is None and self._count.value != self._known:
+            # Units created since the table was last read are not cached yet,
+            # other unknown ids are not read again
+            self._slots, self._known = self._lock.read(self._read_slots)
+            slot = self._slots.get(unit_id)
+        return slot
+
+    def _read_slots(self) -> tuple[dict[str, int], int]:
+        raw = self._ids.raw
+        count = self._count.value
+        slots = {}
+        for slot in range(count):
+            start = slot * MAX_UNIT_ID_LENGTH
+            slots[raw[start : start + MAX_UNIT_ID_LENGTH].rstrip(b"\0").decode()] = slot
+        return slots, count
+
+    def register(self, unit_id: str, class_name: str) -> None:
+        if self.mirror is not None:
+            redis_utils.register_unit(self.mirror, unit_id, class_name)
+
+    def unregister(self, unit_id: str) -> None:
+        if self.mirror is not None:
+            redis_utils.unregister_unit(self.mirror, unit_id)
+
+    def write(self, unit_id: str, fields: UnitFields) -> bool:
+        if "output" in fields:
+            slot = self._slot(unit_id)
+            if slot is None:
+                return False
+            self._outputs[slot] = float(fields["output"])
+        if self.mirror is not None:
+            return redis_utils.write_unit(self.mirror, unit_id, fields)
+        return True
+
+    def read(self, unit_ids: Sequence[str], field: str) -> list[str | None]:
+        if field != "output":
+            if self.mirror is None:
+                return [None] * len(unit_ids)
+            return redis_utils.read_units_field(self.mirror, unit_ids, field)
+        values: list[str | None] = []
+        for unit_id in unit_ids:
+            slot = self._slot(unit_id)
+            output = math.nan if slot is None else self._outputs[slot]
+            # Values are strings, like the ones read from Redis
+            values.append(None if math.isnan(output) else repr(output))
+        return values
+
+    def delete(self, unit_id: str, fields: Sequence[str]) -> None:
+        slot = self._slot(unit_id)
+        if "output" in fields and slot is not None:
+            self._outputs[slot] = math.nan
+        if self.mirror is not None:
+            redis_utils.delete_unit_fields(self.mirror, unit_id, fields)
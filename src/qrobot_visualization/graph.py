@@ -1,6 +1,5 @@
 import json
 from collections.abc import Mapping
-from typing import Any
 
 import networkx as nx
 
@@ -13,58 +12,66 @@ ATTRIBUTES = [
 ]
 
 
-def _is_id(candidate_key: str) -> bool:
-    """Check if a candidate Redis key contains a unit id."""
-    return any(attribute in candidate_key for attribute in ATTRIBUTES)
+def _units(
+    status: Mapping[str, str] | Mapping[str, Mapping[str, str]],
+) -> dict[str, Mapping[str, str]]:
+    """Group a Redis status by unit id, as ``{unit_id: {field: value}}``.
 
-
-def _get_id(key: str) -> str:
-    """Get unit id from a Redis key."""
-    for attr in ATTRIBUTES:
-        key = key.replace(attr, "")
-    return key
-
-
-def _write_node(graph: nx.Graph, node_id: str, key: str, value: Any) -> None:
+    Nested statuses (e.g. from :func:`qrobot_qunits.redis_utils.units_status`)
+    are already grouped; flat ones have ``"<unit id> <field>"`` keys.
+    """
+    units: dict[str, Mapping[str, str]] = {}
+    flat: dict[str, dict[str, str]] = {}
+    for key, value in status.items():
+        if isinstance(value, Mapping):
+            units[key] = value
+            continue
+        unit_id, _, field = key.rpartition(" ")
+        if unit_id and " " + field in ATTRIBUTES:
+            flat.setdefault(unit_id, {})[field] = value
+    return units | flat
+
+
+def _write_node(graph: nx.Graph, node_id: str, fields: Mapping[str, str]) -> None:
     """Write unit attributes to the corresponding graph node."""
     if node_id not in graph:
         graph.add_node(node_id)
-    if " class" in key:
-        graph.nodes[node_id]["class"] = value
-    elif " output" in key:
-        graph.nodes[node_id]["output"] = value
-    elif " state" in key:
-        graph.nodes[node_id]["state"] = value
-    elif " query" in key:
-        graph.nodes[node_id]["query"] = json.loads(value)
+    for field in ("class", "output", "state"):
+        if field in fields:
+            graph.nodes[node_id][field] = fields[field]
+    if "query" in fields:
+        graph.nodes[node_id]["query"] = json.loads(fields["query"])
 
 
-def _write_edge(graph: nx.Graph, node_id: str, key: str, value: Any) -> None:
+def _write_edge(graph: nx.Graph, node_id: str, fields: Mapping[str, str]) -> None:
     """Link units in the network by adding the respective edges."""
-    if " in_qunits" in key:
-        in_qunits = json.loads(value)
+    if "in_qunits" in fields:
+        in_qunits = json.loads(fields["in_qunits"])
         for _, in_qunit in in_qunits.items():
-            if (in_qunit, node_id) not in graph.edges():
+            # Uncoupled dimensions have no input unit
+            if in_qunit is not None and (in_qunit, node_id) not in graph.edges():
                 graph.add_edge(in_qunit, node_id)
 
 
-def build_network(status_dict: Mapping[str, str]) -> nx.DiGraph:
+def build_network(
+    status_dict: Mapping[str, str] | Mapping[str, Mapping[str, str]],
+) -> nx.DiGraph:
     """Given the Redis status dictionary, generate a `networkx` directed graph
     containing all the units connected as nodes.
 
     Args:
-        status_dict (dict): The Redis status dictionary.
+        status_dict (dict): The Redis status dictionary, either flat with
+            ``"<unit id> <field>"`` keys or grouped by unit id as
+            ``{unit_id: {field: value}}``.
 
     Returns:
         networkx.DiGraph: The `networkx` directed graph
     """
     graph = nx.DiGraph()
 
-    for key, value in status_dict.items():
-        if _is_id(key):
-            node_id = _get_id(key)
-            _write_node(graph, node_id, key, value)
-            _write_edge(graph, node_id, key, value)
+    for node_id, fields in _units(status_dict).items():
+        _write_node(graph, node_id, fields)
+        _write_edge(graph, node_id, fields)
 
     for source, target in graph.edges():
         output = graph.nodes[source].get("output")
@@ -74,7 +81,9 @@ def build_network(status_dict: Mapping[str, str]) -> nx.DiGraph:
     return graph
 
 
-def graph(status_dict: Mapping[str, str]) -> nx.DiGraph:
+def graph(
+    status_dict: Mapping[str, str] | Mapping[str, Mapping[str, str]],
+) -> nx.DiGraph:
     """Build a network graph from Redis status data.
 
     Deprecated alias for :func:`build_network`. It remains available so
@@ -0,0 +1,31 @@
+import numpy as np
+
+from qrobot.backends.bits import (
+    bitmask_to_label,
+    bits_to_bitmasks,
+    bits_to_counts,
+    bits_to_labels,
+)
+
+
+def test_bits_to_counts():
+    bits = np.array([[True, False], [True, False], [False, False]])
+    assert bits_to_counts(bits) == {"00": 1, "01": 2}
+
+
+def test_bitmasks_match_labels():
+    bits = np.random.default_rng(0).random((100, 7)) < 0.5
+    bitmasks = bits_to_bitmasks(bits)
+    assert bitmasks.dtype == np.uint64
+    labels = bits_to_labels(bits)
+    assert [bitmask_to_label(state, 7) for state in bitmasks] == list(labels)
+    assert [int(label, 2) for label in labels] == bitmasks.tolist()
+
+
+def test_bitmasks_of_many_qubits():
+    bits = np.zeros((2, 70), dtype=bool)
+    bits[0, 69] = True
+    bits[1, 0] = True
+    assert bits_to_bitmasks(bits).tolist() == [2**69, 1]
+    full = bits_to_bitmasks(np.ones((1, 64), dtype=bool))
+    assert full.tolist() == [2**64 - 1]
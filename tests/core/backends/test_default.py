@@ -0,0 +1,38 @@
+import pytest
+
+from qrobot.backends import (
+    NumpyBackend,
+    ProductStateBackend,
+    QiskitBackend,
+    default,
+    get_default_backend,
+    set_default_backend,
+)
+from qrobot.models import AngularModel
+
+
+@pytest.fixture(autouse=True)
+def fixture_reset_default(monkeypatch):
+    """Restore the process-wide default backend after each test."""
+    monkeypatch.setattr(default, "_default_backend", None)
+    monkeypatch.delenv(default.BACKEND_ENV_VAR, raising=False)
+
+
+def test_qiskit_is_the_default():
+    assert isinstance(get_default_backend(), QiskitBackend)
+
+
+def test_set_default_backend():
+    set_default_backend("numpy")
+    assert isinstance(AngularModel(1, 1).backend, NumpyBackend)
+    set_default_backend(ProductStateBackend)
+    assert isinstance(AngularModel(1, 1).backend, ProductStateBackend)
+    with pytest.raises(ValueError):
+        set_default_backend("unknown")
+
+
+def test_default_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(default.BACKEND_ENV_VAR, "product")
+    assert isinstance(get_default_backend(), ProductStateBackend)
+    # Each model gets its own backend instance
+    assert get_default_backend() is not get_default_backend()
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from qrobot.backends import NumpyBackend, QiskitBackend
+from qrobot.models import AngularModel, LinearModel
+
+
+@pytest.mark.parametrize("model_class", [AngularModel, LinearModel])
+def test_statevector_matches_qiskit(model_class):
+    sequence = [[0.1, 0.7, 0.4], [0.9, 0.3, 0.5]]
+    models = [
+        model_class(3, 2, backend=backend)
+        for backend in (NumpyBackend(), QiskitBackend())
+    ]
+    for model in models:
+        for t in range(model.tau):
+            for dim in range(model.n):
+                model.encode(sequence[t][dim], dim)
+        model.query([0.2, 0.6, 0.1])
+    numpy, qiskit = (model.get_statevector() for model in models)
+    assert np.allclose(numpy, qiskit)
+
+
+@pytest.mark.parametrize("gate", ["rx", "ry", "rz"])
+def test_rotations_match_qiskit(gate):
+    circuits = [
+        backend.create_circuit(2) for backend in (NumpyBackend(), QiskitBackend())
+    ]
+    for circuit in circuits:
+        circuit.ry(0.3, 0)
+        circuit.rx(1.1, 1)
+        getattr(circuit, gate)(0.7, 0)
+    numpy = NumpyBackend().statevector(circuits[0])
+    qiskit = QiskitBackend().statevector(circuits[1])
+    assert np.allclose(numpy, qiskit)
+
+
+def test_sample_counts_uses_qiskit_bit_order():
+    backend = NumpyBackend()
+    circuit = backend.create_circuit(3)
+    circuit.ry(np.pi, 1)
+    assert backend.sample_counts(circuit, shots=5) == {"010": 5}
+
+
+def test_circuit_rejects_unknown_qubits():
+    with pytest.raises(IndexError):
+        NumpyBackend().create_circuit(2).ry(0.1, 2)
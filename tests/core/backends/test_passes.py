@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from qrobot.backends import NumpyBackend, ProductStateBackend, QiskitBackend
+from qrobot.backends.base import Gate
+from qrobot.backends.passes import fuse_rotations
+from qrobot.models import AngularModel, LinearModel
+
+
+def test_fuse_rotations():
+    gates = [
+        Gate("ry", (0.1,), (0,)),
+        Gate("ry", (0.2,), (1,)),
+        Gate("ry", (0.3,), (0,)),
+        Gate("rz", (0.4,), (0,)),
+        Gate("rz", (0.5,), (0,)),
+        Gate("cx", (), (0, 1)),
+        Gate("ry", (0.6,), (1,)),
+    ]
+    assert fuse_rotations(gates) == [
+        Gate("ry", (0.1 + 0.3,), (0,)),
+        Gate("ry", (0.2,), (1,)),
+        Gate("rz", (0.4 + 0.5,), (0,)),
+        Gate("cx", (), (0, 1)),
+        Gate("ry", (0.6,), (1,)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "backend_class", [NumpyBackend, ProductStateBackend, QiskitBackend]
+)
+def test_fused_model_matches_unfused(backend_class):
+    sequence = np.random.default_rng(0).random((50, 3))
+    models = [
+        AngularModel(3, 50, backend=backend_class(), fuse_rotations=fuse)
+        for fuse in (False, True)
+    ]
+    for model in models:
+        for t in range(model.tau):
+            for dim in range(model.n):
+                model.encode(sequence[t][dim], dim)
+        model.query([0.5, 0.1, 0.9])
+    unfused, fused = (model.get_statevector() for model in models)
+    assert np.allclose(fused, unfused)
+
+
+@pytest.mark.parametrize("backend_class", [NumpyBackend, QiskitBackend])
+def test_backend_fuses_window_into_one_gate_per_qubit(backend_class):
+    backend = backend_class()
+    model = LinearModel(2, 5, backend=backend)
+    for _ in range(model.tau):
+        model.encode_vector([0.3, 0.8])
+    model.query([0.1, 0.2])
+    original = backend.statevector(model.circ)
+    fused = backend.fuse_rotations(model.circ)
+    assert len(fused.gates if backend_class is NumpyBackend else fused.data) == 2
+    assert np.allclose(backend.statevector(fused), original)
+    # The model's circuit is left untouched
+    assert len(model.circ.gates if backend_class is NumpyBackend else model.circ) == 12
+
+
+def test_qiskit_leaves_unsupported_circuits_unchanged():
+    backend = QiskitBackend()
+    circuit = backend.create_circuit(1)
+    circuit.h(0)
+    assert backend.fuse_rotations(circuit) is circuit
+    template = backend.create_template(1, 2)
+    assert backend.fuse_rotations(template) is template
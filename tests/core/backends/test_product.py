@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from qrobot.backends import ProductStateBackend, QiskitBackend
+from qrobot.backends.base import DenseDistribution
+from qrobot.backends.product import excitation_probabilities
+from qrobot.models import AngularModel, LinearModel
+
+
+def test_sample_counts_uses_qiskit_bit_order():
+    backend = ProductStateBackend()
+    circuit = backend.create_circuit(3)
+    circuit.ry(np.pi, 1)
+    assert backend.sample_counts(circuit, shots=5) == {"010": 5}
+
+
+def test_rotations_accumulate_per_qubit():
+    circuit = ProductStateBackend().create_circuit(2)
+    circuit.ry(np.pi / 2, 0)
+    circuit.ry(np.pi / 2, 0)
+    circuit.ry(-np.pi, 1)
+    assert np.allclose(circuit.angles, [np.pi, -np.pi])
+    assert np.allclose(excitation_probabilities(circuit.angles), [1.0, 1.0])
+
+
+@pytest.mark.parametrize("model_class", [AngularModel, LinearModel])
+def test_statevector_matches_qiskit(model_class):
+    sequence = [[0.1, 0.7, 0.4], [0.9, 0.3, 0.5]]
+    models = [
+        model_class(3, 2, backend=backend)
+        for backend in (ProductStateBackend(), QiskitBackend())
+    ]
+    for model in models:
+        for t in range(model.tau):
+            for dim in range(model.n):
+                model.encode(sequence[t][dim], dim)
+        model.query([0.2, 0.6, 0.1])
+    product, qiskit = (model.get_statevector() for model in models)
+    assert np.allclose(product, qiskit)
+
+
+def test_sampling_frequencies_follow_marginals():
+    backend = ProductStateBackend()
+    circuit = backend.create_circuit(2)
+    circuit.ry(np.pi / 2, 0)
+    shots = 20000
+    counts = backend.sample_counts(circuit, shots)
+    assert set(counts) == {"00", "01"}
+    assert counts["01"] / shots == pytest.approx(0.5, abs=0.03)
+
+
+def test_sampling_scales_to_many_qubits():
+    backend = ProductStateBackend()
+    model = AngularModel(n=64, tau=1, backend=backend)
+    for dim in range(0, model.n, 2):
+        model.encode(1, dim)
+    assert model.decode() == "01" * 32
+
+
+def test_distribution_matches_dense_distribution():
+    backend = ProductStateBackend()
+    circuit = backend.create_circuit(3)
+    circuit.ry(np.pi / 2, 0)
+    circuit.ry(np.pi, 2)
+    rng = np.random.default_rng(0)
+    product = backend.distribution(circuit).sample(20000, rng)
+    dense = DenseDistribution(np.abs(backend.statevector(circuit)) ** 2)
+    dense_bits = dense.sample(20000, rng)
+    assert product.shape == dense_bits.shape == (20000, 3)
+    assert np.allclose(product.mean(axis=0), dense_bits.mean(axis=0), atol=0.03)
+    assert np.allclose(product.mean(axis=0), [0.5, 0, 1], atol=0.03)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from qrobot.backends import (
+    NumpyBackend,
+    ProductStateBackend,
+    QiskitBackend,
+    QuantumBackend,
+)
+from qrobot.backends.base import CircuitTemplate
+from qrobot.models import AngularModel
+
+BACKENDS = [NumpyBackend, ProductStateBackend, QiskitBackend]
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_bound_template_matches_circuit(backend_class):
+    backend = backend_class()
+    angles = np.random.default_rng(0).random((3, 2))
+    circuit = backend.create_circuit(2)
+    for layer in angles:
+        for qubit, angle in enumerate(layer):
+            circuit.ry(angle, qubit)
+    template = backend.create_template(2, 3)
+    bound = backend.bind_template(template, angles)
+    assert np.allclose(backend.statevector(bound), backend.statevector(circuit))
+    # Binding never alters the template shared by later windows
+    rebound = backend.bind_template(template, np.zeros((3, 2)))
+    assert backend.sample_counts(rebound, shots=5) == {"00": 5}
+
+
+def test_qiskit_templates_are_cached_per_shape():
+    backend = QiskitBackend()
+    assert backend.create_template(2, 3) is backend.create_template(2, 3)
+    assert backend.create_template(2, 3) is not backend.create_template(3, 2)
+
+
+def test_numpy_binding_does_not_build_gates(mocker):
+    backend = NumpyBackend()
+    gate = mocker.patch("qrobot.backends.numpy.Gate")
+    circuit = backend.bind_template(backend.create_template(2, 3), np.ones((3, 2)))
+    assert np.allclose(circuit.bound_angles, [3.0, 3.0])
+    backend.statevector(circuit)
+    gate.assert_not_called()
+
+
+def test_qiskit_binds_one_rotation_per_qubit():
+    backend = QiskitBackend()
+    template = backend.create_template(2, 3)
+    circuit = backend.bind_template(template, np.ones((3, 2)))
+    assert len(circuit.data) == 2
+    assert not circuit.parameters
+    assert len(template.parameters) == 2
+
+
+def test_default_template_binds_ry_gates():
+    class MinimalBackend(QuantumBackend):
+        create_circuit = NumpyBackend.create_circuit
+        sample_counts = NumpyBackend.sample_counts
+        statevector = NumpyBackend.statevector
+
+    backend = MinimalBackend()
+    template = backend.create_template(2, 3)
+    assert template == CircuitTemplate(2, 3)
+    circuit = backend.bind_template(template, np.ones((3, 2)))
+    assert len(circuit.gates) == 6
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_model_bind_window(backend_class):
+    window = np.array([[0.2, 0.9], [0.7, 0.1]])
+    model = AngularModel(2, 2, backend=backend_class())
+    model.encode_window(window)
+    model.query([0.3, 0.4])
+    bound = AngularModel(2, 2, backend=model.backend)
+    bound.bind_window(window, [0.3, 0.4])
+    assert np.allclose(bound.get_statevector(), model.get_statevector())
+    # A later window replaces the previous one
+    bound.bind_window(np.zeros((2, 2)))
+    assert bound.measure(shots=5) == {"00": 5}
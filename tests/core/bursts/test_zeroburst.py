@@ -1,3 +1,8 @@
+import math
+
+import numpy as np
+import pytest
+
 from qrobot.bursts import ZeroBurst
 
 
@@ -6,3 +11,47 @@ def test_burst():
     assert burst("0000") == 1.0
     assert burst("0010101010") == 6 / 10
     assert burst("1111") == 0.0
+
+
+def test_burst_of_bitmask():
+    burst = ZeroBurst()
+    assert burst(0b0000, n=4) == 1.0
+    assert burst(0b0010101010, n=10) == 6 / 10
+    assert burst(0b1111, n=4) == 0.0
+    with pytest.raises(ValueError):
+        burst(0b1111)
+
+
+def test_batch():
+    burst = ZeroBurst()
+    labels = ["0000", "0010101010", "1111"]
+    expected = [burst(label) for label in labels]
+    assert np.allclose(burst.batch(labels), expected)
+    assert np.allclose(
+        burst.batch(np.array([0b0000, 0b1010, 0b1111]), n=4),
+        [burst(state, n=4) for state in (0b0000, 0b1010, 0b1111)],
+    )
+    # Bitmasks of more than 64 qubits
+    assert np.allclose(
+        burst.batch(np.array([2**69], dtype=object), n=70), [burst(2**69, n=70)]
+    )
+    with pytest.raises(ValueError):
+        burst.batch(np.array([0b1111]))
+
+
+def test_expectation():
+    burst = ZeroBurst()
+    counts = {"00": 1, "01": 2, "11": 1}
+    expected = sum(burst(state) * count for state, count in counts.items()) / 4
+    assert burst.expectation(counts) == pytest.approx(expected)
+    assert burst.expectation({0b00: 1, 0b01: 2, 0b11: 1}, n=2) == pytest.approx(
+        expected
+    )
+    assert burst.expectation(["00", "11"]) == pytest.approx(0.5)
+
+
+def test_empty_states():
+    burst = ZeroBurst()
+    assert burst.batch([]).shape == (0,)
+    assert burst.batch({}, n=2).shape == (0,)
+    assert math.isnan(burst.expectation([]))
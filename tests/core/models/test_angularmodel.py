@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 
+from qrobot.bursts import OneBurst, ZeroBurst
 from qrobot.models import AngularModel
 
 
@@ -192,3 +193,128 @@ def test_probabilities():
     # Check if at least 70% of the shots are 111 (coherent with the input)
     result = model.measure(shots)
     assert result["100"] / shots >= 0.8
+
+
+def test_encode_vector():
+    """Encoding a vector is equivalent to encoding each dimension"""
+    vector = [0.2, 0.9, 0.5]
+    model = AngularModel(n=3, tau=2)
+    for dim in range(model.n):
+        model.encode(vector[dim], dim)
+    vectorized = AngularModel(n=3, tau=2)
+    angles = vectorized.encode_vector(np.array(vector))
+    assert angles.shape == (3,)
+    assert np.allclose(vectorized.get_statevector(), model.get_statevector())
+
+    # Testing wrong inputs
+    with pytest.raises(ValueError):
+        vectorized.encode_vector([0.1, 0.2])  # size < n
+    with pytest.raises(TypeError):
+        vectorized.encode_vector(["a", 0.2, 0.3])  # wrong type
+    with pytest.raises(ValueError):
+        vectorized.encode_vector([0.1, 1.2, 0.3])  # second element is 1.2
+
+
+def test_encode_window():
+    """Encoding a window applies one fused rotation per qubit"""
+    window = np.array([[0.2, 0.9, 0.5], [0.7, 0.1, 0.5]])
+    model = AngularModel(n=3, tau=2)
+    for t in range(model.tau):
+        for dim in range(model.n):
+            model.encode(window[t][dim], dim)
+    vectorized = AngularModel(n=3, tau=2)
+    vectorized.encode_window(window)
+    assert len(vectorized.circ.data) == vectorized.n
+    assert np.allclose(vectorized.get_statevector(), model.get_statevector())
+
+    # Testing wrong inputs
+    with pytest.raises(ValueError):
+        vectorized.encode_window(window[0])  # missing time axis
+    with pytest.raises(ValueError):
+        vectorized.encode_window(-window)  # negative inputs
+
+
+def test_evaluate_batch():
+    """Batched evaluation decodes unambiguous sequences like single models"""
+    sequences = np.array(
+        [
+            [[1, 0, 0], [1, 0, 0]],
+            [[0, 1, 1], [0, 1, 1]],
+            [[1, 1, 1], [1, 1, 1]],
+        ]
+    )
+    model = AngularModel(n=3, tau=2)
+    result = model.evaluate_batch(sequences, query=[0, 0, 1], shots=4, burst=OneBurst())
+    assert list(result.states) == ["101", "010", "011"]
+    assert result.counts == [{"101": 4}, {"010": 4}, {"011": 4}]
+    assert np.allclose(result.probabilities, [[1, 0, 1], [0, 1, 0], [1, 1, 0]])
+    assert np.allclose(result.bursts, [2 / 3, 1 / 3, 2 / 3])
+    # The model's own circuit is untouched
+    assert model.measure(shots=10) == {"000": 10}
+
+    # Probabilities match the circuit of a single model
+    sequences = np.random.default_rng(0).random((2, 2, 3))
+    result = model.evaluate_batch(sequences, query=[0.1, 0.2, 0.3])
+    for sequence, probabilities in zip(sequences, result.probabilities):
+        single = AngularModel(n=3, tau=2)
+        single.encode_window(sequence)
+        single.query([0.1, 0.2, 0.3])
+        marginals = [
+            sum(
+                abs(amplitude) ** 2
+                for index, amplitude in enumerate(single.get_statevector())
+                if index >> dim & 1
+            )
+            for dim in range(single.n)
+        ]
+        assert np.allclose(probabilities, marginals)
+
+    with pytest.raises(ValueError):
+        model.evaluate_batch(sequences[:, 0], query=[0, 0, 0])  # missing time axis
+
+
+def test_decode_many(mocker):
+    """The distribution is simulated once per circuit and then only sampled"""
+    model = AngularModel(n=2, tau=1)
+    model.encode_vector([0.5, 1])
+    statevector = mocker.spy(model.backend, "statevector")
+    samples = model.decode_many(10000)
+    model.decode()
+    assert statevector.call_count == 1
+    assert set(samples) == {"10", "11"}
+    assert samples.count("11") / len(samples) == pytest.approx(0.5, abs=0.03)
+
+    # Encoding again invalidates the distribution
+    model.encode(0.5, dim=0)
+    assert model.decode_many(3) == ["11", "11", "11"]
+    assert statevector.call_count == 2
+    model.clear()
+    assert model.decode() == "00"
+
+
+def test_decode_bitmask():
+    """Bitmasks hold qubit q in bit q, like labels read as binary numbers"""
+    model = AngularModel(n=3, tau=1)
+    model.encode(1, dim=1)
+    assert model.decode_bitmask() == 0b010
+    assert model.decode_bitmasks(3).tolist() == [0b010] * 3
+
+
+def test_expected_burst():
+    """The expected burst is computed exactly from the accumulated angles"""
+    model = AngularModel(n=2, tau=2)
+    model.encode_vector([1, 0.5])
+    model.encode_vector([1, 0.5])
+    model.query([0, 0.5])
+    assert np.allclose(model.get_excitation_probabilities(), [1, 0])
+    assert model.expected_burst(OneBurst()) == pytest.approx(0.5)
+    assert model.expected_burst(ZeroBurst()) == pytest.approx(0.5)
+
+    # The exact expectation matches the one over many decoded states
+    model.bind_window([[0.3, 0.9], [0.2, 0.6]], [0.1, 0.1])
+    samples = model.decode_bitmasks(20000)
+    assert OneBurst().expectation(samples, n=2) == pytest.approx(
+        model.expected_burst(OneBurst()), abs=0.02
+    )
+    model.clear()
+    assert model.expected_burst(OneBurst()) == 0
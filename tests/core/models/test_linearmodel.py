@@ -192,3 +192,50 @@ def test_probabilities():
     # Check if at least 70% of the shots are 111 (coherent with the input)
     result = model.measure(shots)
     assert result["100"] / shots >= 0.8
+
+
+def test_encode_vector():
+    """Encoding a vector is equivalent to encoding each dimension"""
+    vector = [0.2, 0.9, 0.5]
+    model = LinearModel(n=3, tau=2)
+    for dim in range(model.n):
+        model.encode(vector[dim], dim)
+    vectorized = LinearModel(n=3, tau=2)
+    angles = vectorized.encode_vector(np.array(vector))
+    assert angles.shape == (3,)
+    assert np.allclose(vectorized.get_statevector(), model.get_statevector())
+
+    # Testing wrong inputs
+    with pytest.raises(ValueError):
+        vectorized.encode_vector([0.1, 0.2])  # size < n
+    with pytest.raises(TypeError):
+        vectorized.encode_vector(["a", 0.2, 0.3])  # wrong type
+    with pytest.raises(ValueError):
+        vectorized.encode_vector([0.1, 1.2, 0.3])  # second element is 1.2
+
+
+def test_encode_window():
+    """Encoding a window applies one fused rotation per qubit"""
+    window = np.array([[0.2, 0.9, 0.5], [0.7, 0.1, 0.5]])
+    model = LinearModel(n=3, tau=2)
+    for t in range(model.tau):
+        for dim in range(model.n):
+            model.encode(window[t][dim], dim)
+    vectorized = LinearModel(n=3, tau=2)
+    vectorized.encode_window(window)
+    assert len(vectorized.circ.data) == vectorized.n
+    assert np.allclose(vectorized.get_statevector(), model.get_statevector())
+
+    # Testing wrong inputs
+    with pytest.raises(ValueError):
+        vectorized.encode_window(window[0])  # missing time axis
+    with pytest.raises(ValueError):
+        vectorized.encode_window(-window)  # negative inputs
+
+
+def test_evaluate_batch():
+    """Batched evaluation uses the linear encoding"""
+    model = LinearModel(n=2, tau=1)
+    result = model.evaluate_batch(np.array([[[0.25, 1.0]]]), query=[0, 0])
+    assert np.allclose(result.probabilities, [[0.25, 1.0]])
+    assert result.bursts is None
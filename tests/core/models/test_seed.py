@@ -0,0 +1,45 @@
+"""Tests for reproducible sampling through seeded random generators."""
+
+import numpy as np
+import pytest
+
+from qrobot.backends import NumpyBackend, ProductStateBackend, QiskitBackend
+from qrobot.models import AngularModel
+
+BACKENDS = [NumpyBackend, ProductStateBackend, QiskitBackend]
+
+
+def _model(backend, seed) -> AngularModel:
+    model = AngularModel(n=3, tau=1, backend=backend, seed=seed)
+    model.encode_vector([0.5, 0.3, 0.8])
+    return model
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_seeded_models_are_reproducible(backend_class):
+    first, second = (_model(backend_class(), seed=7) for _ in range(2))
+    assert first.measure(shots=100) == second.measure(shots=100)
+    assert first.decode_many(20) == second.decode_many(20)
+    sequences = np.full((5, 1, 3), 0.5)
+    assert np.array_equal(
+        first.evaluate_batch(sequences, [0, 0, 0]).states,
+        second.evaluate_batch(sequences, [0, 0, 0]).states,
+    )
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_backend_seed(backend_class):
+    backend = backend_class(seed=3)
+    model = _model(backend, seed=None)
+    assert model.rng is backend.rng
+    samples = model.decode_many(20)
+    model.seed(3)
+    model.clear()
+    model.encode_vector([0.5, 0.3, 0.8])
+    assert model.decode_many(20) == samples
+
+
+def test_generator_is_shared():
+    rng = np.random.default_rng(0)
+    backend = ProductStateBackend(seed=rng)
+    assert backend.rng is rng
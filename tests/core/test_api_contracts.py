@@ -1,8 +1,10 @@
 """Tests for core abstract API contracts."""
 
+import numpy as np
 import pytest
 
 from qrobot.bursts.burst import Burst
+from qrobot.models import Model
 
 
 def test_burst_is_abstract() -> None:
@@ -20,3 +22,76 @@ def test_abstract_burst_default_cannot_silently_return_none() -> None:
 
     with pytest.raises(NotImplementedError):
         IncompleteBurst()("0")
+
+
+def test_burst_batch_defaults_to_calling_the_burst() -> None:
+    """Custom bursts get a (looping) batch and expectation API for free."""
+
+    class FirstQubitBurst(Burst):
+        supports_bitmasks = True
+
+        def __call__(self, state: str | int, n: int | None = None) -> float:
+            return float(int(state, 2) & 1) if isinstance(state, str) else state & 1
+
+    burst = FirstQubitBurst()
+    assert burst.batch(["01", "10"]).tolist() == [1.0, 0.0]
+    assert burst.expectation({0b01: 3, 0b10: 1}) == 0.75
+
+
+def test_label_bursts_batch_bitmasks_as_labels() -> None:
+    """Bursts which only accept labels also batch bitmasks of known size."""
+
+    class LastQubitBurst(Burst):
+        def __call__(self, state: str) -> float:
+            return float(state[0])
+
+    burst = LastQubitBurst()
+    assert burst.batch(["01", "10"]).tolist() == [0.0, 1.0]
+    assert burst.batch(np.array([0b01, 0b10]), n=2).tolist() == [0.0, 1.0]
+    assert burst.expectation({0b01: 3, 0b10: 1}, n=2) == 0.25
+    with pytest.raises(ValueError):
+        burst.batch([0b01])
+
+
+def test_burst_expected_value_requires_a_closed_form() -> None:
+    """Bursts without a closed-form expectation say so explicitly."""
+
+    class LabelBurst(Burst):
+        def __call__(self, state: str) -> float:
+            return 0.0
+
+    with pytest.raises(NotImplementedError):
+        LabelBurst().expected_value(np.array([0.5]))
+
+
+def test_scalar_only_models_still_work() -> None:
+    """Models without the angle hooks build and encode, but cannot batch."""
+
+    class ScalarOnlyModel(Model):
+        def encode(self, scalar_input: float, dim: int) -> float:
+            angle = float(np.pi * scalar_input)
+            self._rotate(angle, dim)
+            return angle
+
+        def decode(self) -> str:
+            return self.decode_many(1)[0]
+
+        def query(self, target_vector: list[float]) -> None:
+            pass
+
+    model = ScalarOnlyModel(n=1, tau=1)
+    model.encode(1.0, 0)
+    assert model.decode() == "1"
+    with pytest.raises(NotImplementedError, match="_encoding_angles"):
+        model.encode_window([[1.0]])
+
+
+def test_burst_expectation_of_no_states_is_nan() -> None:
+    """Empty inputs give an empty batch and an undefined mean, not an error."""
+
+    class FirstQubitBurst(Burst):
+        def __call__(self, state: str) -> float:
+            return 0.0
+
+    assert FirstQubitBurst().batch([]).shape == (0,)
+    assert np.isnan(FirstQubitBurst().expectation([]))
@@ -0,0 +1,41 @@
+"""Tests keeping the core package cheap to import in worker processes."""
+
+import json
+import os
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 1.5
+""" float: Maximum time (in seconds) allowed to import ``qrobot.models``.
+"""
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import qrobot.models
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "qiskit": "qiskit" in sys.modules}))
+"""
+
+
+def _import_models() -> dict[str, object]:
+    """Import ``qrobot.models`` in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_models_import_does_not_import_qiskit() -> None:
+    assert _import_models()["qiskit"] is False
+
+
+def test_models_import_time_is_within_budget() -> None:
+    # Keep the fastest of a few runs to reduce noise from a busy machine
+    elapsed = min(float(_import_models()["elapsed"]) for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET
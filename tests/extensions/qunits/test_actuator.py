@@ -1,5 +1,6 @@
 """Tests for thesis-style Redis actuator interfaces."""
 
+import threading
 from time import monotonic, sleep
 
 import pytest
@@ -7,8 +8,32 @@ from redis.exceptions import ConnectionError
 
 from qrobot_qunits import ActuatorUnit, RedisConfig, redis_utils
 from qrobot_qunits.actuator import threshold_activation
+from qrobot_qunits.scheduler import SchedulerStats
 
 TEST_REDIS_CONFIG = RedisConfig(database=15)
+EVENTS_CONFIG = RedisConfig(database=15, events="pubsub", backend="memory")
+
+
+class Done(Exception):
+    """Raised to leave the endless loop of a unit."""
+
+
+def _loop_until_reports(
+    mocker, actuator: ActuatorUnit, reports: int
+) -> list[SchedulerStats]:
+    """Run the actuator's loop until it published some timing reports."""
+    mocker.patch("qrobot_qunits.base.TIMING_REPORT_PERIOD", 0.1)
+    published: list[SchedulerStats] = []
+
+    def publish_timing(stats: SchedulerStats) -> None:
+        published.append(stats)
+        if len(published) == reports:
+            raise Done
+
+    mocker.patch.object(actuator, "_publish_timing", side_effect=publish_timing)
+    with pytest.raises(Done):
+        actuator._loop()
+    return published
 
 
 def test_actuator_threshold_is_strict_and_normalized():
@@ -65,3 +90,91 @@ def test_actuator_reads_bursts_and_publishes_activation():
 
     # Verify that all actuator data was properly cleaned up from Redis
     assert redis_utils.redis_status(TEST_REDIS_CONFIG) == {}
+
+
+def test_actuator_ticks_on_the_memory_backend():
+    config = RedisConfig(database=15, backend="memory")
+    redis_utils.write_units(config, {"p1": {"output": 1.0}, "p2": {"output": 0.0}})
+    actuator = ActuatorUnit("gripper", ["p1", "p2"], 0.02, redis_config=config)
+    with pytest.raises(ValueError):
+        actuator.start()
+    actuator._register()
+    try:
+        actuator._unit_task()
+        # The normalized sum equals the strict threshold
+        assert actuator.get_activation() == 0.0
+        redis_utils.write_unit(config, "p2", {"output": 0.5})
+        actuator._unit_task()
+        assert actuator.get_activation() == 1.0
+        assert redis_utils.units_status(config)[actuator.id] == {
+            "class": "ActuatorUnit",
+            "input": "0.75",
+            "output": "1.0",
+            "in_qunits": '{"0": "p1", "1": "p2"}',
+        }
+    finally:
+        actuator._unregister()
+        redis_utils.delete_unit_fields(config, "p1", ["output"])
+        redis_utils.delete_unit_fields(config, "p2", ["output"])
+    assert redis_utils.redis_status(config) == {}
+
+
+def test_actuator_reads_all_bursts_in_one_round_trip(mocker):
+    actuator = ActuatorUnit(
+        "gripper",
+        ["p1", "p2"],
+        0.02,
+        default_input=0.25,
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    client = mocker.Mock()
+    client.mget.return_value = ["1.0", None]
+    mocker.patch.object(redis_utils, "get_redis", return_value=client)
+    assert actuator.input_vector == [1.0, 0.25]
+    client.mget.assert_called_once_with(["p1 output", "p2 output"])
+
+
+def test_actuator_publishes_its_couplings_once(mocker):
+    actuator = ActuatorUnit("gripper", ["p1"], 0.02, redis_config=TEST_REDIS_CONFIG)
+    client = mocker.Mock()
+    client.mget.return_value = ["1.0"]
+    mocker.patch.object(redis_utils, "get_redis", return_value=client)
+    actuator._unit_task()
+    actuator._unit_task()
+    first, second = (call.args[0] for call in client.mset.call_args_list)
+    assert set(first) - set(second) == {actuator.id + " in_qunits"}
+    assert second == {actuator.id + " input": 1.0, actuator.id + " output": 1.0}
+    # A new run publishes them again, e.g. after they were cleaned
+    actuator._register()
+    actuator._unit_task()
+    assert actuator.id + " in_qunits" in client.mset.call_args.args[0]
+
+
+def test_idle_event_driven_actuator_does_not_overrun(mocker):
+    actuator = ActuatorUnit("gripper", ["quiet"], 0.02, redis_config=EVENTS_CONFIG)
+    stats = _loop_until_reports(mocker, actuator, 3)[-1]
+    assert stats.ticks >= 10
+    assert stats.overruns == 0
+
+
+def test_event_driven_actuator_reports_timing_under_events(mocker):
+    actuator = ActuatorUnit("gripper", ["busy"], 0.05, redis_config=EVENTS_CONFIG)
+    stopped = threading.Event()
+
+    def publish_inputs() -> None:
+        deadline = monotonic() + 2
+        while not stopped.is_set() and monotonic() < deadline:
+            redis_utils.write_unit(EVENTS_CONFIG, "busy", {"output": 1.0})
+            sleep(0.0005)
+
+    publisher = threading.Thread(target=publish_inputs)
+    publisher.start()
+    start = monotonic()
+    try:
+        _loop_until_reports(mocker, actuator, 2)
+        # Reports do not wait for the inputs to go quiet
+        assert monotonic() - start < 1
+    finally:
+        stopped.set()
+        publisher.join()
+        redis_utils.flush_redis(EVENTS_CONFIG)
@@ -0,0 +1,123 @@
+"""Tests for running units in an asyncio event loop."""
+
+import asyncio
+from time import monotonic
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from qrobot.bursts import ZeroBurst
+from qrobot.models import AngularModel
+from qrobot_qunits import (
+    ActuatorUnit,
+    AsyncUnitRuntime,
+    QUnit,
+    RedisConfig,
+    SensorialUnit,
+    redis_utils,
+)
+from qrobot_qunits.aio import get_async_redis
+from qrobot_qunits.base import BaseUnit
+
+TEST_REDIS_CONFIG = RedisConfig(database=15)
+
+
+def test_runtime_steps_units_on_their_period(mocker):
+    client = mocker.Mock()
+    client.aclose = mocker.AsyncMock()
+    pipeline = client.pipeline.return_value
+    pipeline.execute = mocker.AsyncMock(return_value=[True])
+    mocker.patch("qrobot_qunits.aio.get_async_redis", return_value=client)
+    mocker.patch("qrobot_qunits.redis_utils.get_redis")
+    sensor = SensorialUnit("sensor", 0.02, redis_config=TEST_REDIS_CONFIG)
+    sensor.scalar_reading = 0.5
+
+    async def run_for(seconds: float) -> None:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(AsyncUnitRuntime([sensor]).run(), seconds)
+
+    asyncio.run(run_for(0.11))
+    # One write at once, then one per period, give or take a late tick
+    assert 4 <= pipeline.execute.await_count <= 6
+    pipeline.mset.assert_called_with({f"{sensor.id} output": 0.5})
+    client.aclose.assert_awaited_once()
+
+
+def test_units_without_step_run_in_a_thread(mocker):
+    client = mocker.Mock()
+    client.aclose = mocker.AsyncMock()
+    mocker.patch("qrobot_qunits.aio.get_async_redis", return_value=client)
+    mocker.patch("qrobot_qunits.redis_utils.get_redis")
+    to_thread = mocker.spy(asyncio, "to_thread")
+    ticks = []
+
+    class TaskUnit(BaseUnit):
+        def _clean_redis(self) -> None:
+            pass
+
+        def _unit_task(self) -> None:
+            ticks.append(monotonic())
+
+    unit = TaskUnit("task", 0.02, redis_config=TEST_REDIS_CONFIG)
+    assert not unit.supports_step
+    assert SensorialUnit.supports_step
+
+    async def run_for(seconds: float) -> None:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(AsyncUnitRuntime([unit]).run(), seconds)
+
+    asyncio.run(run_for(0.05))
+    assert ticks
+    assert any(call.args[0] == unit._unit_task for call in to_thread.call_args_list)
+
+
+def test_runtime_rejects_invalid_units():
+    sensor = SensorialUnit("sensor", 0.02, redis_config=TEST_REDIS_CONFIG)
+    with pytest.raises(ValueError):
+        AsyncUnitRuntime([])
+    with pytest.raises(ValueError):
+        AsyncUnitRuntime([sensor, sensor])
+
+
+@pytest.mark.redis
+def test_runtime_runs_a_network_in_one_event_loop():
+    client = redis_utils.get_redis(TEST_REDIS_CONFIG)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    sensor = SensorialUnit("sensor", 0.05, redis_config=TEST_REDIS_CONFIG)
+    qunit = QUnit(
+        "qunit",
+        AngularModel(n=1, tau=2),
+        ZeroBurst(),
+        0.05,
+        in_qunits={0: sensor.id},
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    actuator = ActuatorUnit(
+        "actuator", [qunit.id], 0.05, redis_config=TEST_REDIS_CONFIG
+    )
+
+    async def run_network() -> None:
+        runtime = asyncio.create_task(AsyncUnitRuntime([sensor, qunit, actuator]).run())
+        deadline = monotonic() + 5
+        # The qunit outputs once its window is full
+        while qunit.get_burst_output() is None and monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        assert qunit.get_burst_output() is not None
+        assert actuator.get_activation() is not None
+        runtime.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runtime
+
+    asyncio.run(run_network())
+    assert redis_utils.redis_status(TEST_REDIS_CONFIG) == {}
+
+
+def test_async_client_decodes_responses():
+    client = get_async_redis(TEST_REDIS_CONFIG)
+    kwargs = client.connection_pool.connection_kwargs
+    assert kwargs["db"] == 15
+    assert kwargs["decode_responses"]
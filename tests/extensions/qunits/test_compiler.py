@@ -0,0 +1,137 @@
+"""Tests for compiling networks of units into vectorized steps."""
+
+import json
+
+import numpy as np
+import pytest
+
+from qrobot.bursts import OneBurst, ZeroBurst
+from qrobot.models import AngularModel, LinearModel
+from qrobot_qunits import (
+    ActuatorUnit,
+    LocalTransport,
+    QUnit,
+    RedisConfig,
+    SensorialUnit,
+    compile_network,
+    redis_utils,
+    run_network,
+)
+
+MEMORY_CONFIG = RedisConfig(database=15, backend="memory")
+
+
+def _network(expected_output: bool, **unit_options):
+    sensors = [SensorialUnit(f"s{i}", 0.1, **unit_options) for i in range(2)]
+    first = QUnit(
+        "first",
+        AngularModel(n=2, tau=2),
+        ZeroBurst(),
+        0.1,
+        query=[0.2, 0.7],
+        in_qunits={0: sensors[0].id, 1: sensors[1].id},
+        expected_output=expected_output,
+        **unit_options,
+    )
+    second = QUnit(
+        "second",
+        LinearModel(n=2, tau=1),
+        OneBurst(),
+        0.1,
+        in_qunits={0: first.id},
+        default_input=[0.3, 0.6],
+        expected_output=expected_output,
+        **unit_options,
+    )
+    actuator = ActuatorUnit(
+        "actuator", [first.id, second.id], 0.1, threshold=0.4, **unit_options
+    )
+    # Units are given out of order on purpose
+    return [actuator, second, sensors[1], first, sensors[0]]
+
+
+def test_compiled_network_matches_the_units():
+    units = _network(expected_output=True, transport=LocalTransport())
+    network = compile_network(units)
+    actuator, second, sensor1, first, sensor0 = units
+    assert network.ids == tuple(
+        unit.id for unit in (sensor1, sensor0, first, second, actuator)
+    )
+    readings = np.random.default_rng(0).random((7, 2))
+    compiled = network.run(readings)
+    by_id = {unit.id: unit for unit in units}
+    for tick, reading in enumerate(readings):
+        for sensor_id, value in zip(network.sensor_ids, reading):
+            by_id[sensor_id].scalar_reading = value
+        for unit_id in network.ids:
+            by_id[unit_id]._unit_task()
+        outputs = [
+            by_id[unit_id].transport.read([unit_id], "output")[0]
+            for unit_id in network.ids
+        ]
+        expected = [np.nan if value is None else float(value) for value in outputs]
+        assert np.allclose(compiled[tick], expected, equal_nan=True)
+    # The first qUnit outputs every two ticks only
+    assert np.isnan(compiled[0, 2]) and not np.isnan(compiled[1, 2])
+
+
+def test_sampled_outputs_are_reproducible_and_certain_states_exact():
+    readings = np.zeros((4, 2))
+    runs = [
+        compile_network(_network(expected_output=False), seed=3).run(readings)
+        for _ in range(2)
+    ]
+    assert np.array_equal(runs[0], runs[1], equal_nan=True)
+    # Zero inputs with a zero query always decode "0", and outputs are kept
+    # until the next window completes
+    sensor = SensorialUnit("sensor", 0.1)
+    qunit = QUnit(
+        "qunit", AngularModel(n=1, tau=2), ZeroBurst(), 0.1, in_qunits={0: sensor.id}
+    )
+    outputs = compile_network([sensor, qunit]).run(np.zeros((4, 1)))
+    assert np.array_equal(outputs[:, 1], [np.nan, 1.0, 1.0, 1.0], equal_nan=True)
+
+
+def test_compile_rejects_invalid_networks():
+    sensor = SensorialUnit("sensor", 0.1)
+    first = QUnit("first", AngularModel(n=1, tau=1), ZeroBurst(), 0.1)
+    second = QUnit("second", AngularModel(n=1, tau=1), ZeroBurst(), 0.1)
+    first.set_input(0, second.id)
+    second.set_input(0, first.id)
+    with pytest.raises(ValueError, match="cycle"):
+        compile_network([first, second])
+    with pytest.raises(ValueError, match="missing"):
+        compile_network([first])
+    with pytest.raises(ValueError):
+        compile_network([sensor, sensor])
+    with pytest.raises(ValueError):
+        compile_network([sensor]).step([1.5])
+
+
+def test_run_network_publishes_outputs_and_cleans_up(mocker):
+    units = _network(expected_output=True, redis_config=MEMORY_CONFIG)
+    actuator, second, sensor1, first, sensor0 = units
+    redis_utils.flush_redis(MEMORY_CONFIG)
+    network = compile_network(units)
+    statuses = []
+    publish = network.publish
+
+    def publish_and_record() -> None:
+        publish()
+        statuses.append(redis_utils.units_status(MEMORY_CONFIG))
+
+    mocker.patch.object(network, "publish", side_effect=publish_and_record)
+    run_network(network, sampling_period=0.01, ticks=2)
+    # Couplings are published at once, outputs when they are computed
+    assert set(statuses[0]) == set(network.ids)
+    assert json.loads(statuses[0][first.id]["in_qunits"]) == {
+        "0": sensor0.id,
+        "1": sensor1.id,
+    }
+    assert "output" not in statuses[0][first.id]
+    assert float(statuses[1][first.id]["output"]) == network.outputs[2]
+    assert float(statuses[1][actuator.id]["output"]) == network.outputs[-1]
+    assert redis_utils.redis_status(MEMORY_CONFIG) == {}
+    # A new run publishes the couplings again
+    run_network(network, sampling_period=0.01, ticks=1)
+    assert "in_qunits" in statuses[2][first.id]
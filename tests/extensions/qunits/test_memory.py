@@ -0,0 +1,103 @@
+"""Tests for the in-process Redis store."""
+
+import asyncio
+
+import pytest
+
+from qrobot.bursts import ZeroBurst
+from qrobot.models import AngularModel
+from qrobot_qunits import (
+    ActuatorUnit,
+    AsyncUnitRuntime,
+    QUnit,
+    RedisConfig,
+    SensorialUnit,
+    redis_utils,
+)
+from qrobot_qunits.memory import MemoryRedis
+
+MEMORY_CONFIG = RedisConfig(database=15, backend="memory")
+
+
+@pytest.fixture
+def client():
+    client = MemoryRedis(database=15)
+    client.flushdb()
+    yield client
+    client.flushdb()
+
+
+def test_get_redis_selects_the_memory_store(client):
+    client.set("key", 1.5)
+    assert isinstance(redis_utils.get_redis(MEMORY_CONFIG), MemoryRedis)
+    assert redis_utils.get_redis(MEMORY_CONFIG).get("key") == "1.5"
+    # Databases are separate
+    assert MemoryRedis(database=14).get("key") is None
+
+
+@pytest.mark.parametrize(
+    "pattern, keys",
+    [
+        ("*", ["a b", "a*", "ab", "b"]),
+        ("a?", ["a*", "ab"]),
+        ("a\\*", ["a*"]),
+        ("[ab]", ["b"]),
+        ("a[^ *]", ["ab"]),
+    ],
+)
+def test_scan_matches_redis_glob_patterns(client, pattern, keys):
+    client.mset({key: 0 for key in ["a b", "a*", "ab", "b"]})
+    assert sorted(client.scan_iter(match=pattern)) == keys
+
+
+def test_pipeline_returns_the_results_of_its_commands(client):
+    pipeline = client.pipeline(transaction=False)
+    pipeline.hset("h", mapping={"a": 1, "b": 2.0}).sadd("s", "x", "y")
+    pipeline.hdel("h", "a", "c").mget(["h", "missing"])
+    assert pipeline.execute() == [2, 2, 1, [None, None]]
+    assert client.hgetall("h") == {"b": "2.0"}
+    assert pipeline.execute() == []
+
+
+def test_streams_are_trimmed_and_read_after_an_id(client):
+    ids = [client.xadd("s", {"output": value}, maxlen=2) for value in range(3)]
+    assert client.xrevrange("s", count=5) == [
+        (ids[2], {"output": "2"}),
+        (ids[1], {"output": "1"}),
+    ]
+    assert client.xread({"s": ids[1]}, block=10) == [["s", [(ids[2], {"output": "2"})]]]
+    assert client.xread({"s": ids[2]}, block=10) == []
+
+
+def test_async_runtime_runs_a_network_without_redis():
+    sensor = SensorialUnit("sensor", 0.02, redis_config=MEMORY_CONFIG)
+    qunit = QUnit(
+        "qunit",
+        AngularModel(n=1, tau=2),
+        ZeroBurst(),
+        0.02,
+        in_qunits={0: sensor.id},
+        redis_config=MEMORY_CONFIG,
+    )
+    actuator = ActuatorUnit("actuator", [qunit.id], 0.02, redis_config=MEMORY_CONFIG)
+
+    async def run_network() -> None:
+        runtime = asyncio.create_task(AsyncUnitRuntime([sensor, qunit, actuator]).run())
+        while qunit.get_burst_output() is None:
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.1)
+        # A window of zero readings with a zero query always decodes to "0"
+        assert qunit.get_burst_output() == 1.0
+        assert actuator.get_activation() == 1.0
+        assert set(redis_utils.units_status(MEMORY_CONFIG)) == {
+            sensor.id,
+            qunit.id,
+            actuator.id,
+        }
+        runtime.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runtime
+
+    redis_utils.flush_redis(MEMORY_CONFIG)
+    asyncio.run(asyncio.wait_for(run_network(), 10))
+    assert redis_utils.redis_status(MEMORY_CONFIG) == {}
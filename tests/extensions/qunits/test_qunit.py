@@ -5,11 +5,12 @@ import pytest
 import pytest_check as check
 from redis.exceptions import ConnectionError
 
-from qrobot.bursts import ZeroBurst
+from qrobot.bursts import Burst, ZeroBurst
 from qrobot.models import AngularModel
 from qrobot_qunits import QUnit, RedisConfig, SensorialUnit, redis_utils
 
 TEST_REDIS_CONFIG = RedisConfig(database=15)
+MEMORY_REDIS_CONFIG = RedisConfig(database=15, backend="memory")
 
 # Using pytest_check for this test to allow the whole test
 # to execute and stop the multithreading via unit.stop()
@@ -17,23 +18,36 @@ TEST_REDIS_CONFIG = RedisConfig(database=15)
 # and leaving the unit subprocesses open.
 
 
+@pytest.fixture(
+    params=[
+        pytest.param(TEST_REDIS_CONFIG, marks=pytest.mark.redis, id="redis"),
+        # The in-process store runs the same checks without a server
+        pytest.param(MEMORY_REDIS_CONFIG, id="memory"),
+    ]
+)
+def redis_config(request) -> RedisConfig:
+    """Database of the qBrain."""
+    config: RedisConfig = request.param
+    return config
+
+
 @pytest.fixture
-def fixture_flush_redis() -> None:
+def fixture_flush_redis(redis_config: RedisConfig) -> None:
     """Flush redis before starting the test."""
     try:
-        redis_utils.get_redis(TEST_REDIS_CONFIG).ping()
+        redis_utils.get_redis(redis_config).ping()
     except ConnectionError:
         pytest.skip("Redis is not available on localhost:6379")
-    redis_utils.flush_redis(TEST_REDIS_CONFIG)
-    check.equal(redis_utils.redis_status(TEST_REDIS_CONFIG), {})
+    redis_utils.flush_redis(redis_config)
+    check.equal(redis_utils.redis_status(redis_config), {})
 
 
 @pytest.fixture
-def fixture_q_brain() -> Tuple[QUnit, QUnit, QUnit]:
+def fixture_q_brain(redis_config: RedisConfig) -> Tuple[QUnit, QUnit, QUnit]:
     """Initialize the qBrain."""
     # Layer 0
     l0_unit0 = SensorialUnit(
-        name="l0_unit0", sampling_period=0.05, redis_config=TEST_REDIS_CONFIG
+        name="l0_unit0", sampling_period=0.05, redis_config=redis_config
     )
     check.equal(
         dict(l0_unit0),
@@ -50,7 +64,7 @@ def fixture_q_brain() -> Tuple[QUnit, QUnit, QUnit]:
         burst=ZeroBurst(),
         sampling_period=0.2,
         in_qunits={0: l0_unit0.id},  # Will receive Input from l0_unit0, dim 0
-        redis_config=TEST_REDIS_CONFIG,
+        redis_config=redis_config,
     )
     l1_unit1 = QUnit(
         name="l1_unit1",
@@ -58,14 +72,13 @@ def fixture_q_brain() -> Tuple[QUnit, QUnit, QUnit]:
         burst=ZeroBurst(),
         sampling_period=0.2,
         in_qunits={0: l0_unit0.id},  # Will receive input from l0_unit0, dim 1
-        redis_config=TEST_REDIS_CONFIG,
+        redis_config=redis_config,
     )
     # Return qBrain
     q_brain = (l0_unit0, l1_unit0, l1_unit1)
     return q_brain
 
 
-@pytest.mark.redis
 def test_init_qunits(
     fixture_flush_redis,
     fixture_q_brain: Tuple[QUnit, QUnit, QUnit],
@@ -117,6 +130,7 @@ def test_init_qunits(
 
 
 @pytest.mark.redis
+@pytest.mark.parametrize("redis_config", [TEST_REDIS_CONFIG], ids=["redis"])
 def test_qunit(
     fixture_flush_redis,
     fixture_q_brain: Tuple[QUnit, QUnit, QUnit],
@@ -148,3 +162,123 @@ def test_qunit(
             unit.stop()
 
     assert redis_utils.redis_status(TEST_REDIS_CONFIG) == {}
+
+
+def test_qunit_ticks(
+    redis_config: RedisConfig,
+    fixture_flush_redis,
+    fixture_q_brain: Tuple[QUnit, QUnit, QUnit],
+):
+    """Ticks run in this process publish outputs, cleaned on unregistering."""
+    l0_unit0, l1_unit0, l1_unit1 = fixture_q_brain
+    units = (l0_unit0, l1_unit0, l1_unit1)
+    for unit in units:
+        unit._register()
+    try:
+        l0_unit0.scalar_reading = 0.0
+        # Enough ticks to fill the longest temporal window
+        for _ in range(l1_unit1.model.tau):
+            for unit in units:
+                unit._unit_task()
+        check.equal(l1_unit0.get_burst_output(), 1.0)
+        check.equal(l1_unit1.get_burst_output(), 1.0)
+        status = redis_utils.units_status(redis_config)
+        check.equal(set(status), {unit.id for unit in units})
+        check.equal(status[l1_unit0.id]["in_qunits"], f'{{"0": "{l0_unit0.id}"}}')
+    finally:
+        for unit in units:
+            unit._unregister()
+    assert redis_utils.redis_status(redis_config) == {}
+
+
+@pytest.mark.parametrize("redis_config", [MEMORY_REDIS_CONFIG], ids=["memory"])
+def test_memory_backend_units_cannot_be_started(fixture_q_brain) -> None:
+    """Worker processes would not share the in-process store."""
+    for unit in fixture_q_brain:
+        with pytest.raises(ValueError):
+            unit.start()
+        assert unit._loop_thread is None
+
+
+def test_input_vector_reads_all_inputs_in_one_round_trip(mocker) -> None:
+    """Coupled inputs are fetched with a single MGET, refreshed on set_input."""
+    unit = QUnit(
+        name="unit",
+        model=AngularModel(n=3, tau=1),
+        burst=ZeroBurst(),
+        sampling_period=0.1,
+        in_qunits={2: "a", 0: "b"},
+        default_input=[0.1, 0.2, 0.3],
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    client = mocker.Mock()
+    client.mget.return_value = ["0.5", None]
+    mocker.patch.object(redis_utils, "get_redis", return_value=client)
+
+    check.equal(unit.input_vector, [0.5, 0.2, 0.3])
+    client.mget.assert_called_once_with(["b output", "a output"])
+    client.get.assert_not_called()
+
+    unit.set_input(1, "c")
+    client.mget.return_value = ["0.5", "0.6", "0.7"]
+    check.equal(unit.input_vector, [0.5, 0.6, 0.7])
+    client.mget.assert_called_with(["b output", "c output", "a output"])
+
+
+def test_metadata_is_only_published_when_it_changes(mocker) -> None:
+    """Each window writes the output, plus query and couplings on change."""
+    unit = QUnit(
+        name="unit",
+        model=AngularModel(n=1, tau=2),
+        burst=ZeroBurst(),
+        sampling_period=0.1,
+        in_qunits={0: "a"},
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    client = mocker.Mock()
+    client.mget.return_value = ["1.0"]
+    mocker.patch.object(redis_utils, "get_redis", return_value=client)
+
+    def published_fields() -> set[str]:
+        for _ in range(unit.model.tau):
+            unit._unit_task()
+        (mapping,) = client.mset.call_args.args
+        return {key.removeprefix(unit.id + " ") for key in mapping}
+
+    check.equal(published_fields(), {"output", "state", "query", "in_qunits"})
+    check.equal(published_fields(), {"output", "state"})
+    # A new run publishes them again, e.g. after they were cleaned
+    unit._register()
+    check.equal(published_fields(), {"output", "state", "query", "in_qunits"})
+    unit.query = [0.5]
+    check.equal(published_fields(), {"output", "state", "query", "in_qunits"})
+    unit.set_input(0, "b")
+    check.equal(published_fields(), {"output", "state", "query", "in_qunits"})
+    check.equal(published_fields(), {"output", "state"})
+    # A new run publishes them again, e.g. after they were cleaned
+    unit._register()
+    check.equal(published_fields(), {"output", "state", "query", "in_qunits"})
+
+
+def test_label_bursts_are_called_with_labels(mocker) -> None:
+    """Custom bursts written against labels keep working in qUnits."""
+
+    class LastQubitBurst(Burst):
+        def __call__(self, state: str) -> float:
+            return float(state[0])
+
+    unit = QUnit(
+        name="unit",
+        model=AngularModel(n=2, tau=1),
+        burst=LastQubitBurst(),
+        sampling_period=0.1,
+        query=[0.0, 1.0],
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    client = mocker.Mock()
+    mocker.patch.object(redis_utils, "get_redis", return_value=client)
+
+    unit._unit_task()
+    (mapping,) = client.mset.call_args.args
+    check.equal(mapping[f"{unit.id} output"], 1.0)
+    check.equal(mapping[f"{unit.id} state"], "10")
@@ -0,0 +1,176 @@
+"""Tests for the Redis helpers shared by qUnits."""
+
+import multiprocessing
+import threading
+from time import monotonic
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from qrobot_qunits import RedisConfig, redis_utils
+
+# The integration tests also run hermetically on the in-process store
+BACKENDS = pytest.mark.parametrize(
+    "backend", [pytest.param("redis", marks=pytest.mark.redis), "memory"]
+)
+
+
+def _client_id(queue: "multiprocessing.Queue[int]") -> None:
+    queue.put(id(redis_utils.get_redis(RedisConfig(database=14))))
+
+
+def test_get_redis_reuses_one_client_per_config():
+    config = RedisConfig(database=14, max_connections=4, socket_timeout=0.5)
+    client = redis_utils.get_redis(config)
+    assert (
+        redis_utils.get_redis(
+            RedisConfig(database=14, max_connections=4, socket_timeout=0.5)
+        )
+        is client
+    )
+    assert redis_utils.get_redis(RedisConfig(database=13)) is not client
+    # Clients are lazy, so the pool settings are checked without a server
+    pool = client.connection_pool
+    assert pool.max_connections == 4
+    assert pool.connection_kwargs["socket_timeout"] == 0.5
+    assert pool.connection_kwargs["db"] == 14
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method is not available",
+)
+def test_get_redis_creates_new_clients_after_fork():
+    parent = redis_utils.get_redis(RedisConfig(database=14))
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_client_id, args=(queue,))
+    process.start()
+    child = queue.get(timeout=10)
+    process.join()
+    # The child inherits the parent's memory layout, so a reused client
+    # would keep the same identity
+    assert child != id(parent)
+
+
+def test_status_patterns_escape_unit_ids():
+    assert redis_utils._escape_pattern("unit*[0]?") == "unit\\*\\[0\\]\\?"
+
+
+@BACKENDS
+def test_redis_status_filters_and_batches_keys(monkeypatch, backend):
+    config = RedisConfig(database=15, backend=backend)
+    client = redis_utils.get_redis(config)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    # Use small batches so that the snapshot needs several MGETs
+    monkeypatch.setattr(redis_utils, "MGET_BATCH_SIZE", 7)
+    client.mset({f"unit{i} output": i for i in range(20)})
+    client.mset({"unit1 state": "01", "unit* output": 1.0})
+    try:
+        status = redis_utils.redis_status(config)
+        assert len(status) == 22
+        assert status["unit19 output"] == "19"
+        assert redis_utils.redis_status(config, unit_id="unit1") == {
+            "unit1 output": "1",
+            "unit1 state": "01",
+        }
+        assert len(redis_utils.redis_status(config, suffix="output")) == 21
+        assert redis_utils.redis_status(config, unit_id="unit*") == {
+            "unit* output": "1.0"
+        }
+        assert redis_utils.redis_status(config, match="unit1? *") == {
+            f"unit{i} output": str(i) for i in range(10, 20)
+        }
+    finally:
+        client.flushdb()
+
+
+def test_redis_config_rejects_unknown_schemas():
+    with pytest.raises(ValueError):
+        RedisConfig(schema="json")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        RedisConfig(events="polling")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        RedisConfig(backend="sqlite")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        redis_utils.OutputListener(RedisConfig())
+
+
+@BACKENDS
+def test_hash_schema_stores_one_hash_per_unit(backend):
+    config = RedisConfig(database=15, schema="hash", backend=backend)
+    client = redis_utils.get_redis(config)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    try:
+        redis_utils.register_unit(config, "u1", "QUnit")
+        assert redis_utils.write_unit(config, "u1", {"output": 1.0, "state": "1"})
+        redis_utils.register_unit(config, "u0", "SensorialUnit")
+        redis_utils.write_unit(config, "u0", {"output": 0.5})
+        assert set(client.keys()) == {
+            redis_utils.UNITS_KEY,
+            redis_utils.unit_key("u0"),
+            redis_utils.unit_key("u1"),
+        }
+        assert redis_utils.read_units_field(config, ["u1", "u0", "u2"], "output") == [
+            "1.0",
+            "0.5",
+            None,
+        ]
+        assert redis_utils.units_status(config) == {
+            "u0": {"class": "SensorialUnit", "output": "0.5"},
+            "u1": {"class": "QUnit", "output": "1.0", "state": "1"},
+        }
+        assert redis_utils.redis_status(config, suffix="output") == {
+            "u0 output": "0.5",
+            "u1 output": "1.0",
+        }
+        redis_utils.delete_unit_fields(config, "u1", ["state"])
+        redis_utils.unregister_unit(config, "u0")
+        assert redis_utils.units_status(config) == {
+            "u1": {"class": "QUnit", "output": "1.0"}
+        }
+    finally:
+        client.flushdb()
+
+
+@BACKENDS
+@pytest.mark.parametrize("events", ["pubsub", "stream"])
+def test_output_listener_wakes_on_new_outputs(events, backend):
+    config = RedisConfig(database=15, events=events, backend=backend)
+    client = redis_utils.get_redis(config)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    listener = redis_utils.OutputListener(config)
+    try:
+        assert not listener.wait(["a"], 0.05)
+        # Outputs published while not waiting are not lost
+        redis_utils.write_unit(config, "a", {"output": 1.0})
+        assert listener.wait(["a"], 1)
+        assert not listener.wait(["a"], 0.05)
+        # Waiting ends as soon as an input publishes
+        timer = threading.Timer(
+            0.1, redis_utils.write_unit, (config, "b", {"output": 0.5})
+        )
+        timer.start()
+        start = monotonic()
+        assert listener.wait(["a", "b"], 5)
+        assert monotonic() - start < 1
+        timer.join()
+        assert redis_utils.read_units_field(config, ["a", "b"], "output") == [
+            "1.0",
+            "0.5",
+        ]
+    finally:
+        listener.close()
+        client.flushdb()
@@ -0,0 +1,150 @@
+"""Tests for running many units in shared worker processes."""
+
+from time import monotonic, sleep
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from qrobot.bursts import ZeroBurst
+from qrobot.models import AngularModel
+from qrobot_qunits import (
+    ActuatorUnit,
+    QUnit,
+    RedisConfig,
+    SensorialUnit,
+    UnitRuntime,
+    redis_utils,
+)
+from qrobot_qunits.base import BaseUnit
+from qrobot_qunits.runtime import run_units
+
+TEST_REDIS_CONFIG = RedisConfig(database=15)
+
+
+class Done(BaseException):
+    """Raised to leave the endless loop of the runtime, which logs and skips
+    the ``Exception`` raised by units."""
+
+
+class CountingUnit(BaseUnit):
+    def __init__(self, name: str, sampling_period: float, ticks: list[str]):
+        super().__init__(name, sampling_period, TEST_REDIS_CONFIG)
+        self.ticks = ticks
+
+    def _clean_redis(self) -> None:
+        pass
+
+    def _unit_task(self) -> None:
+        self.ticks.append(self.name)
+        if len(self.ticks) == 15:
+            raise Done
+
+
+def test_run_units_follows_each_unit_period():
+    ticks: list[str] = []
+    units = [CountingUnit("fast", 0.01, ticks), CountingUnit("slow", 0.04, ticks)]
+    start = monotonic()
+    with pytest.raises(Done):
+        run_units(units)
+    # Both run at once, then "slow" ticks once every four "fast" ticks
+    assert ticks[:2] == ["fast", "slow"]
+    assert ticks.count("slow") == 3
+    assert monotonic() - start == pytest.approx(0.11, abs=0.05)
+
+
+def test_run_units_keeps_running_after_a_unit_fails(caplog):
+    ticks: list[str] = []
+
+    class FailingUnit(CountingUnit):
+        def _unit_task(self) -> None:
+            super()._unit_task()
+            raise RuntimeError("unit failure")
+
+    units = [FailingUnit("failing", 0.01, ticks), CountingUnit("ok", 0.01, ticks)]
+    with pytest.raises(Done):
+        run_units(units)
+    # The failing unit is rescheduled and the other one keeps ticking
+    assert ticks.count("failing") >= 7 and ticks.count("ok") >= 7
+    assert "Task failed" in caplog.text
+
+
+def test_runtime_rejects_invalid_pools():
+    unit = CountingUnit("unit", 0.01, [])
+    with pytest.raises(ValueError):
+        UnitRuntime([])
+    with pytest.raises(ValueError):
+        UnitRuntime([unit, unit])
+    with pytest.raises(ValueError):
+        UnitRuntime([unit], workers=0)
+    assert UnitRuntime([unit], workers=4).workers == 1
+
+
+@pytest.mark.redis
+def test_runtime_runs_a_network_in_two_workers():
+    client = redis_utils.get_redis(TEST_REDIS_CONFIG)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    sensor = SensorialUnit("sensor", 0.05, redis_config=TEST_REDIS_CONFIG)
+    qunit = QUnit(
+        "qunit",
+        AngularModel(n=1, tau=2),
+        ZeroBurst(),
+        0.05,
+        in_qunits={0: sensor.id},
+        redis_config=TEST_REDIS_CONFIG,
+    )
+    actuator = ActuatorUnit(
+        "actuator", [qunit.id], 0.05, redis_config=TEST_REDIS_CONFIG
+    )
+    runtime = UnitRuntime([sensor, qunit, actuator], workers=2)
+    try:
+        runtime.start()
+        deadline = monotonic() + 5
+        # The qunit outputs once its window is full
+        while qunit.get_burst_output() is None and monotonic() < deadline:
+            sleep(0.05)
+        assert qunit.get_burst_output() is not None
+        assert actuator.get_activation() is not None
+    finally:
+        runtime.stop()
+    assert redis_utils.redis_status(TEST_REDIS_CONFIG) == {}
+
+
+def test_runtime_refuses_units_on_the_memory_backend():
+    config = RedisConfig(database=15, backend="memory")
+    sensor = SensorialUnit("sensor", 0.05, redis_config=config)
+    runtime = UnitRuntime([sensor])
+    with pytest.raises(ValueError):
+        runtime.start()
+    assert not runtime.running
+    assert redis_utils.redis_status(config) == {}
+
+
+def test_run_units_runs_a_network_on_the_memory_backend():
+    config = RedisConfig(database=15, backend="memory")
+    sensor = SensorialUnit("sensor", 0.01, redis_config=config)
+    qunit = QUnit(
+        "qunit",
+        AngularModel(n=1, tau=2),
+        ZeroBurst(),
+        0.01,
+        in_qunits={0: sensor.id},
+        redis_config=config,
+    )
+    actuator = ActuatorUnit("actuator", [qunit.id], 0.01, redis_config=config)
+    units = [sensor, qunit, actuator]
+    for unit in units:
+        unit._register()
+    try:
+        # The counting unit leaves the loop once the others ticked a few times
+        with pytest.raises(Done):
+            run_units([*units, CountingUnit("stopper", 0.01, [])])
+        assert qunit.get_burst_output() == 1.0
+        assert actuator.get_activation() == 1.0
+    finally:
+        for unit in units:
+            unit._unregister()
+    assert redis_utils.redis_status(config) == {}
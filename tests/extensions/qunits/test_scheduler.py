@@ -0,0 +1,77 @@
+"""Tests for the drift-free scheduler of the units' loops."""
+
+import pytest
+
+from qrobot_qunits import PeriodicScheduler
+
+
+class FakeClock:
+    """Clock advanced by sleeps and by simulated task durations."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_deadlines_do_not_drift_with_task_time():
+    clock = FakeClock()
+    scheduler = PeriodicScheduler(0.1, clock=clock, sleep=clock.sleep)
+    for _ in range(50):
+        clock.now += 0.03  # task
+        assert scheduler.wait()
+    assert clock.now == pytest.approx(105.0)
+    stats = scheduler.stats()
+    assert (stats.ticks, stats.overruns, stats.skipped) == (50, 0, 0)
+    assert stats.max_jitter == pytest.approx(0.0)
+
+
+def test_skip_policy_drops_missed_ticks():
+    clock = FakeClock()
+    scheduler = PeriodicScheduler(0.1, clock=clock, sleep=clock.sleep)
+    clock.now += 0.35  # the first task overruns three deadlines
+    assert not scheduler.wait()
+    assert clock.now == pytest.approx(100.35)
+    # The schedule goes on from the original grid
+    assert scheduler.deadline == pytest.approx(100.4)
+    assert scheduler.wait()
+    stats = scheduler.stats()
+    assert (stats.ticks, stats.overruns, stats.skipped) == (2, 1, 2)
+    assert stats.max_jitter == pytest.approx(0.05)
+    assert stats.mean_jitter == pytest.approx(0.025)
+    assert stats.std_jitter == pytest.approx(0.025)
+
+
+def test_catch_up_policy_runs_missed_ticks_at_once():
+    clock = FakeClock()
+    scheduler = PeriodicScheduler(
+        0.1, policy="catch_up", clock=clock, sleep=clock.sleep
+    )
+    clock.now += 0.35
+    assert [scheduler.wait() for _ in range(4)] == [False, False, False, True]
+    assert clock.now == pytest.approx(100.4)
+    stats = scheduler.stats()
+    assert (stats.ticks, stats.overruns, stats.skipped) == (4, 3, 0)
+    assert stats.max_jitter == pytest.approx(0.25)
+
+
+def test_invalid_schedules_are_rejected():
+    with pytest.raises(ValueError):
+        PeriodicScheduler(0)
+    with pytest.raises(ValueError):
+        PeriodicScheduler(0.1, policy="later")  # type: ignore[arg-type]
+
+
+def test_advance_records_an_on_time_tick():
+    clock = FakeClock()
+    scheduler = PeriodicScheduler(0.1, clock=clock, sleep=clock.sleep)
+    # The caller waited for the deadline by other means, e.g. an event
+    clock.now += 0.1
+    scheduler.advance()
+    assert scheduler.deadline == pytest.approx(100.2)
+    stats = scheduler.stats()
+    assert (stats.ticks, stats.overruns, stats.skipped) == (1, 0, 0)
@@ -0,0 +1,74 @@
+"""Tests for the shared-memory state of units."""
+
+import multiprocessing
+from ctypes import c_double
+from multiprocessing.sharedctypes import RawArray
+
+import pytest
+
+from qrobot.bursts import ZeroBurst
+from qrobot.models import AngularModel
+from qrobot_qunits import QUnit, SensorialUnit
+from qrobot_qunits.seqlock import MAX_UNIT_ID_LENGTH, SeqLock
+
+
+def _read_pairs(lock: SeqLock, pair, started, reads: int, queue) -> None:
+    # Reads from a worker process, while the creating process writes
+    started.set()
+    snapshots = [lock.read(lambda: tuple(pair)) for _ in range(reads)]
+    queue.put((all(first == second for first, second in snapshots), snapshots[-1]))
+
+
+def _worker_state(unit: QUnit, sensor: SensorialUnit, started, changed, queue) -> None:
+    started.set()
+    changed.wait(timeout=30)
+    queue.put((unit.query, unit.in_qunits, sensor.scalar_reading))
+
+
+def test_reads_are_never_torn_by_concurrent_writes():
+    lock, pair = SeqLock(), RawArray(c_double, 2)
+    started, queue = multiprocessing.Event(), multiprocessing.Queue()
+    reader = multiprocessing.Process(
+        target=_read_pairs, args=(lock, pair, started, 20000, queue)
+    )
+    reader.start()
+    assert started.wait(timeout=30)
+    writes = 0
+    while reader.is_alive() and queue.empty():
+        with lock.write():
+            pair[0] = writes
+            pair[1] = writes
+        writes += 1
+    consistent, last = queue.get(timeout=30)
+    reader.join()
+    assert consistent
+    # The reader saw the writes of the parent process
+    assert last[0] > 0
+    assert lock.version == writes
+
+
+@pytest.mark.parametrize("method", multiprocessing.get_all_start_methods())
+def test_unit_state_is_shared_with_worker_processes(method):
+    sensor = SensorialUnit("sensor", 0.1)
+    unit = QUnit("unit", AngularModel(n=2, tau=1), ZeroBurst(), 0.1)
+    context = multiprocessing.get_context(method)
+    started, changed, queue = context.Event(), context.Event(), context.Queue()
+    worker = context.Process(
+        target=_worker_state, args=(unit, sensor, started, changed, queue)
+    )
+    worker.start()
+    # Changes made once the worker is running are seen by it
+    assert started.wait(timeout=30)
+    unit.query = [0.5, 1.0]
+    unit.set_input(1, sensor.id)
+    sensor.scalar_reading = 0.25
+    changed.set()
+    assert queue.get(timeout=30) == ([0.5, 1.0], {0: None, 1: sensor.id}, 0.25)
+    worker.join()
+
+
+def test_couplings_must_fit_in_shared_memory():
+    unit = QUnit("unit", AngularModel(n=1, tau=1), ZeroBurst(), 0.1)
+    with pytest.raises(ValueError):
+        unit.set_input(0, "u" * (MAX_UNIT_ID_LENGTH + 1))
+    assert unit.in_qunits == {0: None}
@@ -0,0 +1,163 @@
+"""Tests for the transports carrying the units' fields."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from qrobot.bursts import ZeroBurst
+from qrobot.models import AngularModel
+from qrobot_qunits import (
+    ActuatorUnit,
+    AsyncUnitRuntime,
+    LocalTransport,
+    QUnit,
+    RedisConfig,
+    SensorialUnit,
+    UnitRuntime,
+    redis_utils,
+)
+
+TEST_REDIS_CONFIG = RedisConfig(database=15)
+
+
+def _write_output(transport: LocalTransport, unit_id: str, value: float) -> None:
+    transport.write(unit_id, {"output": value})
+
+
+def test_local_transport_stores_outputs_only():
+    transport = LocalTransport(capacity=2)
+    transport.attach("a")
+    transport.attach("b")
+    assert transport.write("a", {"output": 0.25, "state": "01"})
+    assert transport.read(["a", "b", "unknown"], "output") == ["0.25", None, None]
+    assert transport.read(["a"], "state") == [None]
+    transport.delete("a", ["output"])
+    assert transport.read(["a"], "output") == [None]
+    # Units must have a slot to publish an output
+    assert not transport.write("unknown", {"output": 1.0})
+
+
+def test_unknown_ids_do_not_reread_the_table(mocker):
+    transport = LocalTransport(capacity=2)
+    transport.attach("a")
+    read_slots = mocker.spy(transport, "_read_slots")
+    for _ in range(3):
+        assert transport.read(["a", "unknown"], "output") == [None, None]
+    assert read_slots.call_count == 1
+    # Units created meanwhile are found
+    transport.attach("b")
+    transport.write("b", {"output": 1.0})
+    assert transport.read(["unknown", "b"], "output") == [None, "1.0"]
+    assert read_slots.call_count == 2
+
+
+def test_local_transport_rejects_units_beyond_capacity():
+    transport = LocalTransport(capacity=1)
+    transport.attach("a")
+    with pytest.raises(ValueError):
+        transport.attach("b")
+    with pytest.raises(ValueError):
+        LocalTransport(capacity=0)
+
+
+def test_concurrent_attaches_get_distinct_slots():
+    transport = LocalTransport(capacity=64)
+    ids = [f"unit{index}" for index in range(64)]
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(transport.attach, ids))
+    assert sorted(transport._slots[unit_id] for unit_id in ids) == list(range(64))
+
+
+@pytest.mark.parametrize("method", multiprocessing.get_all_start_methods())
+def test_local_transport_is_shared_with_worker_processes(method):
+    transport = LocalTransport()
+    transport.attach("before")
+    context = multiprocessing.get_context(method)
+    worker = context.Process(target=_write_output, args=(transport, "after", 0.5))
+    # Units attached after the worker exists are known to it too
+    transport.attach("after")
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    assert transport.read(["before", "after"], "output") == [None, "0.5"]
+
+
+def _network(transport: LocalTransport):
+    sensor = SensorialUnit("sensor", 0.05, transport=transport)
+    qunit = QUnit(
+        "qunit",
+        AngularModel(n=1, tau=2),
+        ZeroBurst(),
+        0.05,
+        in_qunits={0: sensor.id},
+        transport=transport,
+    )
+    actuator = ActuatorUnit("actuator", [qunit.id], 0.05, transport=transport)
+    return sensor, qunit, actuator
+
+
+def test_units_chain_through_a_local_transport():
+    sensor, qunit, actuator = _network(LocalTransport())
+    for _ in range(2):
+        for unit in (sensor, qunit, actuator):
+            unit._unit_task()
+    # A window of zero readings with a zero query always decodes to "0"
+    assert qunit.get_burst_output() == 1.0
+    assert actuator.get_activation() == 1.0
+
+
+def test_runtime_runs_a_local_network_without_redis():
+    sensor, qunit, actuator = _network(LocalTransport())
+    runtime = UnitRuntime([sensor, qunit, actuator], workers=2)
+    try:
+        runtime.start()
+        deadline = monotonic() + 5
+        while actuator.get_activation() != 1.0 and monotonic() < deadline:
+            sleep(0.05)
+        assert qunit.get_burst_output() is not None
+        assert actuator.get_activation() == 1.0
+    finally:
+        runtime.stop()
+    assert actuator.get_activation() is None
+
+
+@pytest.mark.redis
+def test_local_transport_mirrors_fields_on_redis():
+    client = redis_utils.get_redis(TEST_REDIS_CONFIG)
+    try:
+        client.ping()
+    except ConnectionError:
+        pytest.skip("Redis is not available on localhost:6379")
+    client.flushdb()
+    transport = LocalTransport(mirror=TEST_REDIS_CONFIG)
+    sensor = SensorialUnit("sensor", 0.05, transport=transport)
+    sensor._register()
+    sensor._unit_task()
+    assert redis_utils.units_status(TEST_REDIS_CONFIG) == {
+        sensor.id: {"class": "SensorialUnit", "output": "0.0"}
+    }
+    sensor._unregister()
+    assert redis_utils.redis_status(TEST_REDIS_CONFIG) == {}
+
+
+def test_async_runtime_runs_mirrored_units_in_threads(mocker):
+    mirror = RedisConfig(database=15, backend="memory")
+    to_thread = mocker.spy(asyncio, "to_thread")
+    local = SensorialUnit("local", 0.02, transport=LocalTransport())
+    mirrored = SensorialUnit("mirrored", 0.02, transport=LocalTransport(mirror=mirror))
+
+    async def run_for(seconds: float) -> None:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(AsyncUnitRuntime([local, mirrored]).run(), seconds)
+
+    try:
+        asyncio.run(run_for(0.05))
+        tasks = [call.args[0] for call in to_thread.call_args_list]
+        assert mirrored._unit_task in tasks
+        assert local._unit_task not in tasks
+    finally:
+        redis_utils.flush_redis(mirror)
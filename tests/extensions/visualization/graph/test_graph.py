@@ -60,3 +60,25 @@ def test_build_network_is_the_descriptive_public_api() -> None:
     status = {"l0 class": "SensorialUnit"}
 
     assert node_link_data(build_network(status)) == node_link_data(graph(status))
+
+
+def test_build_network_accepts_statuses_grouped_by_unit() -> None:
+    """Hash-schema snapshots give the same network as flat Redis keys."""
+    flat = {
+        "l0 class": "SensorialUnit",
+        "l0 output": "0.5",
+        "l1 class": "QUnit",
+        "l1 in_qunits": '{"0": "l0", "1": null}',
+        "l1 query": "[0.0]",
+    }
+    grouped = {
+        "l0": {"class": "SensorialUnit", "output": "0.5"},
+        "l1": {
+            "class": "QUnit",
+            "in_qunits": '{"0": "l0", "1": null}',
+            "query": "[0.0]",
+        },
+    }
+
+    assert node_link_data(build_network(grouped)) == node_link_data(build_network(flat))
+    assert list(build_network(grouped).edges) == [("l0", "l1")]